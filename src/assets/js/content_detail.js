@@ -3,8 +3,8 @@
  * Description: Dynamic content loading and form handling with vanilla JavaScript
  * Author: Barodybroject Team <team@example.com>
  * Created: 2025-01-15
- * Last Modified: 2025-11-25
- * Version: 2.0.0
+ * Last Modified: 2026-10-19
+ * Version: 2.1.0
  * 
  * Dependencies:
  * - None (vanilla JavaScript, no jQuery)
@@ -27,37 +27,47 @@ function getCookie(name) {
     return cookieValue;
 }
 
+function loadAssistantInstructions(assistantId) {
+    fetch(`/get_assistant_details/${assistantId}/`, {
+        method: 'GET',
+        headers: {
+            'X-Requested-With': 'XMLHttpRequest',
+            'X-CSRFToken': getCookie('csrftoken')
+        }
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error('Network response was not ok');
+        }
+        return response.json();
+    })
+    .then(data => {
+        const instructionsField = document.getElementById('id_instructions');
+        if (data.instructions && instructionsField) {
+            instructionsField.value = data.instructions;
+        }
+    })
+    .catch(error => {
+        console.error('Error fetching instructions:', error);
+        alert('Error fetching instructions');
+    });
+}
+
 document.addEventListener('DOMContentLoaded', function() {
     // Assistant selection handler - migrated from jQuery to Fetch API
     const assistantSelect = document.getElementById('id_assistant');
     if (assistantSelect) {
         assistantSelect.addEventListener('change', function() {
-            const assistantId = this.value;
-            if (assistantId) {
-                fetch(`/get_assistant_details/${assistantId}/`, {
-                    method: 'GET',
-                    headers: {
-                        'X-Requested-With': 'XMLHttpRequest',
-                        'X-CSRFToken': getCookie('csrftoken')
-                    }
-                })
-                .then(response => {
-                    if (!response.ok) {
-                        throw new Error('Network response was not ok');
-                    }
-                    return response.json();
-                })
-                .then(data => {
-                    const instructionsField = document.getElementById('id_instructions');
-                    if (data.instructions && instructionsField) {
-                        instructionsField.value = data.instructions;
-                    }
-                })
-                .catch(error => {
-                    console.error('Error fetching instructions:', error);
-                    alert('Error fetching instructions');
-                });
+            if (this.value) {
+                loadAssistantInstructions(this.value);
             }
         });
+
+        // The form only renders assistant ids and names; fetch the
+        // instructions of the preselected assistant once the page is up.
+        const instructionsField = document.getElementById('id_instructions');
+        if (assistantSelect.value && instructionsField && !instructionsField.value) {
+            loadAssistantInstructions(assistantSelect.value);
+        }
     }
 });
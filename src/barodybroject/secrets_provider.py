@@ -0,0 +1,273 @@
+"""
+File: secrets_provider.py
+Description: Lazily resolved application secrets with a local disk cache
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- boto3: only imported when the AWS Secrets Manager backend is used
+
+Usage: from barodybroject.secrets_provider import get_secrets
+
+Secrets are fetched on the first lookup, not at import. Gunicorn resolves
+them in the master process before forking workers (see gunicorn.conf.py), so
+workers, including ones re-spawned after max_requests, inherit them and never
+call AWS themselves.
+
+Processes that do not share a master (management commands, cron jobs) can
+opt in to a JSON disk cache with SECRETS_CACHE_PATH. The file is written with
+mode 0600 in a directory created with mode 0700. It is only read back if it
+belongs to the current user and has no group or other permission bits, so
+another local user cannot plant secrets (e.g. a SECRET_KEY) in it.
+
+Environment variables:
+- SECRETS_BACKEND: "aws", "file" or "none" (default: "aws" when running in
+  production with AWS_ACCESS_KEY_ID set, otherwise "none")
+- AWS_SECRET_NAME / AWS_REGION_NAME: Secrets Manager location
+- SECRETS_FILE: JSON file read by the "file" backend, a local stand-in for AWS
+- SECRETS_CACHE_PATH: cache file location (default: "", no disk cache); put
+  it in a directory only this user can write to
+- SECRETS_CACHE_TTL: cache lifetime in seconds (default: 300)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SECRET_NAME = "barodybroject/env"
+DEFAULT_REGION_NAME = "us-east-1"
+DEFAULT_CACHE_PATH = ""
+DEFAULT_CACHE_TTL = 300
+
+
+class SecretsBackend:
+    """Source of a flat dict of secrets."""
+
+    def load(self) -> dict:
+        raise NotImplementedError
+
+
+class NullSecretsBackend(SecretsBackend):
+    """Backend used when secrets come from the environment only."""
+
+    def load(self) -> dict:
+        return {}
+
+
+class FileSecretsBackend(SecretsBackend):
+    """Read secrets from a local JSON file, standing in for AWS in development."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> dict:
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            logger.warning(f"Secrets file not found: {self.path}")
+            return {}
+        except json.JSONDecodeError as e:
+            raise ImproperlyConfigured(f"Invalid secrets file {self.path}: {e}") from e
+
+
+class AWSSecretsBackend(SecretsBackend):
+    """Read secrets from AWS Secrets Manager."""
+
+    ERROR_MESSAGES = {
+        "DecryptionFailureException": "Unable to decrypt the secret",
+        "ResourceNotFoundException": "Secret not found in AWS Secrets Manager",
+        "InvalidParameterException": "Invalid parameter provided to AWS Secrets Manager",
+        "InvalidRequestException": "Invalid request to AWS Secrets Manager",
+    }
+
+    def __init__(
+        self,
+        secret_name: str = DEFAULT_SECRET_NAME,
+        region_name: str = DEFAULT_REGION_NAME,
+    ):
+        self.secret_name = secret_name
+        self.region_name = region_name
+
+    def load(self) -> dict:
+        # boto3 is slow to import; only pay for it when AWS is actually used.
+        import boto3
+        from botocore.exceptions import ClientError
+
+        try:
+            session = boto3.session.Session()
+            client = session.client(
+                service_name="secretsmanager", region_name=self.region_name
+            )
+            response = client.get_secret_value(SecretId=self.secret_name)
+            secrets = json.loads(response["SecretString"])
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_msg = self.ERROR_MESSAGES.get(
+                error_code, f"AWS Secrets Manager error: {error_code}"
+            )
+            logger.warning(f"AWS Secrets Manager error: {error_msg}")
+            raise ImproperlyConfigured(
+                f"Failed to load production secrets: {error_msg}"
+            ) from e
+        except Exception as e:
+            logger.error(f"Unexpected error loading secrets: {e}")
+            raise ImproperlyConfigured(f"Failed to load production secrets: {e}") from e
+
+        logger.info(
+            f"Successfully loaded secrets from AWS Secrets Manager: {self.secret_name}"
+        )
+        return secrets
+
+
+class LazySecrets:
+    """
+    dict-like view of a backend's secrets, resolved on first access.
+
+    Args:
+        backend: SecretsBackend to load from
+        cache_path: JSON cache file, or None to keep secrets in memory only
+        ttl: Seconds a cache file stays valid
+    """
+
+    def __init__(
+        self,
+        backend: SecretsBackend,
+        cache_path: str | None = None,
+        ttl: int = DEFAULT_CACHE_TTL,
+    ):
+        self.backend = backend
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self._secrets: dict | None = None
+
+    def get(self, key: str, default=None):
+        return self.resolve().get(key, default)
+
+    def __getitem__(self, key: str):
+        return self.resolve()[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.resolve()
+
+    def resolve(self) -> dict:
+        """
+        Return all secrets, loading them from the cache or backend once.
+
+        A failing backend is logged and treated as empty so that settings fall
+        back to environment variables, as they did before secrets were lazy.
+        """
+        if self._secrets is None:
+            secrets = self._read_cache()
+            if secrets is None:
+                try:
+                    secrets = self.backend.load()
+                except ImproperlyConfigured as e:
+                    logger.error(f"Failed to load secrets: {e}")
+                    secrets = {}
+                else:
+                    self._write_cache(secrets)
+            self._secrets = secrets
+        return self._secrets
+
+    def _read_cache(self) -> dict | None:
+        if not self.cache_path or isinstance(self.backend, NullSecretsBackend):
+            return None
+        try:
+            fd = os.open(self.cache_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        except OSError:
+            return None
+        with os.fdopen(fd) as file:
+            # Checked on the open descriptor, so the file cannot be swapped
+            # between the check and the read.
+            info = os.fstat(file.fileno())
+            if info.st_uid != os.getuid() or info.st_mode & 0o077:
+                logger.warning(
+                    f"Ignoring secrets cache {self.cache_path}: "
+                    "not private to the current user"
+                )
+                return None
+            if time.time() - info.st_mtime > self.ttl:
+                return None
+            try:
+                return json.load(file)
+            except json.JSONDecodeError:
+                return None
+
+    def _write_cache(self, secrets: dict) -> None:
+        if not self.cache_path or isinstance(self.backend, NullSecretsBackend):
+            return
+        directory = os.path.dirname(self.cache_path) or "."
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".secrets-")
+            with os.fdopen(fd, "w") as file:
+                json.dump(secrets, file)
+            # mkstemp creates the file with mode 0600; the rename is atomic.
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write secrets cache {self.cache_path}: {e}")
+
+
+def get_backend(environ=os.environ) -> SecretsBackend:
+    """
+    Build the secrets backend selected by SECRETS_BACKEND.
+
+    Args:
+        environ: Mapping of environment variables
+
+    Returns:
+        SecretsBackend: Configured backend
+    """
+    is_production = environ.get("RUNNING_IN_PRODUCTION", "").lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+    default = "aws" if is_production and environ.get("AWS_ACCESS_KEY_ID") else "none"
+    name = environ.get("SECRETS_BACKEND", default).lower()
+
+    if name == "aws":
+        return AWSSecretsBackend(
+            secret_name=environ.get("AWS_SECRET_NAME", DEFAULT_SECRET_NAME),
+            region_name=environ.get("AWS_REGION_NAME", DEFAULT_REGION_NAME),
+        )
+    if name == "file":
+        return FileSecretsBackend(environ.get("SECRETS_FILE", "secrets.json"))
+    if name == "none":
+        return NullSecretsBackend()
+    raise ImproperlyConfigured(f"Unknown SECRETS_BACKEND: {name}")
+
+
+_secrets: LazySecrets | None = None
+
+
+def get_secrets() -> LazySecrets:
+    """Return the process-wide LazySecrets configured from the environment."""
+    global _secrets
+    if _secrets is None:
+        _secrets = LazySecrets(
+            get_backend(),
+            cache_path=os.environ.get("SECRETS_CACHE_PATH", DEFAULT_CACHE_PATH),
+            ttl=int(os.environ.get("SECRETS_CACHE_TTL", DEFAULT_CACHE_TTL)),
+        )
+    return _secrets
+
+
+def prewarm() -> None:
+    """
+    Resolve secrets in the gunicorn master before workers are forked.
+
+    Every worker, including those re-spawned after max_requests, is forked
+    from the master and inherits the resolved secrets in memory.
+    """
+    get_secrets().resolve()
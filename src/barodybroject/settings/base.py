@@ -9,7 +9,7 @@ Version: 0.2.0
 Dependencies:
 - django: >=4.2
 - django-environ: for environment variable management
-- boto3: for AWS services integration
+- boto3: for AWS Secrets Manager (imported lazily by secrets_provider)
 - psycopg2-binary: for PostgreSQL support
 
 Container Requirements:
@@ -21,19 +21,20 @@ Container Requirements:
 Usage: Configure via environment variables in .env file
 """
 
-import json
-import logging
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
-import boto3
 import environ
-from botocore.exceptions import ClientError
 from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import lazy
+from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 
+from barodybroject.secrets_provider import get_secrets
+
 # ==============================================================================
 # BASE CONFIGURATION
 # ==============================================================================
@@ -75,75 +76,26 @@ MANAGERS = ADMINS
 
 
 # ==============================================================================
-# AWS SECRETS MANAGER CONFIGURATION
+# SECRETS CONFIGURATION
 # ==============================================================================
 
+# Resolved on first lookup (AWS Secrets Manager, a local JSON file or nothing,
+# see SECRETS_BACKEND), so settings import makes no network call when the
+# environment already provides SECRET_KEY.
+secrets = get_secrets()
 
-def get_secret(
-    secret_name: str = "barodybroject/env", region_name: str = "us-east-1"
-) -> Dict:
-    """
-    Retrieve secrets from AWS Secrets Manager with comprehensive error handling
-
-    Args:
-        secret_name: Name of the secret in AWS Secrets Manager
-        region_name: AWS region name
-
-    Returns:
-        Dict containing secrets or empty dict if not available
-    """
-    # Skip AWS Secrets Manager if we have local environment variables or in development without AWS setup
-    if not IS_PRODUCTION or not env.str("AWS_ACCESS_KEY_ID", default=""):
-        return {}
-
-    try:
-        session = boto3.session.Session()
-        client = session.client(service_name="secretsmanager", region_name=region_name)
-
-        response = client.get_secret_value(SecretId=secret_name)
-        secrets = json.loads(response["SecretString"])
-
-        logging.info(
-            f"Successfully loaded secrets from AWS Secrets Manager: {secret_name}"
-        )
-        return secrets
-
-    except ClientError as e:
-        error_code = e.response.get("Error", {}).get("Code", "Unknown")
-        error_messages = {
-            "DecryptionFailureException": "Unable to decrypt the secret",
-            "ResourceNotFoundException": "Secret not found in AWS Secrets Manager",
-            "InvalidParameterException": "Invalid parameter provided to AWS Secrets Manager",
-            "InvalidRequestException": "Invalid request to AWS Secrets Manager",
-        }
-
-        error_msg = error_messages.get(
-            error_code, f"AWS Secrets Manager error: {error_code}"
-        )
-        logging.warning(f"AWS Secrets Manager error: {error_msg}")
-
-        # Only raise in production with proper AWS setup
-        if IS_PRODUCTION and env.str("AWS_ACCESS_KEY_ID", default=""):
-            raise ImproperlyConfigured(
-                f"Failed to load production secrets: {error_msg}"
-            )
-
-        return {}
 
-    except Exception as e:
-        logging.error(f"Unexpected error loading secrets: {e}")
-        # Only raise in production with proper AWS setup
-        if IS_PRODUCTION and env.str("AWS_ACCESS_KEY_ID", default=""):
-            raise ImproperlyConfigured(f"Failed to load production secrets: {e}")
-        return {}
+@functools.cache
+def env_or_secret(name: str, default: str = "") -> str:
+    """Return environment variable ``name``, else the secret of that name."""
+    return env.str(name, default="") or secrets.get(name, "") or default
 
 
-# Load secrets early
-try:
-    secrets = get_secret()
-except Exception as e:
-    logging.error(f"Failed to load secrets: {e}")
-    secrets = {}
+# Settings that are only read while serving requests stay lazy strings, so an
+# unset environment variable does not make settings import fetch secrets.
+lazy_env_or_secret = lazy(env_or_secret, str)
+# Lists whose items must be real strings (CsrfViewMiddleware urlsplit()s them)
+lazy_str_list = lazy(lambda items: [str(item) for item in items], list)
 
 # ==============================================================================
 # SECURITY CONFIGURATION
@@ -154,8 +106,10 @@ SECRET_KEY_FALLBACK = env.str(
     "DJANGO_SECRET_KEY_DEV_FALLBACK",
     default="dev-only-insecure-key-change-in-production",
 )
-SECRET_KEY = secrets.get("DJANGO_SECRET_KEY") or env.str(
-    "SECRET_KEY", default=SECRET_KEY_FALLBACK
+SECRET_KEY = (
+    env.str("SECRET_KEY", default="")
+    or secrets.get("DJANGO_SECRET_KEY")
+    or SECRET_KEY_FALLBACK
 )
 
 if not SECRET_KEY or (IS_PRODUCTION and SECRET_KEY == SECRET_KEY_FALLBACK):
@@ -209,26 +163,17 @@ if DEBUG:
 # ==============================================================================
 
 # Container configuration with proper fallbacks
-CONTAINER_APP_NAME = (
-    env.str("CONTAINER_APP_NAME", default="")
-    or secrets.get("CONTAINER_APP_NAME", "")
-    or "barodybroject"
+CONTAINER_APP_NAME = lazy_env_or_secret("CONTAINER_APP_NAME", "barodybroject")
+CONTAINER_APP_ENV_DNS_SUFFIX = lazy_env_or_secret("CONTAINER_APP_ENV_DNS_SUFFIX", "com")
+AZURE_CONTAINER_REGISTRY_ENDPOINT = lazy_env_or_secret(
+    "AZURE_CONTAINER_REGISTRY_ENDPOINT", "https://barodybroject.azurecr.io"
 )
-CONTAINER_APP_ENV_DNS_SUFFIX = (
-    env.str("CONTAINER_APP_ENV_DNS_SUFFIX", default="")
-    or secrets.get("CONTAINER_APP_ENV_DNS_SUFFIX", "")
-    or "com"
-)
-AZURE_CONTAINER_REGISTRY_ENDPOINT = (
-    env.str("AZURE_CONTAINER_REGISTRY_ENDPOINT", default="")
-    or secrets.get("AZURE_CONTAINER_REGISTRY_ENDPOINT", "")
-    or "https://barodybroject.azurecr.io"
+CONTAINER_APP_HOST = format_lazy(
+    "{}.{}", CONTAINER_APP_NAME, CONTAINER_APP_ENV_DNS_SUFFIX
 )
 
 # GitHub integration
-GITHUB_ISSUE_REPO = env.str("GITHUB_ISSUE_REPO", default="") or secrets.get(
-    "GITHUB_ISSUE_REPO", ""
-)
+GITHUB_ISSUE_REPO = lazy_env_or_secret("GITHUB_ISSUE_REPO")
 
 if not IS_PRODUCTION:
     # Development environment settings
@@ -236,19 +181,23 @@ if not IS_PRODUCTION:
         "localhost",
         "127.0.0.1",
         "0.0.0.0",
-        f"{CONTAINER_APP_NAME}.{CONTAINER_APP_ENV_DNS_SUFFIX}",
+        CONTAINER_APP_HOST,
         "barodybroject.com",
     ]
 
-    CSRF_TRUSTED_ORIGINS = [
-        "http://localhost:8000",
-        "http://localhost:8001",
-        "http://127.0.0.1:8000",
-        "http://127.0.0.1:8001",
-        f"https://{CONTAINER_APP_NAME}.{CONTAINER_APP_ENV_DNS_SUFFIX}",
-        f"{AZURE_CONTAINER_REGISTRY_ENDPOINT}.{CONTAINER_APP_ENV_DNS_SUFFIX}",
-        "https://barodybroject.com",
-    ]
+    CSRF_TRUSTED_ORIGINS = lazy_str_list(
+        [
+            "http://localhost:8000",
+            "http://localhost:8001",
+            "http://127.0.0.1:8000",
+            "http://127.0.0.1:8001",
+            format_lazy("https://{}", CONTAINER_APP_HOST),
+            format_lazy(
+                "{}.{}", AZURE_CONTAINER_REGISTRY_ENDPOINT, CONTAINER_APP_ENV_DNS_SUFFIX
+            ),
+            "https://barodybroject.com",
+        ]
+    )
 
     # Development-specific settings
     INTERNAL_IPS = ["127.0.0.1", "localhost"]
@@ -256,16 +205,18 @@ if not IS_PRODUCTION:
 else:
     # Production environment settings
     ALLOWED_HOSTS = [
-        f"{CONTAINER_APP_NAME}.{CONTAINER_APP_ENV_DNS_SUFFIX}",
+        CONTAINER_APP_HOST,
         "barodybroject.com",
         "www.barodybroject.com",
     ]
 
-    CSRF_TRUSTED_ORIGINS = [
-        f"https://{CONTAINER_APP_NAME}.{CONTAINER_APP_ENV_DNS_SUFFIX}",
-        "https://barodybroject.com",
-        "https://www.barodybroject.com",
-    ]
+    CSRF_TRUSTED_ORIGINS = lazy_str_list(
+        [
+            format_lazy("https://{}", CONTAINER_APP_HOST),
+            "https://barodybroject.com",
+            "https://www.barodybroject.com",
+        ]
+    )
 
 # Additional allowed hosts from environment
 additional_hosts = env.str("ALLOWED_HOSTS", default="").split(",")
@@ -331,12 +282,15 @@ INSTALLED_APPS = DJANGO_APPS + AUTH_APPS + THIRD_PARTY_APPS + LOCAL_APPS + DEV_A
 
 # Middleware configuration with environment-specific additions
 MIDDLEWARE = [
+    # First, so request latency and query counts cover all other middleware
+    "parodynews.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "setup.middleware.InstallationMiddleware",  # Installation wizard middleware
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # AuthenticationMiddleware that caches request.user (invalidated on save)
+    "parodynews.middleware.CachedAuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
@@ -366,7 +320,7 @@ TEMPLATES = [
             BASE_DIR / "parodynews" / "templates",
             BASE_DIR / "templates",  # Global templates directory
         ],
-        "APP_DIRS": not IS_PRODUCTION,
+        "APP_DIRS": False,  # app_directories.Loader is listed in "loaders" below
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -384,16 +338,18 @@ TEMPLATES = [
     },
 ]
 
-if IS_PRODUCTION:
-    TEMPLATES[0]["OPTIONS"]["loaders"] = [
-        (
-            "django.template.loaders.cached.Loader",
-            [
-                "django.template.loaders.filesystem.Loader",
-                "django.template.loaders.app_directories.Loader",
-            ],
-        )
-    ]
+# Compiled templates are cached in every environment. Under runserver the
+# autoreloader resets the cache when a template file changes, and gunicorn
+# pre-compiles all templates before forking (barodybroject.warmup).
+TEMPLATES[0]["OPTIONS"]["loaders"] = [
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    )
+]
 
 WSGI_APPLICATION = "barodybroject.wsgi.application"
 
@@ -612,7 +568,23 @@ logs_dir.mkdir(exist_ok=True)
 # ==============================================================================
 
 # Session configuration
-SESSION_ENGINE = "django.contrib.sessions.backends.db"
+# cached_db reads sessions from the cache and only falls back to the database
+# on a miss; anonymous visitors get no session row until something is stored.
+SESSION_ENGINE = env.str(
+    "SESSION_ENGINE", default="django.contrib.sessions.backends.cached_db"
+)
+# Default lifetime of pages cached by parodynews.page_cache.cache_page_policy;
+# pages are invalidated by tag on model saves well before this expires.
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT", default=600)
+# Seconds an authenticated user is served from the cache (parodynews.middleware)
+AUTH_USER_CACHE_TIMEOUT = env.int("AUTH_USER_CACHE_TIMEOUT", default=300)
+# Seconds the OpenAI model choices of AssistantForm are cached; refreshed
+# immediately when fetch_models or the admin changes OpenAIModel rows.
+OPENAI_MODEL_CHOICES_TIMEOUT = env.int("OPENAI_MODEL_CHOICES_TIMEOUT", default=3600)
+# Seconds a FieldDefaults index is shared through the cache. Each index is
+# keyed by the FieldDefaults generation, so this only bounds how long the
+# indexes of past generations linger.
+FIELD_DEFAULTS_CACHE_TIMEOUT = env.int("FIELD_DEFAULTS_CACHE_TIMEOUT", default=3600)
 SESSION_COOKIE_AGE = 86400 * 7  # 1 week
 SESSION_SAVE_EVERY_REQUEST = False
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
@@ -626,7 +598,7 @@ if IS_PRODUCTION:
 
         CACHES = {
             "default": {
-                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "BACKEND": "parodynews.cache_backends.RedisCache",
                 "LOCATION": env.str("REDIS_URL", default="redis://127.0.0.1:6379/1"),
                 "KEY_PREFIX": "barodybroject",
                 "TIMEOUT": 300,  # 5 minutes default
@@ -634,19 +606,11 @@ if IS_PRODUCTION:
             }
         }
 
-        # Enable cache middleware for production
-        MIDDLEWARE.insert(1, "django.middleware.cache.UpdateCacheMiddleware")
-        MIDDLEWARE.append("django.middleware.cache.FetchFromCacheMiddleware")
-
-        CACHE_MIDDLEWARE_ALIAS = "default"
-        CACHE_MIDDLEWARE_SECONDS = 600  # 10 minutes
-        CACHE_MIDDLEWARE_KEY_PREFIX = "barodybroject"
-
     except ImportError:
         # Fallback to database cache if Redis is not available
         CACHES = {
             "default": {
-                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "BACKEND": "parodynews.cache_backends.DatabaseCache",
                 "LOCATION": "cache_table",
                 "TIMEOUT": 300,
                 "OPTIONS": {
@@ -660,7 +624,7 @@ else:
     # Development caching
     CACHES = {
         "default": {
-            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "BACKEND": "parodynews.cache_backends.LocMemCache",
             "LOCATION": "barodybroject-dev-cache",
             "TIMEOUT": 60,  # 1 minute for development
             "OPTIONS": {
@@ -974,6 +938,50 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_RATES": {"anon": "100/day", "user": "1000/day"},
 }
 
+# OpenAI rate limiting (parodynews.utils.ratelimit). Buckets live in the
+# shared cache, so all workers draw from one budget per model; the limits
+# below only seed a bucket until a response reports the account's real ones.
+OPENAI_RATE_LIMITS = {
+    "default": {
+        "requests": env.int("OPENAI_DEFAULT_RPM", default=500),
+        "tokens": env.int("OPENAI_DEFAULT_TPM", default=200000),
+    },
+}
+# Longest a call waits for rate-limit capacity before giving up (seconds)
+OPENAI_RATE_LIMIT_MAX_WAIT = env.int("OPENAI_RATE_LIMIT_MAX_WAIT", default=60)
+# Retries after 429, 5xx and connection errors, with jittered backoff
+OPENAI_MAX_RETRIES = env.int("OPENAI_MAX_RETRIES", default=4)
+# Per-attempt timeout; the SDK default of ten minutes would tie up a worker
+OPENAI_TIMEOUT = env.int("OPENAI_TIMEOUT", default=60)
+# Circuit breaker (parodynews.utils.resilience): after this many consecutive
+# failures all workers fail fast until a probe call succeeds again
+OPENAI_CIRCUIT_FAILURE_THRESHOLD = env.int(
+    "OPENAI_CIRCUIT_FAILURE_THRESHOLD", default=5
+)
+OPENAI_CIRCUIT_RESET_TIMEOUT = env.int("OPENAI_CIRCUIT_RESET_TIMEOUT", default=30)
+# Hedge slow chat completions with a second request once the first exceeds
+# this percentile of recent latencies (costs extra tokens, so opt-in)
+OPENAI_HEDGE_REQUESTS = env.bool("OPENAI_HEDGE_REQUESTS", default=False)
+OPENAI_HEDGE_PERCENTILE = env.int("OPENAI_HEDGE_PERCENTILE", default=95)
+# US dollars per million tokens, by model name prefix, for the estimated cost
+# in /metrics and on each ContentItem (parodynews.utils.instrumentation)
+OPENAI_MODEL_PRICES = {
+    "gpt-4o-mini": {"prompt": 0.15, "completion": 0.60},
+    "gpt-4o": {"prompt": 2.50, "completion": 10.00},
+    "gpt-4-turbo": {"prompt": 10.00, "completion": 30.00},
+    "gpt-3.5-turbo": {"prompt": 0.50, "completion": 1.50},
+}
+# Bearer token required to scrape /metrics. When empty, only clients in
+# METRICS_ALLOWED_NETWORKS may scrape; never list a reverse proxy's address
+# there, since every request it forwards would then be allowed.
+METRICS_TOKEN = lazy_env_or_secret("METRICS_TOKEN")
+METRICS_ALLOWED_NETWORKS = env.list(
+    "METRICS_ALLOWED_NETWORKS", default=["127.0.0.0/8", "::1/128"]
+)
+# Seconds between a worker's metrics snapshots when METRICS_MULTIPROC_DIR is
+# set (gunicorn sets it), i.e. how stale other workers' numbers can be
+METRICS_FLUSH_INTERVAL = env.float("METRICS_FLUSH_INTERVAL", default=1.0)
+
 # ==============================================================================
 # PERFORMANCE AND OPTIMIZATION
 # ==============================================================================
@@ -987,17 +995,6 @@ if IS_PRODUCTION:
     COMPRESS_ENABLED = True
     COMPRESS_OFFLINE = True
 
-    # Template caching
-    TEMPLATE_LOADERS = [
-        (
-            "django.template.loaders.cached.Loader",
-            [
-                "django.template.loaders.filesystem.Loader",
-                "django.template.loaders.app_directories.Loader",
-            ],
-        ),
-    ]
-
 # Debug toolbar configuration (development only)
 if DEBUG and env.bool("ENABLE_DEBUG_TOOLBAR", default=False):
     try:
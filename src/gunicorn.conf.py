@@ -1,11 +1,149 @@
+"""
+Gunicorn production profile for barodybroject.
+
+The app is preloaded in the master, warmed up (URL resolvers, schemas,
+templates) and then forked, so workers share that memory copy-on-write and
+serve their first request warm.
+
+Sizing is derived from measurements rather than core count alone:
+- GUNICORN_IO_WAIT: fraction of request time spent waiting on I/O (OpenAI,
+  Postgres), e.g. from APM traces; sets threads per gthread worker
+- GUNICORN_WORKER_MEMORY_MB: measured RSS of one warm worker
+- GUNICORN_MEMORY_LIMIT_MB: memory available to the container (read from
+  the cgroup limit when unset)
+
+Metrics: workers write snapshots to METRICS_MULTIPROC_DIR so that /metrics,
+answered by any one worker, reports all of them; see parodynews.metrics. By
+default each server gets a new private directory (mkdtemp, mode 0700) that is
+removed on exit; a directory given explicitly must be owned by this user with
+mode 0700 and is emptied at startup. The hooks below
+archive the totals of exited workers and export the worker count and exits.
+
+Environment overrides: GUNICORN_WORKERS, GUNICORN_THREADS, GUNICORN_BIND,
+GUNICORN_TIMEOUT, GUNICORN_PRELOAD, and GUNICORN_WORKER_CLASS ("gthread" for
+the WSGI app, "uvicorn" for the ASGI app; the latter needs the "asgi" extra).
+"""
+
 import multiprocessing
+import os
+import shutil
+import tempfile
+
+
+def _memory_limit_mb():
+    """Return the cgroup memory limit, or the physical memory, in MB."""
+    for path in (
+        "/sys/fs/cgroup/memory.max",
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+    ):
+        try:
+            with open(path) as file:
+                value = file.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 1 << 60:
+            return int(value) // (1024 * 1024)
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+
+
+cpu_count = multiprocessing.cpu_count()
+io_wait = min(float(os.environ.get("GUNICORN_IO_WAIT", "0.75")), 0.95)
+worker_memory_mb = int(os.environ.get("GUNICORN_WORKER_MEMORY_MB", "200"))
+memory_limit_mb = int(os.environ.get("GUNICORN_MEMORY_LIMIT_MB") or _memory_limit_mb())
+
+# One process per core keeps the CPU busy; more only add memory. Leave 20% of
+# the memory limit for the master, page cache and request spikes.
+workers = int(
+    os.environ.get("GUNICORN_WORKERS")
+    or max(1, min(cpu_count + 1, int(memory_limit_mb * 0.8) // worker_memory_mb))
+)
+
+worker_kind = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+if worker_kind == "uvicorn":
+    worker_class = "uvicorn_worker.UvicornWorker"
+    wsgi_app = "barodybroject.asgi:application"
+    threads = 1
+else:
+    worker_class = "gthread"
+    wsgi_app = "barodybroject.wsgi:application"
+    # A thread spends io_wait of its time blocked, so 1 / (1 - io_wait)
+    # threads keep one core busy.
+    threads = int(
+        os.environ.get("GUNICORN_THREADS") or min(32, round(1 / (1 - io_wait)))
+    )
+
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() in ("1", "true")
 
 max_requests = 1000
 max_requests_jitter = 50
 log_file = "-"
-bind = "0.0.0.0:8080"
-workers = (multiprocessing.cpu_count() * 2) + 1
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8080")
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "600"))
+
+# Inherited by the workers; must be set before the app is loaded.
+created_metrics_dir = None
+if not os.environ.get("METRICS_MULTIPROC_DIR"):
+    created_metrics_dir = tempfile.mkdtemp(prefix="barodybroject-metrics-")
+    os.environ["METRICS_MULTIPROC_DIR"] = created_metrics_dir
+
+
+def on_starting(server):
+    # Fetch secrets once in the master so forked workers inherit them instead
+    # of each calling AWS Secrets Manager during settings import. With
+    # preload_app the settings import has already resolved them here.
+    from barodybroject.secrets_provider import prewarm
+
+    prewarm()
+
+    from parodynews.metrics import clear_multiprocess_dir
+
+    clear_multiprocess_dir()
+
+
+def on_exit(server):
+    if created_metrics_dir:
+        shutil.rmtree(created_metrics_dir, ignore_errors=True)
+
+
+def when_ready(server):
+    # Runs in the master right before the first workers are forked.
+    if preload_app:
+        from barodybroject.warmup import warm_up
+
+        warm_up()
+    server.log.info(
+        f"Serving {wsgi_app} with {workers} {worker_class} workers x {threads} threads"
+    )
+
+
+def post_worker_init(worker):
+    # Without preload each worker loads the app itself; compile its templates
+    # now rather than on the first requests.
+    if not preload_app:
+        from barodybroject.warmup import warm_templates
+
+        warm_templates()
+
+
+def nworkers_changed(server, new_value, old_value):
+    from parodynews import metrics
+
+    metrics.GUNICORN_WORKERS.set(new_value)
+    metrics.write_snapshot()
+
+
+def worker_exit(server, worker):
+    # Runs in the worker: save what it counted since its last snapshot.
+    from parodynews.metrics import write_snapshot
+
+    write_snapshot()
+
 
-threads = workers
+def child_exit(server, worker):
+    # Runs in the master once the worker is gone.
+    from parodynews import metrics
 
-timeout = 600
+    metrics.mark_process_dead(worker.pid)
+    metrics.GUNICORN_WORKER_EXITS.inc()
+    metrics.write_snapshot()
@@ -33,7 +33,12 @@ from .resources import (
     OpenAIModelResource,
     PostResource,
 )
-from .utils import delete_assistant, get_openai_client
+from .utils import (
+    bulk_delete_assistants,
+    delete_assistant,
+    get_openai_client,
+    sync_assistants,
+)
 
 # =============================================================================
 # CONFIGURATION MODELS
@@ -104,51 +109,12 @@ class AssistantAdmin(ImportExportModelAdmin):
 
     def fetch_openai_assistants(self, request, queryset):
         try:
-            client = get_openai_client()
-
-            # Fetch assistants from OpenAI API
-            response = client.beta.assistants.list(limit="100")
-
-            for (
-                assistant_data
-            ) in (
-                response.data
-            ):  # Changed from response.get('data', []) to response.data
-                assistant_id = (
-                    assistant_data.id
-                )  # Changed from assistant_data['id'] to assistant_data.id
-                # Update or create Assistant instance
-                assistant_model, created = Assistant.objects.update_or_create(
-                    id=assistant_id,
-                    defaults={
-                        "name": assistant_data.name or "",
-                        "description": assistant_data.description or "",
-                        "instructions": assistant_data.instructions or "",
-                        # Set the model field if the model exists
-                        "model": OpenAIModel.objects.get_or_create(
-                            model_id=assistant_data.model or ""
-                        )[0],
-                        # Add other fields as needed
-                    },
-                )
-                # Handle json_schema if present
-                if hasattr(assistant_data, "response_format") and hasattr(
-                    assistant_data.response_format, "json_schema"
-                ):
-                    schema_data = assistant_data.response_format.json_schema
-                    json_schema, _ = JSONSchema.objects.update_or_create(
-                        name=schema_data.name or "",
-                        defaults={
-                            "description": schema_data.description or "",
-                            "schema": schema_data.schema or {},
-                        },
-                    )
-                    assistant_model.json_schema = json_schema
-                    assistant_model.save()
-
+            result = sync_assistants(get_openai_client())
             self.message_user(
                 request,
-                "Successfully synchronized assistants from OpenAI.",
+                f"Successfully synchronized {result.fetched} assistants from OpenAI "
+                f"({result.created} created, {result.updated} updated, "
+                f"{result.unchanged} unchanged).",
                 messages.SUCCESS,
             )
         except Exception as e:
@@ -175,21 +141,29 @@ class AssistantAdmin(ImportExportModelAdmin):
             )
 
     def delete_queryset(self, request, queryset):
-        errors = False
-        client = get_openai_client()
-        for obj in queryset:
-            try:
-                delete_assistant(client, obj.id)
-            except Exception as e:
-                errors = True
-                self.message_user(
-                    request,
-                    f"Error deleting assistant '{obj.name}': {e}",
-                    messages.ERROR,
-                )
-        if not errors:
+        try:
+            client = get_openai_client()
+        except Exception as e:
             self.message_user(
-                request, "Selected assistants deleted successfully.", messages.SUCCESS
+                request, f"Error deleting assistants: {e}", messages.ERROR
+            )
+            return
+
+        names = dict(queryset.values_list("id", "name"))
+        outcomes = bulk_delete_assistants(client, names)
+        failed = [outcome for outcome in outcomes if not outcome.deleted]
+        for outcome in failed:
+            self.message_user(
+                request,
+                f"Error deleting assistant '{names[outcome.object_id]}': {outcome.error}",
+                messages.ERROR,
+            )
+        deleted = len(outcomes) - len(failed)
+        if deleted:
+            self.message_user(
+                request,
+                f"Deleted {deleted} of {len(outcomes)} selected assistants.",
+                messages.SUCCESS if not failed else messages.WARNING,
             )
 
 
@@ -5,6 +5,11 @@ class ParodynewsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "parodynews"
 
+    def ready(self):
+        from . import signals
+
+        signals.connect_model_receivers(self)
+
 
 INSTALLED_APPS = [
     # Other apps
@@ -0,0 +1,94 @@
+"""
+File: cache_backends.py
+Description: Django cache backends that count hits and misses per cache alias
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage:
+Use 'parodynews.cache_backends.RedisCache' (or DatabaseCache, LocMemCache)
+as a CACHES BACKEND in place of the django.core.cache.backends class.
+
+Reads (get, get_many and get_or_set, which is built on them) are counted in
+parodynews_cache_requests_total{alias, result}; the hit ratio per alias is
+hits / (hits + misses). Only the outermost read of a call counts, so a
+DatabaseCache.get() implemented via get_many() is one lookup, not two.
+"""
+
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends import db, locmem, redis
+from django.utils.functional import cached_property
+
+from .metrics import Counter
+
+CACHE_REQUESTS = Counter(
+    "parodynews_cache_requests_total",
+    "Cache key lookups by alias and result (hit or miss)",
+    ["alias", "result"],
+)
+
+_MISSING = object()
+_reading = threading.local()
+
+
+class InstrumentedCacheMixin:
+    """Count the hits and misses of a cache backend's reads."""
+
+    @cached_property
+    def metrics_alias(self):
+        # Backends are not told their alias; find the one this instance serves.
+        for alias in settings.CACHES:
+            if caches[alias] is self:
+                return alias
+        return "unknown"
+
+    def _record(self, hits, misses):
+        if hits:
+            CACHE_REQUESTS.inc(hits, alias=self.metrics_alias, result="hit")
+        if misses:
+            CACHE_REQUESTS.inc(misses, alias=self.metrics_alias, result="miss")
+
+    def get(self, key, default=None, version=None):
+        if getattr(_reading, "active", False):
+            return super().get(key, default, version)
+        _reading.active = True
+        try:
+            value = super().get(key, _MISSING, version)
+        finally:
+            _reading.active = False
+        if value is _MISSING:
+            self._record(0, 1)
+            return default
+        self._record(1, 0)
+        return value
+
+    def get_many(self, keys, version=None):
+        if getattr(_reading, "active", False):
+            return super().get_many(keys, version)
+        keys = list(keys)
+        _reading.active = True
+        try:
+            values = super().get_many(keys, version)
+        finally:
+            _reading.active = False
+        self._record(len(values), len(keys) - len(values))
+        return values
+
+
+class DatabaseCache(InstrumentedCacheMixin, db.DatabaseCache):
+    pass
+
+
+class LocMemCache(InstrumentedCacheMixin, locmem.LocMemCache):
+    pass
+
+
+class RedisCache(InstrumentedCacheMixin, redis.RedisCache):
+    pass
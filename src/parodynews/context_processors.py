@@ -3,29 +3,62 @@ import os
 from pathlib import Path
 
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
 
 from .models import PoweredBy
+from .utils.fragments import get_model_generation
 
+# Process-local caches, replaced as a whole so readers never see a half update.
+# PoweredBy rows are tagged with the model's shared cache generation, which
+# every save/delete bumps (see parodynews.signals), so all workers notice.
+_powered_by_cache = (None, [])
+# Issue templates are tagged with the directory's mtime.
+_issue_templates_cache = (None, [])
 
-def footer_items(request):
-    return {"powered_by": PoweredBy.objects.all()}
 
+def get_powered_by():
+    """Return the PoweredBy rows, querying only after one has changed."""
+    global _powered_by_cache
+    generation = get_model_generation(PoweredBy)
+    cached_generation, items = _powered_by_cache
+    if cached_generation != generation:
+        items = list(PoweredBy.objects.all())
+        _powered_by_cache = (generation, items)
+    return items
 
-def issue_templates(request):
-    """
-    Provides a list of issue template filenames and human-readable names,
-    and the GitHub repo setting, for populating the report issue dropdown.
-    """
-    repo = getattr(settings, "GITHUB_ISSUE_REPO", "")
-    templates = []
+
+def get_issue_templates():
+    """Return the issue template choices, rescanning only when the folder changes."""
+    global _issue_templates_cache
     # .github/ISSUE_TEMPLATE folder is one level above BASE_DIR
     template_dir = Path(settings.BASE_DIR).parent / ".github" / "ISSUE_TEMPLATE"
-    if template_dir.exists():
+    try:
+        mtime = template_dir.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    cached_mtime, templates = _issue_templates_cache
+    if cached_mtime != mtime:
+        templates = []
         for fname in sorted(os.listdir(template_dir)):
             if fname.endswith(".md"):
                 label = fname[:-3].replace("_", " ").replace("-", " ").title()
                 templates.append({"filename": fname, "name": label})
+        _issue_templates_cache = (mtime, templates)
+    return templates
+
+
+def footer_items(request):
+    # Lazy, so pages that do not render the footer pay nothing.
+    return {"powered_by": SimpleLazyObject(get_powered_by)}
+
+
+def issue_templates(request):
+    """
+    Provides a list of issue template filenames and human-readable names,
+    and the GitHub repo setting, for populating the report issue dropdown.
+    """
     return {
-        "issue_templates": templates,
-        "github_issue_repo": repo,
+        "issue_templates": SimpleLazyObject(get_issue_templates),
+        "github_issue_repo": getattr(settings, "GITHUB_ISSUE_REPO", ""),
     }
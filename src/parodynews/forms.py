@@ -8,7 +8,6 @@ import re
 
 from django import forms
 from django.core.exceptions import ValidationError
-from django.db.models import Count
 from django.forms import inlineformset_factory
 from django_json_widget.widgets import JSONEditorWidget
 
@@ -20,10 +19,16 @@ from .models import (  # AI models; Content models; Publishing models; Conversat
     ContentDetail,
     ContentItem,
     JSONSchema,
+    OpenAIModel,
     Post,
     PostFrontMatter,
     Thread,
 )
+from .utils.assistants import (
+    get_assistant_choices,
+    get_model_choices,
+    get_random_assistant_id,
+)
 
 # TODO: Add additional fields to Post frontmatter to handle dynamic fields (i.e., based on JSON schema)
 
@@ -43,13 +48,16 @@ class ContentDetailForm(DefaultFormFieldsMixin, forms.ModelForm):
 
 
 class ContentItemForm(DefaultFormFieldsMixin, forms.ModelForm):
-    # Define the form fields for the assistant to be displayed in the form
+    # Define the form fields for the assistant to be displayed in the form.
+    # The queryset is only evaluated when a submitted id is validated; the
+    # select box is filled from the cached (id, name) choices below.
     assistant = forms.ModelChoiceField(
-        queryset=Assistant.objects.all(),
+        queryset=Assistant.objects.only("id", "name"),
         label="Assistant Name",
     )
 
-    # Define the form field for the instructions to be displayed in the form
+    # Filled in the browser from the get_assistant_details endpoint
+    # (js/content_detail.js) so that instructions are not loaded here.
     instructions = forms.CharField(
         widget=forms.Textarea(attrs={"readonly": "readonly"}),
         required=False,
@@ -67,28 +75,13 @@ class ContentItemForm(DefaultFormFieldsMixin, forms.ModelForm):
     # Set the assistant field choices to the names of all Assistant objects. Needed for AJAX request
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["assistant"].widget.choices = [
-            (assistant.id, assistant.name) for assistant in Assistant.objects.all()
-        ]
+        self.fields["assistant"].widget.choices = get_assistant_choices()
 
         self.fields["content_text"].required = False  # Make content field optional
 
         # Only set the assistant field to a random record if the form is new
         if not self.initial.get("assistant"):
-            random_assistant = (
-                Assistant.objects.annotate(num=Count("id")).order_by("?").first()
-            )
-            if random_assistant:
-                self.fields["assistant"].initial = random_assistant.id
-                self.fields["instructions"].initial = random_assistant.instructions
-        else:
-            # Populate the instructions field based on the selected assistant
-            assistant_id = self.initial.get("assistant")
-            try:
-                assistant = Assistant.objects.get(id=assistant_id)
-                self.fields["instructions"].initial = assistant.instructions
-            except Assistant.DoesNotExist:
-                self.fields["instructions"].initial = ""
+            self.fields["assistant"].initial = get_random_assistant_id()
 
 
 # =============================================================================
@@ -112,6 +105,14 @@ class AssistantForm(forms.ModelForm):
     # Set the assistant field choices to the names of all Assistant objects. Needed for AJAX request
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Options come from the cached model list; the queryset only runs to
+        # validate a submitted choice.
+        model_field = self.fields["model"]
+        model_field.queryset = OpenAIModel.objects.only("id", "model_id")
+        model_field.widget.choices = [("", model_field.empty_label)] + list(
+            get_model_choices()
+        )
+
         if self.instance.pk:
             # self.fields['assistant_group_memberships'].queryset = memberships
             self.fields["assistant_group_memberships"].queryset = (
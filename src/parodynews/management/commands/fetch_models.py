@@ -1,21 +1,41 @@
-# parodynews/management/commands/fetch_models.py
+"""
+File: fetch_models.py
+Description: Management command upserting the OpenAI model catalogue into OpenAIModel
+Author: Barodybroject Team <team@example.com>
+Created: 2024-11-29
+Last Modified: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django: >=5.1
+- openai: >=1.57.0
+
+Usage:
+  python manage.py fetch_models
+  python manage.py fetch_models --prune
+"""
+
 from django.core.management.base import BaseCommand
-from openai import OpenAI
 
-from parodynews.models import OpenAIModel
+from parodynews.utils.config import get_openai_client
+from parodynews.utils.sync import sync_models
 
 
 class Command(BaseCommand):
     help = "Fetch models from OpenAI API and update choices"
 
-    def handle(self, *args, **kwargs):
-        client = OpenAI()
-        models = client.models.list()
-        model_ids = [model.id for model in models]
-
-        for model_id in model_ids:
-            OpenAIModel.objects.update_or_create(model_id=model_id)
-
-        self.stdout.write(
-            self.style.SUCCESS("Successfully fetched and saved model choices")
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete models no longer offered by OpenAI (unless an assistant uses them)",
         )
+
+    def handle(self, *args, **options):
+        result = sync_models(get_openai_client(), prune=options["prune"])
+        message = f"Successfully fetched and saved {result.fetched} model choices"
+        if options["prune"]:
+            message += f", pruned {result.pruned}"
+            if result.kept:
+                message += f" (kept {result.kept} retired models still in use)"
+        self.stdout.write(self.style.SUCCESS(message))
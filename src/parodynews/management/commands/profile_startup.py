@@ -0,0 +1,206 @@
+"""
+File: profile_startup.py
+Description: Management command profiling cold-start cost (imports, settings, app ready, URLconf)
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django: >=5.1
+
+Usage:
+  python manage.py profile_startup
+
+  # Keep a JSON artifact and fail if startup regressed by more than 20%
+  python manage.py profile_startup --output startup.json --compare baseline.json --threshold 20
+
+The measurement runs in a fresh interpreter started with ``-X importtime`` so
+that nothing is already imported or configured by this process.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in the child interpreter; prints one JSON object on the last line.
+PROBE = """
+import json, time
+
+timings = {"ready": {}}
+start = time.perf_counter()
+
+t = time.perf_counter()
+from django.conf import settings
+settings.INSTALLED_APPS
+timings["settings"] = time.perf_counter() - t
+
+from django.apps import AppConfig
+
+_create = AppConfig.create.__func__
+
+def create(cls, entry):
+    config = _create(cls, entry)
+    ready = config.ready
+
+    def timed_ready():
+        t = time.perf_counter()
+        ready()
+        timings["ready"][config.label] = time.perf_counter() - t
+
+    config.ready = timed_ready
+    return config
+
+AppConfig.create = classmethod(create)
+
+t = time.perf_counter()
+import django
+django.setup()
+timings["apps"] = time.perf_counter() - t
+
+t = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+timings["urls"] = time.perf_counter() - t
+
+timings["total"] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Parse ``-X importtime`` output.
+
+    Args:
+        stderr: Text written by the child interpreter
+
+    Returns:
+        list: Dicts with module, self_us and cumulative_us for each import
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = [part.strip() for part in line[len("import time:") :].split("|")]
+        if len(fields) != 3 or not fields[0].isdigit():
+            continue  # Header row
+        imports.append(
+            {
+                "module": fields[2],
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+            }
+        )
+    return imports
+
+
+def run_probe(settings_module):
+    """
+    Profile a cold start of the project in a child interpreter.
+
+    Args:
+        settings_module: DJANGO_SETTINGS_MODULE for the child
+
+    Returns:
+        dict: Phase timings in seconds plus the parsed import list
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise CommandError(f"Startup probe failed:\n{result.stderr[-2000:]}")
+
+    profile = json.loads(result.stdout.strip().splitlines()[-1])
+    profile["imports"] = parse_importtime(result.stderr)
+    profile["settings_module"] = settings_module
+    return profile
+
+
+class Command(BaseCommand):
+    help = "Profile cold-start time: module imports, settings, AppConfig.ready() and URLconf loading"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=25,
+            help="Number of slowest imports to list (default: 25)",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Write the full profile to this JSON file",
+        )
+        parser.add_argument(
+            "--compare",
+            default=None,
+            help="JSON file from a previous run to compare the total against",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=20.0,
+            help="Allowed total startup regression in percent when comparing (default: 20)",
+        )
+
+    def handle(self, *args, **options):
+        profile = run_probe(settings.SETTINGS_MODULE)
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Startup phases"))
+        for phase in ("settings", "apps", "urls", "total"):
+            self.stdout.write(f"  {phase:<10} {profile[phase] * 1000:9.1f} ms")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("AppConfig.ready()"))
+        for label, seconds in sorted(
+            profile["ready"].items(), key=lambda item: item[1], reverse=True
+        ):
+            self.stdout.write(f"  {label:<30} {seconds * 1000:9.1f} ms")
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"Slowest imports (top {options['top']}, cumulative)"
+            )
+        )
+        slowest = sorted(
+            profile["imports"], key=lambda item: item["cumulative_us"], reverse=True
+        )
+        for item in slowest[: options["top"]]:
+            self.stdout.write(
+                f"  {item['cumulative_us'] / 1000:9.1f} ms "
+                f"(self {item['self_us'] / 1000:7.1f} ms)  {item['module']}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(profile, file, indent=2)
+            self.stdout.write(f"Profile written to {options['output']}")
+
+        if options["compare"]:
+            self.compare(profile, options["compare"], options["threshold"])
+
+    def compare(self, profile, baseline_path, threshold):
+        """Fail when total startup time grew by more than ``threshold`` percent."""
+        try:
+            with open(baseline_path) as file:
+                baseline = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            raise CommandError(f"Could not read baseline {baseline_path}: {e}") from e
+
+        change = (profile["total"] - baseline["total"]) / baseline["total"] * 100
+        message = (
+            f"Total startup {profile['total'] * 1000:.1f} ms vs baseline "
+            f"{baseline['total'] * 1000:.1f} ms ({change:+.1f}%)"
+        )
+        if change > threshold:
+            raise CommandError(f"{message} exceeds the {threshold:g}% threshold")
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,53 @@
+"""
+File: sync_assistants.py
+Description: Management command synchronising local assistants with the OpenAI account
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django: >=5.1
+- openai: >=1.57.0
+
+Usage:
+  python manage.py sync_assistants
+  python manage.py sync_assistants --dry-run --page-size 50
+"""
+
+from django.core.management.base import BaseCommand
+
+from parodynews.utils.config import get_openai_client
+from parodynews.utils.sync import DEFAULT_PAGE_SIZE, sync_assistants
+
+
+class Command(BaseCommand):
+    help = "Page through all OpenAI assistants and bulk-upsert new or changed ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=DEFAULT_PAGE_SIZE,
+            help=f"Assistants per API request, 1-100 (default: {DEFAULT_PAGE_SIZE})",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing to the database",
+        )
+
+    def handle(self, *args, **options):
+        result = sync_assistants(
+            get_openai_client(),
+            page_size=options["page_size"],
+            dry_run=options["dry_run"],
+        )
+        prefix = "Would sync" if options["dry_run"] else "Synced"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {result.fetched} assistants in {result.pages} pages: "
+                f"{result.created} created, {result.updated} updated, "
+                f"{result.unchanged} unchanged"
+            )
+        )
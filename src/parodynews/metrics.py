@@ -0,0 +1,462 @@
+"""
+File: metrics.py
+Description: Counters, gauges and histograms exported in Prometheus text format
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- None (standard library only, so gunicorn hooks can use it before Django
+  is set up)
+
+Usage:
+    from parodynews.metrics import Counter, Histogram, render_metrics
+
+    REQUESTS = Counter("parodynews_things_total", "Things done", ["kind"])
+    REQUESTS.inc(kind="example")
+
+Metrics register themselves on creation and are rendered by the /metrics
+view. Updating one is a dict lookup and an addition under a lock, cheap
+enough for every request, query or OpenAI call.
+
+Multiprocess mode: when METRICS_MULTIPROC_DIR is set (gunicorn.conf.py sets
+it), every process writes a JSON snapshot of its metrics to
+<dir>/<pid>.json once per METRICS_FLUSH_INTERVAL seconds (default 1), and
+/metrics merges the snapshots of all processes. Counters and histograms are
+summed. "livesum" gauges are summed over live processes, and "all" gauges
+get one series per process with a ``pid`` label. When a worker exits, the
+gunicorn master folds its counters and histograms into archive.json
+(mark_process_dead()) so totals do not go backwards; its gauges are dropped.
+A forked child starts from zero rather than with the parent's values.
+"""
+
+import bisect
+import contextlib
+import json
+import os
+import resource
+import stat
+import threading
+import time
+
+REGISTRY = []
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+MULTIPROC_DIR_ENV = "METRICS_MULTIPROC_DIR"
+ARCHIVE_FILE = "archive.json"
+
+_flusher_pid = None
+_flusher_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return f"{{{pairs}}}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Labelled metric; subclasses define the per-label-set state."""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _reset(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _copy_values(self):
+        with self._lock:
+            return dict(self._values)
+
+    def snapshot(self):
+        """Return the metric's description and series as JSON-serialisable data."""
+        return {
+            "type": self.kind,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "series": [
+                [list(key), value] for key, value in self._copy_values().items()
+            ],
+        }
+
+    def render(self):
+        """Render this process's series in the Prometheus text format."""
+        return _format(_merge({}, {self.name: self.snapshot()}, pid=os.getpid()))
+
+
+class Counter(_Metric):
+    """Monotonically increasing total per label set."""
+
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down.
+
+    Args:
+        multiprocess_mode: "livesum" to add up live processes, or "all" for a
+            series per process (labelled with its pid)
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), multiprocess_mode="livesum"):
+        super().__init__(name, documentation, labelnames)
+        self.multiprocess_mode = multiprocess_mode
+        self._functions = {}
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def set_function(self, function, **labels):
+        """Read the value from ``function()`` whenever the gauge is exported."""
+        self._functions[self._key(labels)] = function
+
+    def _copy_values(self):
+        values = super()._copy_values()
+        for key, function in self._functions.items():
+            values[key] = function()
+        return values
+
+    def snapshot(self):
+        data = super().snapshot()
+        data["mode"] = self.multiprocess_mode
+        return data
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket (non-cumulative) counts, then sum.
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def _copy_values(self):
+        with self._lock:
+            return {
+                key: [list(counts), total]
+                for key, (counts, total) in self._values.items()
+            }
+
+    def snapshot(self):
+        data = super().snapshot()
+        data["buckets"] = list(self.buckets)
+        return data
+
+
+def _snapshot_registry():
+    return {metric.name: metric.snapshot() for metric in REGISTRY}
+
+
+def _merge(merged, snapshot, live=True, pid=None):
+    """
+    Fold one process snapshot into ``merged`` ({name: metric with series dict}).
+
+    Args:
+        merged: Accumulated metrics, modified in place
+        snapshot: Data written by a process (or the archive)
+        live: Whether the process is still running; gauges of dead ones are dropped
+        pid: Process id, for "all" gauges
+    """
+    for name, metric in snapshot.items():
+        is_gauge = metric["type"] == "gauge"
+        if is_gauge and not live:
+            continue
+        per_process = is_gauge and metric.get("mode") == "all"
+        target = merged.get(name)
+        if target is None:
+            target = merged[name] = {
+                **metric,
+                "labelnames": metric["labelnames"] + (["pid"] if per_process else []),
+                "series": {},
+            }
+        series = target["series"]
+        for key, value in metric["series"]:
+            key = tuple(key) + ((str(pid),) if per_process else ())
+            current = series.get(key)
+            if current is None:
+                series[key] = value
+            elif metric["type"] == "histogram":
+                series[key] = [
+                    [a + b for a, b in zip(current[0], value[0])],
+                    current[1] + value[1],
+                ]
+            else:
+                series[key] = current + value
+    return merged
+
+
+def _to_snapshot(merged):
+    return {
+        name: {
+            **metric,
+            "series": [[list(key), value] for key, value in metric["series"].items()],
+        }
+        for name, metric in merged.items()
+    }
+
+
+def _format(merged):
+    lines = []
+    for name in sorted(merged):
+        metric = merged[name]
+        lines.append(f"# HELP {name} {_escape(metric['help'])}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for key, value in sorted(metric["series"].items()):
+            labels = tuple(zip(metric["labelnames"], key))
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                continue
+            counts, total = value
+            cumulative = 0
+            bounds = [float(bound) for bound in metric["buckets"]] + [float("inf")]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                bucket_labels = labels + (("le", _format_value(bound)),)
+                lines.append(
+                    f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                )
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def multiprocess_dir():
+    """Return the snapshot directory, or None outside multiprocess mode."""
+    return os.environ.get(MULTIPROC_DIR_ENV) or None
+
+
+def _read_json(path):
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        # Missing, or replaced between listdir() and open().
+        return None
+
+
+def _write_json(path, data):
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as file:
+        json.dump(data, file)
+    os.replace(temporary, path)
+
+
+def write_snapshot():
+    """Write this process's metrics to the multiprocess directory, if any."""
+    directory = multiprocess_dir()
+    if directory:
+        _write_json(
+            os.path.join(directory, f"{os.getpid()}.json"), _snapshot_registry()
+        )
+
+
+def mark_process_dead(pid):
+    """
+    Fold an exited process's counters and histograms into the archive.
+
+    Called by the gunicorn master (one process, so archive updates do not
+    race). The archive is written before the process file is removed, so a
+    concurrent scrape may briefly count the process twice but never drops it.
+
+    Args:
+        pid: Process id of the exited worker
+    """
+    directory = multiprocess_dir()
+    if not directory:
+        return
+    path = os.path.join(directory, f"{pid}.json")
+    snapshot = _read_json(path)
+    if snapshot is None:
+        return
+    archive_path = os.path.join(directory, ARCHIVE_FILE)
+    merged = _merge({}, _read_json(archive_path) or {}, live=False)
+    _merge(merged, snapshot, live=False)
+    _write_json(archive_path, _to_snapshot(merged))
+    os.remove(path)
+
+
+def clear_multiprocess_dir():
+    """
+    Create the multiprocess directory, removing snapshots of earlier runs.
+
+    Raises:
+        PermissionError: If the directory is a symlink, belongs to another
+            user or is accessible to group or others; its snapshots could
+            then be planted or its files removed by someone else
+    """
+    directory = multiprocess_dir()
+    if not directory:
+        return
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"{MULTIPROC_DIR_ENV} {directory} must be a directory owned by this "
+            "user with mode 0700"
+        )
+    for name in os.listdir(directory):
+        if name.endswith((".json", ".tmp")):
+            os.remove(os.path.join(directory, name))
+
+
+def ensure_flusher(interval=1.0):
+    """Start this process's snapshot thread in multiprocess mode (idempotent)."""
+    global _flusher_pid
+    if _flusher_pid == os.getpid() or not multiprocess_dir():
+        return
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+    threading.Thread(
+        target=_flush_forever, args=(interval,), name="metrics-flush", daemon=True
+    ).start()
+
+
+def _flush_forever(interval):
+    while True:
+        time.sleep(interval)
+        # A full or removed directory must not kill the flusher thread.
+        with contextlib.suppress(OSError):
+            write_snapshot()
+
+
+def render_metrics():
+    """
+    Render every metric in the Prometheus text exposition format.
+
+    In multiprocess mode the snapshots of all processes are merged, with this
+    process's own metrics taken live.
+
+    Returns:
+        str: Exposition text, ending with a newline
+    """
+    pid = os.getpid()
+    directory = multiprocess_dir()
+    if not directory:
+        return _format(_merge({}, _snapshot_registry(), pid=pid))
+
+    merged = _merge({}, _snapshot_registry(), pid=pid)
+    for name in os.listdir(directory):
+        if not name.endswith(".json") or name == f"{pid}.json":
+            continue
+        snapshot = _read_json(os.path.join(directory, name))
+        if snapshot is None:
+            continue
+        if name == ARCHIVE_FILE:
+            _merge(merged, snapshot, live=False)
+        else:
+            _merge(merged, snapshot, pid=name[: -len(".json")])
+    return _format(merged)
+
+
+def _reset_after_fork():
+    """Start a forked child from zero instead of re-counting its parent's values."""
+    global _flusher_pid, _flusher_lock
+    _flusher_pid = None
+    _flusher_lock = threading.Lock()
+    for metric in REGISTRY:
+        metric._reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# Process and server metrics
+_PROCESS_START = time.time()
+
+
+def _resident_memory_bytes():
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current RSS where /proc is unavailable.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+PROCESS_MEMORY = Gauge(
+    "parodynews_process_resident_memory_bytes",
+    "Resident memory of each server process",
+    multiprocess_mode="all",
+)
+PROCESS_MEMORY.set_function(_resident_memory_bytes)
+PROCESS_CPU = Gauge(
+    "parodynews_process_cpu_seconds",
+    "User and system CPU time used by each server process",
+    multiprocess_mode="all",
+)
+PROCESS_CPU.set_function(lambda: sum(os.times()[:2]))
+PROCESS_START_TIME = Gauge(
+    "parodynews_process_start_time_seconds",
+    "Start time of each server process (Unix time)",
+    multiprocess_mode="all",
+)
+PROCESS_START_TIME.set_function(lambda: _PROCESS_START)
+GUNICORN_WORKERS = Gauge(
+    "parodynews_gunicorn_workers",
+    "Worker processes the gunicorn master is running",
+)
+GUNICORN_WORKER_EXITS = Counter(
+    "parodynews_gunicorn_worker_exits_total",
+    "Gunicorn workers that exited (max_requests recycling, timeouts, crashes)",
+)
@@ -0,0 +1,225 @@
+"""
+File: middleware.py
+Description: Request metrics middleware and authentication middleware that
+serves request.user from the cache
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage:
+Put 'parodynews.middleware.RequestMetricsMiddleware' first in MIDDLEWARE,
+and replace 'django.contrib.auth.middleware.AuthenticationMiddleware' with
+'parodynews.middleware.CachedAuthenticationMiddleware'.
+
+RequestMetricsMiddleware times each request by view name, method and status,
+and counts the database queries and query time it caused on every database
+alias (via connection.execute_wrapper). It also starts the process's
+metrics snapshot thread in multiprocess mode (see parodynews.metrics).
+
+Together with the cached_db session engine, CachedAuthenticationMiddleware
+removes both the session and the user SELECT from authenticated requests.
+Cached users are dropped when the user is saved or deleted (see
+parodynews.signals) and expire after AUTH_USER_CACHE_TIMEOUT seconds to bound
+staleness from queryset updates.
+"""
+
+import time
+from collections import Counter as TallyCounter
+from contextlib import ExitStack
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    _get_user_session_key,
+    load_backend,
+)
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connections
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from .metrics import Counter, Gauge, Histogram, ensure_flusher
+
+REQUEST_DURATION = Histogram(
+    "parodynews_http_request_duration_seconds",
+    "Time to respond to a request, by view, method and status",
+    ["view", "method", "status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "parodynews_http_requests_in_progress",
+    "Requests being handled by each server process (busy threads)",
+    multiprocess_mode="all",
+)
+DB_QUERIES = Counter(
+    "parodynews_db_queries_total",
+    "Database queries made while handling requests, by view and database alias",
+    ["view", "alias"],
+)
+DB_QUERY_DURATION = Counter(
+    "parodynews_db_query_duration_seconds_total",
+    "Time spent in database queries while handling requests",
+    ["view", "alias"],
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "parodynews_db_queries_per_request",
+    "Database queries made by one request, over all aliases",
+    ["view"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+
+# Other methods share one label value to bound the number of series.
+KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+def user_cache_key(user_id):
+    return f"auth_user:{user_id}"
+
+
+def user_cache_timeout():
+    """Return how long an authenticated user is cached, in seconds."""
+    return getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 300)
+
+
+def _verify_session(request, user):
+    """
+    Check the session's auth hash against the user, as django.contrib.auth does.
+
+    Returns:
+        bool: False when the session was flushed and the user must be anonymous
+    """
+    if not hasattr(user, "get_session_auth_hash"):
+        return True
+    session_hash = request.session.get(HASH_SESSION_KEY)
+    session_auth_hash = user.get_session_auth_hash()
+    if session_hash and constant_time_compare(session_hash, session_auth_hash):
+        return True
+    # Sessions signed with a rotated-out SECRET_KEY are upgraded in place.
+    if session_hash and any(
+        constant_time_compare(session_hash, fallback_auth_hash)
+        for fallback_auth_hash in user.get_session_auth_fallback_hash()
+    ):
+        request.session.cycle_key()
+        request.session[HASH_SESSION_KEY] = session_auth_hash
+        return True
+    request.session.flush()
+    return False
+
+
+def get_cached_user(request):
+    """
+    Return the session's user, loading it from the cache before the database.
+
+    Mirrors django.contrib.auth.get_user() apart from the lookup itself.
+
+    Args:
+        request: HttpRequest with a session
+
+    Returns:
+        User instance or AnonymousUser
+    """
+    try:
+        user_id = _get_user_session_key(request)
+        backend_path = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return AnonymousUser()
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return AnonymousUser()
+
+    key = user_cache_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user = load_backend(backend_path).get_user(user_id)
+        if user is None:
+            return AnonymousUser()
+        cache.set(key, user, user_cache_timeout())
+
+    if not _verify_session(request, user):
+        return AnonymousUser()
+    return user
+
+
+def get_user(request):
+    if not hasattr(request, "_cached_user"):
+        request._cached_user = get_cached_user(request)
+    return request._cached_user
+
+
+async def auser(request):
+    if not hasattr(request, "_acached_user"):
+        request._acached_user = await sync_to_async(get_cached_user)(request)
+    return request._acached_user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware whose request.user comes from the cache."""
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(request))
+        request.auser = partial(auser, request)
+
+
+class _QueryTimer:
+    """execute_wrapper that tallies queries and their time per alias."""
+
+    def __init__(self):
+        self.queries = TallyCounter()
+        self.seconds = TallyCounter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            alias = context["connection"].alias
+            self.queries[alias] += 1
+            self.seconds[alias] += time.perf_counter() - start
+
+
+def _view_label(request):
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else "unresolved"
+
+
+class RequestMetricsMiddleware:
+    """Record latency and database use of every request, per view."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.flush_interval = getattr(settings, "METRICS_FLUSH_INTERVAL", 1.0)
+
+    def __call__(self, request):
+        # Started here, not in __init__: with preload_app the middleware is
+        # built in the gunicorn master, and threads do not survive the fork.
+        ensure_flusher(self.flush_interval)
+        timer = _QueryTimer()
+        status = 500
+        REQUESTS_IN_PROGRESS.inc()
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(timer))
+                response = self.get_response(request)
+            status = response.status_code
+            return response
+        finally:
+            duration = time.perf_counter() - start
+            REQUESTS_IN_PROGRESS.dec()
+            view = _view_label(request)
+            method = request.method if request.method in KNOWN_METHODS else "other"
+            REQUEST_DURATION.observe(duration, view=view, method=method, status=status)
+            DB_QUERIES_PER_REQUEST.observe(sum(timer.queries.values()), view=view)
+            for alias, count in timer.queries.items():
+                DB_QUERIES.inc(count, view=view, alias=alias)
+                DB_QUERY_DURATION.inc(timer.seconds[alias], view=view, alias=alias)
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-19 01:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parodynews", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contentdetail",
+            index=models.Index(fields=["title"], name="parodynews__title_25da3a_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="contentdetail",
+            index=models.Index(fields=["author"], name="parodynews__author_fa74bc_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="thread",
+            index=models.Index(fields=["name"], name="parodynews__name_31f678_idx"),
+        ),
+    ]
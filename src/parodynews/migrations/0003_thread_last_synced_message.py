@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 02:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parodynews", "0002_listing_sort_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="thread",
+            name="last_synced_message_id",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.4 on 2026-10-19 02:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parodynews", "0003_thread_last_synced_message"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contentitem",
+            name="openai_calls",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contentitem",
+            name="openai_completion_tokens",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contentitem",
+            name="openai_cost_usd",
+            field=models.DecimalField(decimal_places=6, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="contentitem",
+            name="openai_duration_ms",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="contentitem",
+            name="openai_prompt_tokens",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 03:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parodynews", "0004_contentitem_openai_usage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jsonschema",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
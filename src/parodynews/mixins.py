@@ -1,23 +1,49 @@
 import os
+from collections import namedtuple
+from functools import cache
 
 from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import classproperty
 from django.views.generic import View
 from openai import OpenAI
 
 from .models import AppConfig
 
+ModelMetadata = namedtuple("ModelMetadata", ["fields", "display_fields"])
+
+
+@cache
+def get_model_metadata(model):
+    """
+    Return the table metadata of a model class, computed once per class.
+
+    get_display_fields() is an instance method, so the model is instantiated
+    a single time here instead of on every request.
+    """
+    return ModelMetadata(
+        fields=model._meta.get_fields(),
+        display_fields=tuple(model().get_display_fields()),
+    )
+
 
 class ModelFieldsMixin(View):
     model = None
 
-    def get_model_fields(self):
-        if self.model is None:
+    @classproperty
+    def model_metadata(cls):
+        if cls.model is None:
             raise ValueError(
                 "ModelFieldsMixin requires a 'model' attribute to be defined."
             )
-        fields = self.model._meta.get_fields()
-        display_fields = self.model().get_display_fields()
-        return fields, display_fields
+        return get_model_metadata(cls.model)
+
+    @classproperty
+    def display_fields(cls):
+        return cls.model_metadata.display_fields
+
+    def get_model_fields(self):
+        metadata = self.model_metadata
+        return metadata.fields, metadata.display_fields
 
 
 class AppConfigClientMixin(View):
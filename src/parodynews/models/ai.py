@@ -3,7 +3,7 @@ File: ai.py
 Description: AI/OpenAI-related Django models (assistants, schemas, model configs)
 Author: Barodybroject Team <team@example.com>
 Created: 2025-11-30
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -27,6 +27,7 @@ class JSONSchema(models.Model):
         name (str): Unique identifier for the schema (max 255 chars)
         description (str): Human-readable description of schema purpose
         schema (dict): JSON Schema specification following JSON Schema standard
+        updated_at (datetime): Timestamp of the last change, part of cache_key
 
     Examples:
         >>> schema = JSONSchema.objects.create(
@@ -51,6 +52,7 @@ class JSONSchema(models.Model):
     name = models.CharField(max_length=255)
     description = models.CharField(max_length=255)
     schema = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         app_label = "parodynews"
@@ -65,6 +67,17 @@ class JSONSchema(models.Model):
         """
         return self.name
 
+    @property
+    def cache_key(self):
+        """Key of this version of the schema in parodynews.utils.schemas.
+
+        Returns:
+            str or None: Key that changes on every save, or None while unsaved
+        """
+        if self.pk is None or self.updated_at is None:
+            return None
+        return f"jsonschema:{self.pk}:{self.updated_at.isoformat()}"
+
 
 class OpenAIModel(models.Model):
     """OpenAI model configuration and metadata.
@@ -111,6 +124,32 @@ class OpenAIModel(models.Model):
         return self.model_id
 
 
+class AssistantQuerySet(models.QuerySet):
+    """QuerySet for Assistant with a light-weight listing variant."""
+
+    # Columns needed to list, link and label assistants. The text columns
+    # (instructions, prompt: up to 256000 chars each) and JSON columns are left
+    # deferred and only load if an instance actually reads them.
+    LISTING_FIELDS = (
+        "id",
+        "name",
+        "description",
+        "created_at",
+        "model__id",
+        "model__model_id",
+        "json_schema__id",
+        "json_schema__name",
+    )
+
+    def listing(self):
+        """Return assistants with only the columns used by lists and selects.
+
+        Returns:
+            AssistantQuerySet: Queryset joining the model and schema labels
+        """
+        return self.select_related("model", "json_schema").only(*self.LISTING_FIELDS)
+
+
 class Assistant(models.Model):
     """AI assistant configuration for content generation.
 
@@ -191,6 +230,8 @@ class Assistant(models.Model):
         "AssistantGroupMembership", related_name="assistant", blank=True
     )
 
+    objects = AssistantQuerySet.as_manager()
+
     class Meta:
         app_label = "parodynews"
         verbose_name = "Assistant"
@@ -3,7 +3,7 @@ File: config.py
 Description: Django models for application-wide configuration (keys, settings, attribution)
 Author: Barodybroject Team <team@example.com>
 Created: 2025-11-30
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -12,7 +12,6 @@ Dependencies:
 Usage: from parodynews.models.config import AppConfig
 """
 
-from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 
@@ -152,8 +151,9 @@ class FieldDefaults(models.Model):
         Defaults for post_defaults
 
     Note:
-        Saving this model clears the 'field_defaults' cache to ensure
-        updated defaults are immediately available.
+        Saving or deleting a row bumps the model's cache generation (see
+        parodynews.signals), which invalidates the defaults index used by
+        parodynews.utils.defaults.get_model_defaults.
     """
 
     type = models.CharField(max_length=255, default="default_type")
@@ -174,12 +174,3 @@ class FieldDefaults(models.Model):
             str: Formatted string 'Defaults for {type}'
         """
         return f"Defaults for {self.type}"
-
-    def save(self, *args, **kwargs):
-        """Clear cached defaults and save.
-
-        Ensures the cache is invalidated whenever defaults are updated.
-        """
-        # Clear cached defaults when updated
-        cache.delete("field_defaults")
-        super().save(*args, **kwargs)
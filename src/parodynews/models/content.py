@@ -78,6 +78,9 @@ class ContentDetail(models.Model):
         indexes = [
             models.Index(fields=["-published_at"]),
             models.Index(fields=["slug"]),
+            # Sortable listing columns (see utils.tables)
+            models.Index(fields=["title"]),
+            models.Index(fields=["author"]),
         ]
 
     def get_display_fields(self):
@@ -111,6 +114,11 @@ class ContentItem(models.Model):
         assistant (Assistant): Assistant that generated this content
         prompt (str): The prompt used to generate this content
         detail (ContentDetail): Parent content detail container
+        openai_calls (int): OpenAI calls made to produce this item
+        openai_prompt_tokens (int): Prompt tokens used by those calls
+        openai_completion_tokens (int): Completion tokens used by those calls
+        openai_duration_ms (int): Time spent in those calls, retries included
+        openai_cost_usd (Decimal): Estimated cost (see OPENAI_MODEL_PRICES)
         messages (RelatedManager): Related messages (reverse relation)
 
     Examples:
@@ -157,6 +165,13 @@ class ContentItem(models.Model):
         ContentDetail, on_delete=models.CASCADE, related_name="contentitem"
     )
 
+    # OpenAI usage, filled in by parodynews.utils.instrumentation
+    openai_calls = models.PositiveIntegerField(default=0)
+    openai_prompt_tokens = models.PositiveIntegerField(default=0)
+    openai_completion_tokens = models.PositiveIntegerField(default=0)
+    openai_duration_ms = models.PositiveIntegerField(default=0)
+    openai_cost_usd = models.DecimalField(max_digits=12, decimal_places=6, default=0)
+
     class Meta:
         app_label = "parodynews"
         verbose_name = "Content Item"
@@ -3,7 +3,7 @@ File: conversation.py
 Description: Django models for assistant threads and messages
 Author: Barodybroject Team <team@example.com>
 Created: 2025-11-30
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -35,6 +35,8 @@ class Thread(models.Model):
         assistant_group (AssistantGroup): Group of assistants used in this thread
         created_at (datetime): Timestamp when thread was created
         user (User): User who owns this thread
+        last_synced_message_id (str): Newest OpenAI message already copied
+            locally; the cursor for the next incremental message sync
         messages (RelatedManager): Messages in this thread (reverse relation)
         posts (RelatedManager): Posts generated from this thread (reverse relation)
 
@@ -73,6 +75,7 @@ class Thread(models.Model):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, null=True, blank=True, related_name="threads"
     )
+    last_synced_message_id = models.CharField(max_length=255, blank=True, default="")
 
     class Meta:
         app_label = "parodynews"
@@ -82,6 +85,8 @@ class Thread(models.Model):
         indexes = [
             models.Index(fields=["-created_at"]),
             models.Index(fields=["user"]),
+            # Sortable listing column (see utils.tables)
+            models.Index(fields=["name"]),
         ]
 
     def get_display_fields(self):
@@ -19,6 +19,21 @@ from .models import (  # AI models; Content models; Conversation models; Publish
     PoweredBy,
     Thread,
 )
+from .utils.rendering import render_markdown
+
+
+class RenderedHTMLMixin:
+    """Add a cached ``rendered_html`` field when the request asks for ``?render=html``."""
+
+    render_source_field = None
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        request = self.context.get("request")
+        if request is not None and request.query_params.get("render") == "html":
+            source = getattr(instance, self.render_source_field, "")
+            data["rendered_html"] = str(render_markdown(source))
+        return data
 
 
 class AssistantSerializer(serializers.ModelSerializer):
@@ -27,16 +42,33 @@ class AssistantSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class AssistantListSerializer(serializers.ModelSerializer):
+    """Assistant fields returned by list endpoints, matching Assistant.objects.listing()."""
+
+    class Meta:
+        model = Assistant
+        fields = ["id", "name", "description", "created_at", "model", "json_schema"]
+
+
 class AssistantGroupSerializer(serializers.ModelSerializer):
     class Meta:
         model = AssistantGroup
         fields = "__all__"
 
 
-class ContentItemSerializer(serializers.ModelSerializer):
+class ContentItemSerializer(RenderedHTMLMixin, serializers.ModelSerializer):
+    render_source_field = "content_text"
+
     class Meta:
         model = ContentItem
         fields = "__all__"
+        read_only_fields = [
+            "openai_calls",
+            "openai_prompt_tokens",
+            "openai_completion_tokens",
+            "openai_duration_ms",
+            "openai_cost_usd",
+        ]
 
 
 class ContentDetailSerializer(serializers.ModelSerializer):
@@ -49,6 +81,7 @@ class ThreadSerializer(serializers.ModelSerializer):
     class Meta:
         model = Thread
         fields = "__all__"
+        read_only_fields = ["last_synced_message_id"]
 
 
 class MessageSerializer(serializers.ModelSerializer):
@@ -57,7 +90,9 @@ class MessageSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(RenderedHTMLMixin, serializers.ModelSerializer):
+    render_source_field = "post_content"
+
     class Meta:
         model = Post
         fields = "__all__"
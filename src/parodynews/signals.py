@@ -0,0 +1,118 @@
+"""
+File: signals.py
+Description: Signal handlers keeping parodynews caches consistent with the database
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: Imported by ParodynewsConfig.ready(), which calls connect_model_receivers()
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .middleware import user_cache_key
+from .models import JSONSchema
+from .page_cache import invalidate_tags
+from .utils.fragments import bump_model_generation
+
+
+def invalidate_model_table_rows(sender, **kwargs):
+    """Drop cached listing rows for the changed model and models that display it."""
+    bump_model_generation(sender)
+    # Rows of referencing models render this instance via its __str__.
+    for relation in sender._meta.related_objects:
+        if relation.related_model._meta.app_label == "parodynews":
+            bump_model_generation(relation.related_model)
+
+
+def invalidate_page_cache(sender, instance, **kwargs):
+    """Invalidate cached pages tagged with the changed model or instance."""
+    name = sender._meta.model_name
+    invalidate_tags(name, f"{name}:{instance.pk}")
+
+
+def connect_model_receivers(app_config):
+    """
+    Connect the per-model invalidation handlers to each model of the app.
+
+    They are connected with an explicit sender. A post_delete receiver
+    without one counts as a delete listener for every model in the project,
+    which turns off QuerySet.delete()'s fast path even for sessions and
+    permissions.
+
+    Args:
+        app_config: The parodynews AppConfig
+    """
+    for model in app_config.get_models():
+        label = model._meta.label_lower
+        post_save.connect(
+            invalidate_model_table_rows,
+            sender=model,
+            dispatch_uid=f"parodynews_model_table_save:{label}",
+        )
+        post_delete.connect(
+            invalidate_model_table_rows,
+            sender=model,
+            dispatch_uid=f"parodynews_model_table_delete:{label}",
+        )
+        post_save.connect(
+            invalidate_page_cache,
+            sender=model,
+            dispatch_uid=f"parodynews_page_cache_save:{label}",
+        )
+        post_delete.connect(
+            invalidate_page_cache,
+            sender=model,
+            dispatch_uid=f"parodynews_page_cache_delete:{label}",
+        )
+
+
+def invalidate_bulk_changes(model, pks):
+    """
+    Apply the save/delete invalidations for rows written without signals.
+
+    bulk_create(), bulk_update() and QuerySet.update() skip post_save, so
+    callers using them report the affected primary keys here instead.
+
+    Args:
+        model: parodynews model class that was written
+        pks: Primary keys of the created, updated or deleted rows
+    """
+    invalidate_model_table_rows(model)
+    name = model._meta.model_name
+    invalidate_tags(name, *(f"{name}:{pk}" for pk in pks))
+    if model is JSONSchema:
+        from .utils.schemas import clear_schema_cache
+
+        clear_schema_cache()
+
+
+@receiver(post_save, sender=JSONSchema, dispatch_uid="parodynews_schema_save")
+@receiver(post_delete, sender=JSONSchema, dispatch_uid="parodynews_schema_delete")
+def invalidate_schema_registry(sender, **kwargs):
+    """Drop resolved schemas and validators after a JSONSchema changes."""
+    # Imported here: utils.schemas pulls in jsonschema and jsonref, which
+    # workers should only load once they validate something.
+    from .utils.schemas import clear_schema_cache
+
+    # Other processes rely on JSONSchema.cache_key changing with updated_at;
+    # this releases the old entries here and picks up edited schema files.
+    clear_schema_cache()
+
+
+@receiver(
+    post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="parodynews_user_save"
+)
+@receiver(
+    post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="parodynews_user_delete"
+)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the cached request.user after a user changes (e.g. password, login)."""
+    cache.delete(user_cache_key(instance.pk))
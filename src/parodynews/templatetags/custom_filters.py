@@ -16,6 +16,21 @@ import ast
 import json
 
 from django import template
+from django.core.cache import cache
+from django.http import QueryDict
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+from ..utils.fragments import get_model_generation, row_cache_key, row_cache_timeout
+from ..utils.rendering import render_markdown
+from ..utils.tables import (
+    FILTER_PREFIX,
+    PAGE_PARAM,
+    PER_PAGE_PARAM,
+    SORT_PARAM,
+    apply_table_query,
+    querystring,
+)
 
 register = template.Library()
 
@@ -77,6 +92,17 @@ def dict_to_text_list(value):
     return value
 
 
+@register.filter
+def cached_markdownify(value, custom_settings="default"):
+    """
+    Render Markdown to HTML, served from the render cache when unchanged
+
+    Usage: {{ post.post_content|cached_markdownify }}
+    Note: Drop-in replacement for django-markdownify's markdownify filter
+    """
+    return render_markdown(value, custom_settings)
+
+
 @register.inclusion_tag("includes/status_badge.html")
 def status_badge(status, label=None):
     """
@@ -90,10 +116,12 @@ def status_badge(status, label=None):
     }
 
 
-@register.inclusion_tag("includes/model_table.html")
-def render_model_table(objects, fields, display_fields, detail_url, table_label=None):
+@register.inclusion_tag("includes/model_table.html", takes_context=True)
+def render_model_table(
+    context, objects, fields, display_fields, detail_url, table_label=None
+):
     """
-    Render a sortable, filterable table for any model listing
+    Render a sortable, filterable, paginated table for any model listing
 
     Usage: {% render_model_table objects fields display_fields 'edit_content' 'Content List' %}
 
@@ -103,16 +131,96 @@ def render_model_table(objects, fields, display_fields, detail_url, table_label=
         display_fields: List of field names to display (e.g., ['title', 'author', 'created_at'])
         detail_url: URL name for detail view (will be passed object.id)
         table_label: Optional ARIA label for accessibility
+
+    Sorting (?sort=-field), per-column filters (?filter_<field>=value) and
+    pagination (?page=, ?per_page=) are applied to the queryset in the
+    database. Rows are cached individually and reused until the model's
+    generation is bumped by a save or delete (see parodynews.signals).
     """
+    request = context.get("request")
+    params = request.GET if request is not None else QueryDict()
+    listing = apply_table_query(objects, params, display_fields)
+    page = listing["page"]
+
+    columns = []
+    for field in fields:
+        if field.name not in display_fields:
+            continue
+        column = {
+            "field": field,
+            "filter_name": f"{FILTER_PREFIX}{field.name}",
+            "filter_value": listing["filters"].get(field.name, ""),
+            "sort_url": None,
+            "direction": None,
+        }
+        if field.name in listing["sortable"]:
+            if listing["sort"] == field.name:
+                column["direction"] = "ascending"
+                next_sort = f"-{field.name}"
+            elif listing["sort"] == f"-{field.name}":
+                column["direction"] = "descending"
+                next_sort = field.name
+            else:
+                next_sort = field.name
+            column["sort_url"] = querystring(
+                params, **{SORT_PARAM: next_sort, PAGE_PARAM: None}
+            )
+        columns.append(column)
+
+    def page_url(number):
+        return querystring(params, **{PAGE_PARAM: number})
+
     return {
-        "objects": objects,
-        "fields": fields,
+        "rows": _render_rows(
+            page.object_list,
+            [column["field"] for column in columns],
+            display_fields,
+            detail_url,
+        ),
+        "columns": columns,
+        "page": page,
+        "previous_url": (
+            page_url(page.previous_page_number()) if page.has_previous() else None
+        ),
+        "next_url": page_url(page.next_page_number()) if page.has_next() else None,
+        "sort": listing["sort"],
+        "per_page": params.get(PER_PAGE_PARAM, ""),
+        "table_id": f"model-table-{detail_url}".replace("_", "-"),
         "display_fields": display_fields,
         "detail_url": detail_url,
         "table_label": table_label or "Data table",
     }
 
 
+def _render_rows(objects, columns, display_fields, detail_url):
+    """Return rendered ``<tr>`` fragments, taking unchanged rows from the cache."""
+    objects = list(objects)
+    generations = {}
+    keys = []
+    for obj in objects:
+        model = type(obj)
+        if model not in generations:
+            generations[model] = get_model_generation(model)
+        keys.append(row_cache_key(obj, generations[model], display_fields, detail_url))
+
+    cached = cache.get_many(keys)
+    row_template = get_template("includes/model_table_row.html")
+    rows = []
+    missing = {}
+    for obj, key in zip(objects, keys):
+        html = cached.get(key)
+        if html is None:
+            html = row_template.render(
+                {"object": obj, "fields": columns, "detail_url": detail_url}
+            )
+            missing[key] = html
+        rows.append(mark_safe(html))
+
+    if missing:
+        cache.set_many(missing, row_cache_timeout())
+    return rows
+
+
 @register.inclusion_tag("includes/crud_buttons.html")
 def crud_buttons(object_id=None, save_url=None, delete_url=None, create_url=None):
     """
@@ -0,0 +1,73 @@
+"""
+File: test_assistant_listing.py
+Description: Tests for deferred loading of large Assistant columns in listings
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+- djangorestframework
+
+Usage: python manage.py test parodynews.tests.test_assistant_listing
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from parodynews.models import Assistant, JSONSchema, OpenAIModel
+
+
+class AssistantListingTests(TestCase):
+    """Test Assistant.objects.listing() and the views using it"""
+
+    def setUp(self):
+        cache.clear()
+        model = OpenAIModel.objects.create(model_id="gpt-4o", description="x" * 500)
+        schema = JSONSchema.objects.create(
+            name="article", description="Article", schema={"type": "object"}
+        )
+        Assistant.objects.create(
+            id="asst_1",
+            name="Writer",
+            instructions="i" * 200000,
+            prompt="p" * 200000,
+            model=model,
+            json_schema=schema,
+        )
+        self.user = get_user_model().objects.create_user(
+            username="lister", password="pw-12345"
+        )
+
+    def test_listing_defers_heavy_columns(self):
+        """Test that labels load in one query and large text stays deferred"""
+        with self.assertNumQueries(1):
+            assistant = Assistant.objects.listing().get()
+            self.assertEqual(str(assistant.model), "gpt-4o")
+            self.assertEqual(str(assistant.json_schema), "article")
+        self.assertEqual(
+            assistant.get_deferred_fields()
+            & {"instructions", "prompt", "tools", "metadata"},
+            {"instructions", "prompt", "tools", "metadata"},
+        )
+
+    def test_heavy_columns_load_on_access(self):
+        """Test that a deferred column is still available when read"""
+        assistant = Assistant.objects.listing().get()
+        self.assertEqual(len(assistant.instructions), 200000)
+
+    def test_api_list_omits_heavy_fields(self):
+        """Test that the API list uses the light serializer and retrieve does not"""
+        listing = self.client.get("/api/assistants/").json()["results"][0]
+        self.assertEqual(listing["name"], "Writer")
+        self.assertNotIn("instructions", listing)
+        detail = self.client.get("/api/assistants/asst_1/").json()
+        self.assertEqual(len(detail["instructions"]), 200000)
+
+    def test_manage_assistants_page_renders(self):
+        """Test that the assistants page lists from the deferred queryset"""
+        self.client.force_login(self.user)
+        response = self.client.get("/assistants/")
+        self.assertContains(response, "Writer")
+        self.assertNotContains(response, "i" * 2000)
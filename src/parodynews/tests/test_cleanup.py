@@ -0,0 +1,159 @@
+"""
+File: test_cleanup.py
+Description: Tests for parallel remote deletion with retries and bulk local cleanup
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+- httpx
+- openai
+
+Usage: python manage.py test parodynews.tests.test_cleanup
+"""
+
+import threading
+import time
+
+import httpx
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from openai import InternalServerError, NotFoundError, OpenAI
+
+from parodynews.models import Assistant
+from parodynews.utils.cleanup import bulk_delete_assistants, delete_remote_objects
+
+
+def api_error(error_class, status_code):
+    request = httpx.Request("DELETE", "https://api.openai.com/v1/assistants/x")
+    response = httpx.Response(status_code, request=request)
+    return error_class("error", response=response, body=None)
+
+
+class DeleteRemoteObjectsTests(TestCase):
+    """Test delete_remote_objects() fan-out and retries"""
+
+    def test_runs_deletions_concurrently(self):
+        """Test that deletions overlap up to the worker bound"""
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def delete_one(object_id):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        outcomes = delete_remote_objects(delete_one, range(20), max_workers=4)
+        self.assertTrue(all(outcome.deleted for outcome in outcomes))
+        self.assertEqual([outcome.object_id for outcome in outcomes], list(range(20)))
+        self.assertEqual(peak[0], 4)
+
+    def test_retries_transient_errors_and_reports_failures(self):
+        """Test that 5xx errors are retried, 404s count as deleted, others fail"""
+        attempts = {}
+
+        def delete_one(object_id):
+            attempts[object_id] = attempts.get(object_id, 0) + 1
+            if object_id == "flaky" and attempts[object_id] < 3:
+                raise api_error(InternalServerError, 500)
+            if object_id == "gone":
+                raise api_error(NotFoundError, 404)
+            if object_id == "broken":
+                raise ValueError("bad id")
+
+        outcomes = {
+            outcome.object_id: outcome
+            for outcome in delete_remote_objects(
+                delete_one, ["flaky", "gone", "broken"], retries=2, backoff=0
+            )
+        }
+        self.assertTrue(outcomes["flaky"].deleted)
+        self.assertEqual(attempts["flaky"], 3)
+        self.assertTrue(outcomes["gone"].deleted)
+        self.assertFalse(outcomes["broken"].deleted)
+        self.assertEqual(outcomes["broken"].error, "bad id")
+
+
+class BulkDeleteAssistantsTests(TestCase):
+    """Test bulk_delete_assistants() local cleanup"""
+
+    def setUp(self):
+        cache.clear()
+
+    def openai_client(self, sent, fail=None):
+        """Return an OpenAI client deleting every assistant except ``fail``."""
+        fail = fail or {}
+
+        def handler(request):
+            assistant_id = request.url.path.rsplit("/", 1)[-1]
+            with self.lock:
+                sent.append(assistant_id)
+            if assistant_id in fail:
+                return httpx.Response(fail[assistant_id], json={})
+            return httpx.Response(
+                200,
+                json={
+                    "id": assistant_id,
+                    "object": "assistant.deleted",
+                    "deleted": True,
+                },
+            )
+
+        self.lock = threading.Lock()
+        return OpenAI(
+            api_key="test",
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+
+    @override_settings(OPENAI_DELETE_WORKERS=3)
+    def test_only_remotely_deleted_rows_are_removed(self):
+        """Test that failed assistants stay and the rest go in one DELETE"""
+        for index in range(5):
+            Assistant.objects.create(id=f"asst_{index}", name=f"A{index}")
+
+        outcomes = bulk_delete_assistants(
+            self.openai_client([], fail={"asst_2": 403}),
+            Assistant.objects.values_list("id", flat=True),
+        )
+        self.assertEqual(sum(outcome.deleted for outcome in outcomes), 4)
+        self.assertEqual(
+            list(Assistant.objects.values_list("id", flat=True)), ["asst_2"]
+        )
+
+    def test_local_rows_go_in_one_delete(self):
+        """Test that the local cleanup does not grow with the number of rows"""
+        for index in range(10):
+            Assistant.objects.create(id=f"asst_{index}", name=f"A{index}")
+        client = self.openai_client([])
+
+        # One SELECT of the rows, the group membership DELETE, one SET NULL
+        # UPDATE per referencing model and a single DELETE of the assistants.
+        with CaptureQueriesContext(connection) as queries, self.assertNumQueries(7):
+            bulk_delete_assistants(client, [f"asst_{index}" for index in range(10)])
+        deletes = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('DELETE FROM "parodynews_assistant" ')
+        ]
+        self.assertEqual(len(deletes), 1)
+        self.assertIn(" IN (", deletes[0])
+        self.assertFalse(Assistant.objects.exists())
+
+    @override_settings(OPENAI_CIRCUIT_FAILURE_THRESHOLD=100)
+    def test_retries_are_not_stacked_on_sdk_retries(self):
+        """Test that a failing deletion makes retries + 1 requests in total"""
+        Assistant.objects.create(id="asst_down", name="Down")
+        sent = []
+        (outcome,) = bulk_delete_assistants(
+            self.openai_client(sent, fail={"asst_down": 500}),
+            ["asst_down"],
+            retries=2,
+            backoff=0,
+        )
+        self.assertFalse(outcome.deleted)
+        self.assertEqual(sent, ["asst_down"] * 3)
@@ -0,0 +1,61 @@
+"""
+File: test_context_processors.py
+Description: Tests for the cached, lazily evaluated footer and issue-template context
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_context_processors
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from parodynews import context_processors
+from parodynews.context_processors import footer_items, issue_templates
+from parodynews.models import PoweredBy
+
+
+class ContextProcessorCacheTests(TestCase):
+    """Test process-local caching and invalidation of shared page context"""
+
+    def setUp(self):
+        cache.clear()
+        context_processors._powered_by_cache = (None, [])
+        context_processors._issue_templates_cache = (None, [])
+        self.request = RequestFactory().get("/")
+        PoweredBy.objects.create(name="Django", icon="code", url="https://django.dev")
+
+    def test_unused_context_costs_nothing(self):
+        """Test that nothing is queried unless the template reads the value"""
+        with self.assertNumQueries(0):
+            footer_items(self.request)
+
+    def test_powered_by_cached_until_save(self):
+        """Test one query across renders and a refresh after a save"""
+        with self.assertNumQueries(1):
+            self.assertEqual(len(footer_items(self.request)["powered_by"]), 1)
+            self.assertEqual(len(footer_items(self.request)["powered_by"]), 1)
+
+        PoweredBy.objects.create(name="OpenAI", icon="robot", url="https://openai.com")
+        names = [item.name for item in footer_items(self.request)["powered_by"]]
+        self.assertEqual(names, ["Django", "OpenAI"])
+
+    def test_issue_templates_rescanned_on_mtime_change(self):
+        """Test that the folder is listed again only when its mtime changes"""
+        with mock.patch.object(
+            context_processors.os, "listdir", wraps=context_processors.os.listdir
+        ) as listdir:
+            first = list(issue_templates(self.request)["issue_templates"])
+            list(issue_templates(self.request)["issue_templates"])
+            self.assertEqual(listdir.call_count, 1 if first else 0)
+
+            mtime, templates = context_processors._issue_templates_cache
+            context_processors._issue_templates_cache = (-1, templates)
+            list(issue_templates(self.request)["issue_templates"])
+            self.assertEqual(listdir.call_count, 2 if first else 0)
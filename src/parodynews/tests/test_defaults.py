@@ -0,0 +1,76 @@
+"""
+File: test_defaults.py
+Description: Tests for the versioned FieldDefaults index
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_defaults
+"""
+
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from parodynews.forms import ContentDetailForm
+from parodynews.models import FieldDefaults
+from parodynews.utils import defaults
+from parodynews.utils.defaults import build_defaults_index, get_model_defaults
+
+
+class FieldDefaultsIndexTests(TestCase):
+    """Test lookup and invalidation of field defaults"""
+
+    def setUp(self):
+        cache.clear()
+        defaults._defaults_indexes.clear()
+        self.field_defaults = FieldDefaults.objects.create(
+            defaults=[
+                {"model_name": "ContentDetail", "fields": {"title": "Breaking"}},
+                json.dumps({"model_name": "Post", "fields": {"status": "draft"}}),
+                "not json",
+            ]
+        )
+
+    def test_build_index_decodes_string_entries(self):
+        """Test that JSON strings are decoded and invalid entries skipped"""
+        index = build_defaults_index(self.field_defaults.defaults)
+        self.assertEqual(index["Post"], {"status": "draft"})
+        self.assertEqual(set(index), {"ContentDetail", "Post"})
+
+    def test_lookup_is_served_from_process_memory(self):
+        """Test that repeated lookups only check the generation"""
+        get_model_defaults("ContentDetail")
+        with self.assertNumQueries(0):
+            self.assertEqual(get_model_defaults("ContentDetail"), {"title": "Breaking"})
+            self.assertEqual(get_model_defaults("Unknown"), {})
+
+    def test_save_and_delete_invalidate(self):
+        """Test that edits are visible to the next lookup"""
+        self.assertEqual(get_model_defaults("Post"), {"status": "draft"})
+        self.field_defaults.defaults = [
+            {"model_name": "Post", "fields": {"status": "published"}}
+        ]
+        self.field_defaults.save()
+        self.assertEqual(get_model_defaults("Post"), {"status": "published"})
+
+        self.field_defaults.delete()
+        self.assertEqual(get_model_defaults("Post"), {})
+
+    @override_settings(FIELD_DEFAULTS_CACHE_TIMEOUT=120)
+    def test_shared_index_expires(self):
+        """Test that the index of each generation is cached with a timeout"""
+        with mock.patch.object(defaults.cache, "set", wraps=cache.set) as cache_set:
+            get_model_defaults("Post")
+        cache_set.assert_called_once()
+        self.assertEqual(cache_set.call_args.args[2], 120)
+
+    def test_form_initial_uses_defaults(self):
+        """Test that DefaultFormFieldsMixin applies the indexed defaults"""
+        form = ContentDetailForm()
+        self.assertEqual(form.fields["title"].initial, "Breaking")
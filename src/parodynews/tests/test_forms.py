@@ -0,0 +1,58 @@
+"""
+File: test_forms.py
+Description: Tests for assistant choice loading in ContentItemForm
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_forms
+"""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from parodynews.forms import ContentItemForm
+from parodynews.models import Assistant
+from parodynews.utils import assistants
+from parodynews.utils.assistants import get_assistant_choices
+
+
+class ContentItemFormChoicesTests(TestCase):
+    """Test the cached assistant choices behind ContentItemForm"""
+
+    def setUp(self):
+        cache.clear()
+        assistants._assistant_choices_cache = (None, ())
+        Assistant.objects.create(id="asst_b", name="Bravo", instructions="b" * 1000)
+        Assistant.objects.create(id="asst_a", name="Alpha")
+
+    def test_choices_are_id_name_pairs(self):
+        """Test that choices hold ids and names ordered by name"""
+        self.assertEqual(
+            get_assistant_choices(), (("asst_a", "Alpha"), ("asst_b", "Bravo"))
+        )
+
+    def test_form_uses_cached_choices(self):
+        """Test that a warm form build runs no assistant queries"""
+        ContentItemForm()
+        with self.assertNumQueries(0):
+            form = ContentItemForm()
+        self.assertIn(form.fields["assistant"].initial, {"asst_a", "asst_b"})
+        self.assertIsNone(form.fields["instructions"].initial)
+
+    def test_save_and_delete_refresh_choices(self):
+        """Test that assistant changes reach the cached choices"""
+        get_assistant_choices()
+        Assistant.objects.create(id="asst_c", name="Charlie")
+        self.assertIn(("asst_c", "Charlie"), get_assistant_choices())
+        Assistant.objects.filter(id="asst_a").delete()
+        self.assertNotIn(("asst_a", "Alpha"), get_assistant_choices())
+
+    def test_submitted_assistant_is_validated(self):
+        """Test that unknown assistant ids are rejected"""
+        form = ContentItemForm(data={"assistant": "asst_missing", "prompt": "Hi"})
+        self.assertFalse(form.is_valid())
+        self.assertIn("assistant", form.errors)
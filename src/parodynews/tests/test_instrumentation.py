@@ -0,0 +1,137 @@
+"""
+File: test_instrumentation.py
+Description: Tests for OpenAI call metrics, usage persistence and /metrics
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+- httpx
+- openai
+
+Usage: python manage.py test parodynews.tests.test_instrumentation
+"""
+
+from decimal import Decimal
+
+import httpx
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from openai import BadRequestError
+
+from parodynews.metrics import REGISTRY, Counter, Histogram
+from parodynews.models import ContentDetail, ContentItem
+from parodynews.tests.test_ratelimit import COMPLETION, mock_client
+from parodynews.utils.instrumentation import collect_openai_usage
+from parodynews.utils.ratelimit import openai_call
+
+USAGE = {"prompt_tokens": 1000, "completion_tokens": 500, "total_tokens": 1500}
+
+
+class MetricsFormatTests(TestCase):
+    """Test the Prometheus text rendering"""
+
+    def test_counter_and_histogram_render(self):
+        """Test series names, label escaping and cumulative buckets"""
+        counter = Counter("test_things_total", "Things", ["kind"])
+        self.addCleanup(REGISTRY.remove, counter)
+        counter.inc(kind='a"b')
+        counter.inc(2, kind='a"b')
+        self.assertIn('test_things_total{kind="a\\"b"} 3', counter.render())
+
+        histogram = Histogram("test_seconds", "Time", ["site"], buckets=(0.1, 1))
+        self.addCleanup(REGISTRY.remove, histogram)
+        histogram.observe(0.05, site="x")
+        histogram.observe(0.5, site="x")
+        lines = histogram.render().splitlines()
+        self.assertIn("# TYPE test_seconds histogram", lines)
+        self.assertIn('test_seconds_bucket{site="x",le="0.1"} 1', lines)
+        self.assertIn('test_seconds_bucket{site="x",le="1"} 2', lines)
+        self.assertIn('test_seconds_bucket{site="x",le="+Inf"} 2', lines)
+        self.assertIn('test_seconds_count{site="x"} 2', lines)
+
+
+@override_settings(
+    OPENAI_MODEL_PRICES={"gpt-4o-mini": {"prompt": 0.15, "completion": 0.60}},
+    METRICS_TOKEN="",
+)
+class OpenAICallInstrumentationTests(TestCase):
+    """Test that openai_call() records metrics and usage totals"""
+
+    def setUp(self):
+        cache.clear()
+
+    def call(self, call_site, response):
+        return openai_call(
+            mock_client([response]),
+            "chat.completions",
+            call_site=call_site,
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "hi"}],
+        )
+
+    def test_usage_is_totalled_and_persisted(self):
+        """Test token and cost totals, and their persistence on a ContentItem"""
+        item = ContentItem.objects.create(
+            detail=ContentDetail.objects.create(title="Usage"), prompt="p"
+        )
+        with collect_openai_usage() as usage:
+            self.call(
+                "usage_test", httpx.Response(200, json={**COMPLETION, "usage": USAGE})
+            )
+            # A stand-in server may leave usage out; the call still counts.
+            self.call("usage_test", httpx.Response(200, json=COMPLETION))
+
+        self.assertEqual(usage.calls, 2)
+        self.assertEqual((usage.prompt_tokens, usage.completion_tokens), (1000, 500))
+        self.assertEqual(usage.cost, Decimal("0.00045"))
+
+        usage.apply_to(item, save=True)
+        item.refresh_from_db()
+        self.assertEqual(item.openai_calls, 2)
+        self.assertEqual(item.openai_completion_tokens, 500)
+        self.assertEqual(item.openai_cost_usd, Decimal("0.00045"))
+
+    def test_metrics_endpoint_exports_calls(self):
+        """Test that /metrics shows duration, tokens and errors per call site"""
+        self.call(
+            "metrics_test", httpx.Response(200, json={**COMPLETION, "usage": USAGE})
+        )
+        with self.assertRaises(BadRequestError):
+            self.call("metrics_test", httpx.Response(400, json={}))
+
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn(
+            'parodynews_openai_tokens_total{call_site="metrics_test",'
+            'model="gpt-4o-mini",kind="prompt"} 1000',
+            body,
+        )
+        self.assertIn(
+            'parodynews_openai_call_duration_seconds_count{call_site="metrics_test",'
+            'endpoint="chat.completions",model="gpt-4o-mini",outcome="BadRequestError"} 1',
+            body,
+        )
+
+    @override_settings(METRICS_TOKEN="scrape-secret")
+    def test_metrics_token_is_required_when_set(self):
+        """Test that scrapes need the bearer token once one is configured"""
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url).status_code, 403)
+        response = self.client.get(url, HTTP_AUTHORIZATION="Bearer scrape-secret")
+        self.assertEqual(response.status_code, 200)
+
+    def test_metrics_without_token_only_serve_allowed_networks(self):
+        """Test that without a token only local scrapers are served"""
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(
+            self.client.get(url, REMOTE_ADDR="203.0.113.7").status_code, 403
+        )
+        with override_settings(METRICS_ALLOWED_NETWORKS=["203.0.113.0/24"]):
+            response = self.client.get(url, REMOTE_ADDR="203.0.113.7")
+        self.assertEqual(response.status_code, 200)
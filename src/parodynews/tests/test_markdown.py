@@ -0,0 +1,65 @@
+"""
+File: test_markdown.py
+Description: Tests for the JSON to Markdown renderer
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_markdown
+"""
+
+from django.test import SimpleTestCase
+
+from parodynews.utils.markdown import iter_markdown, json_to_markdown
+
+
+def _reference_markdown(data, level=1):
+    """Original recursive implementation, kept to pin the output format."""
+    markdown = ""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            markdown += f"{'#' * level} {key}\n\n"
+            markdown += _reference_markdown(value, level + 1)
+    elif isinstance(data, list):
+        for item in data:
+            markdown += f"* {_reference_markdown(item, level + 1)}\n"
+    else:
+        markdown += f"{data}\n\n"
+    return markdown
+
+
+class JsonToMarkdownTests(SimpleTestCase):
+    """Test the iterative Markdown renderer"""
+
+    def test_matches_recursive_output(self):
+        """Test that output is identical to the recursive renderer"""
+        samples = [
+            "plain",
+            42,
+            None,
+            {},
+            [],
+            {"Header": {"title": "Cat", "author": {"name": "Staff"}}},
+            {"Tags": ["a", {"b": [1, 2]}, []], "Body": "text"},
+            [[1, [2, [3]]], {"k": {}}],
+        ]
+        for sample in samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(json_to_markdown(sample), _reference_markdown(sample))
+
+    def test_yields_chunks(self):
+        """Test that the generator streams several fragments"""
+        chunks = list(iter_markdown({"a": 1, "b": [2, 3]}))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), json_to_markdown({"a": 1, "b": [2, 3]}))
+
+    def test_deep_nesting_does_not_recurse(self):
+        """Test that nesting beyond the recursion limit still renders"""
+        data = "leaf"
+        for _ in range(5000):
+            data = {"k": data}
+        output = json_to_markdown(data)
+        self.assertTrue(output.endswith("leaf\n\n"))
@@ -0,0 +1,190 @@
+"""
+File: test_metrics.py
+Description: Tests for request, database and cache metrics and multiprocess aggregation
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_metrics
+"""
+
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from parodynews import metrics
+from parodynews.metrics import (
+    MULTIPROC_DIR_ENV,
+    REGISTRY,
+    Counter,
+    Gauge,
+    mark_process_dead,
+    render_metrics,
+    write_snapshot,
+)
+
+
+def sample(text, series):
+    """Return the value of one exposition line, or 0 when it is absent."""
+    for line in text.splitlines():
+        if line.startswith(f"{series} "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0
+
+
+class RequestMetricsTests(TestCase):
+    """Test per-view latency and database metrics"""
+
+    def setUp(self):
+        caches["default"].clear()
+        self.user = get_user_model().objects.create_user(
+            username="scraper", password="correct-horse"
+        )
+        self.client.force_login(self.user)
+
+    def test_view_latency_and_queries_are_recorded(self):
+        """Test the request histogram and per-alias query counters"""
+        count = 'parodynews_http_request_duration_seconds_count{view="manage_post",method="GET",status="200"}'
+        queries = 'parodynews_db_queries_total{view="manage_post",alias="default"}'
+        before = render_metrics()
+
+        self.assertEqual(self.client.get(reverse("manage_post")).status_code, 200)
+
+        after = self.client.get(reverse("metrics")).content.decode()
+        self.assertEqual(sample(after, count) - sample(before, count), 1)
+        self.assertGreater(sample(after, queries), sample(before, queries))
+        self.assertIn(
+            'parodynews_db_query_duration_seconds_total{view="manage_post",alias="default"}',
+            after,
+        )
+
+    def test_unresolved_paths_share_one_label(self):
+        """Test that 404s for unknown URLs do not create a series per path"""
+        self.client.get("/no-such-page-a/")
+        self.client.get("/no-such-page-b/")
+        self.assertNotIn("no-such-page", render_metrics())
+        self.assertIn('view="unresolved"', render_metrics())
+
+
+class CacheMetricsTests(SimpleTestCase):
+    """Test cache hit and miss counting"""
+
+    def test_hits_and_misses_per_alias(self):
+        """Test get(), get_many() and get_or_set() lookups"""
+        cache = caches["default"]
+        cache.clear()
+        hit = 'parodynews_cache_requests_total{alias="default",result="hit"}'
+        miss = 'parodynews_cache_requests_total{alias="default",result="miss"}'
+        before = render_metrics()
+
+        self.assertIsNone(cache.get("metrics-absent"))
+        cache.set("metrics-present", 1)
+        self.assertEqual(cache.get("metrics-present"), 1)
+        cache.get_many(["metrics-present", "metrics-absent"])
+        cache.get_or_set("metrics-present", 2)
+
+        after = render_metrics()
+        self.assertEqual(sample(after, hit) - sample(before, hit), 3)
+        self.assertEqual(sample(after, miss) - sample(before, miss), 2)
+
+
+class MultiprocessTests(SimpleTestCase):
+    """Test aggregation of snapshots written by several processes"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        patcher = mock.patch.dict(os.environ, {MULTIPROC_DIR_ENV: self.directory.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.counter = Counter("test_mp_jobs_total", "Jobs", ["kind"])
+        self.busy = Gauge("test_mp_busy", "Busy threads")
+        self.memory = Gauge("test_mp_memory", "Memory", multiprocess_mode="all")
+        for metric in (self.counter, self.busy, self.memory):
+            self.addCleanup(REGISTRY.remove, metric)
+
+    def write_worker(self, pid, jobs, busy, memory):
+        """Write a snapshot as another worker process would."""
+        snapshot = {
+            "test_mp_jobs_total": {
+                "type": "counter",
+                "help": "Jobs",
+                "labelnames": ["kind"],
+                "series": [[["a"], jobs]],
+            },
+            "test_mp_busy": {
+                "type": "gauge",
+                "help": "Busy threads",
+                "labelnames": [],
+                "mode": "livesum",
+                "series": [[[], busy]],
+            },
+            "test_mp_memory": {
+                "type": "gauge",
+                "help": "Memory",
+                "labelnames": [],
+                "mode": "all",
+                "series": [[[], memory]],
+            },
+        }
+        with open(os.path.join(self.directory.name, f"{pid}.json"), "w") as file:
+            json.dump(snapshot, file)
+
+    def test_workers_are_merged(self):
+        """Test summed counters, live-summed gauges and per-pid gauges"""
+        self.counter.inc(2, kind="a")
+        self.busy.set(1)
+        self.memory.set(100)
+        self.write_worker(999991, jobs=3, busy=2, memory=200)
+
+        text = render_metrics()
+        self.assertEqual(sample(text, 'test_mp_jobs_total{kind="a"}'), 5)
+        self.assertEqual(sample(text, "test_mp_busy"), 3)
+        self.assertEqual(sample(text, 'test_mp_memory{pid="999991"}'), 200)
+        self.assertEqual(sample(text, f'test_mp_memory{{pid="{os.getpid()}"}}'), 100)
+        # The scraping process saved its own snapshot too.
+        write_snapshot()
+        self.assertIn(f"{os.getpid()}.json", os.listdir(self.directory.name))
+
+    def test_dead_worker_keeps_counters_only(self):
+        """Test that an exited worker's counters survive and its gauges go"""
+        self.write_worker(999991, jobs=3, busy=2, memory=200)
+        self.write_worker(999992, jobs=4, busy=5, memory=300)
+        mark_process_dead(999991)
+        mark_process_dead(999992)
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory.name)), [metrics.ARCHIVE_FILE]
+        )
+        text = render_metrics()
+        self.assertEqual(sample(text, 'test_mp_jobs_total{kind="a"}'), 7)
+        self.assertEqual(sample(text, "test_mp_busy"), 0)
+        self.assertNotIn('pid="999991"', text)
+
+    def test_forked_child_starts_from_zero(self):
+        """Test that a child does not re-count its parent's values"""
+        self.counter.inc(5, kind="a")
+        metrics._reset_after_fork()
+        self.assertNotIn("test_mp_jobs_total{", self.counter.render())
+
+    def test_shared_directory_is_refused(self):
+        """Test that startup refuses a directory other users can reach"""
+        self.write_worker(999993, jobs=1, busy=0, memory=0)
+        os.chmod(self.directory.name, 0o777)
+        with self.assertRaises(PermissionError):
+            metrics.clear_multiprocess_dir()
+        self.assertIn("999993.json", os.listdir(self.directory.name))
+
+        os.chmod(self.directory.name, 0o700)
+        metrics.clear_multiprocess_dir()
+        self.assertEqual(os.listdir(self.directory.name), [])
@@ -0,0 +1,63 @@
+"""
+File: test_middleware.py
+Description: Tests for cached sessions and the cached request.user middleware
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_middleware
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from parodynews.middleware import user_cache_key
+
+
+class CachedAuthenticationTests(TestCase):
+    """Test that authenticated requests skip the session and user queries"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="reader", password="correct-horse"
+        )
+        self.client.force_login(self.user)
+
+    def auth_queries(self, path="/posts/"):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        table = get_user_model()._meta.db_table
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if "django_session" in query["sql"] or f'"{table}"' in query["sql"]
+        ]
+
+    def test_warm_request_has_no_auth_queries(self):
+        """Test that the session and user both come from the cache"""
+        self.auth_queries()
+        self.assertEqual(self.auth_queries(), [])
+
+    def test_user_save_invalidates_cache(self):
+        """Test that saving the user drops the cached copy"""
+        self.auth_queries()
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+        self.user.first_name = "Changed"
+        self.user.save()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+    def test_password_change_logs_out_other_sessions(self):
+        """Test that session hash verification still uses the fresh user"""
+        self.auth_queries()
+        self.user.set_password("new-password")
+        self.user.save()
+        response = self.client.get("/posts/")
+        self.assertEqual(response.status_code, 302)
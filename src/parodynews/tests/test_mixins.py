@@ -0,0 +1,56 @@
+"""
+File: test_mixins.py
+Description: Tests for the memoised model metadata of ModelFieldsMixin
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_mixins
+"""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from parodynews.mixins import ModelFieldsMixin, get_model_metadata
+from parodynews.models import ContentDetail
+
+
+class ContentDetailFieldsView(ModelFieldsMixin):
+    model = ContentDetail
+
+
+class ModelFieldsMixinTests(SimpleTestCase):
+    """Test that model metadata is computed once per model class"""
+
+    def setUp(self):
+        get_model_metadata.cache_clear()
+
+    def test_display_fields_class_attribute(self):
+        """Test that display fields are available without an instance"""
+        self.assertEqual(
+            ContentDetailFieldsView.display_fields,
+            tuple(ContentDetail().get_display_fields()),
+        )
+
+    def test_model_instantiated_once(self):
+        """Test that repeated requests reuse the cached metadata"""
+        with mock.patch.object(
+            ContentDetail,
+            "get_display_fields",
+            autospec=True,
+            return_value=["title"],
+        ) as display_fields:
+            for _ in range(3):
+                fields, names = ContentDetailFieldsView().get_model_fields()
+        self.assertEqual(display_fields.call_count, 1)
+        self.assertEqual(names, ("title",))
+        self.assertIs(fields, get_model_metadata(ContentDetail).fields)
+
+    def test_missing_model(self):
+        """Test that a view without a model still fails loudly"""
+        with self.assertRaises(ValueError):
+            ModelFieldsMixin().get_model_fields()
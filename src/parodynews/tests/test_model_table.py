@@ -0,0 +1,110 @@
+"""
+File: test_model_table.py
+Description: Tests for the render_model_table tag and its row fragment cache
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_model_table
+"""
+
+from django.contrib.auth.models import Permission
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db.models.deletion import Collector
+from django.db.models.signals import post_delete, post_save
+from django.template import Context, Template
+from django.test import TestCase
+
+from parodynews.models import ContentDetail, ContentItem
+from parodynews.utils.fragments import (
+    _generation_key,
+    bump_model_generation,
+    get_model_generation,
+)
+
+TABLE = Template(
+    "{% load custom_filters %}"
+    "{% render_model_table objects fields display_fields 'content_detail' %}"
+)
+
+
+class ModelTableCacheTests(TestCase):
+    """Test per-row fragment caching with generation-based invalidation"""
+
+    def setUp(self):
+        cache.clear()
+        self.detail = ContentDetail.objects.create(title="First title")
+
+    def render(self):
+        return TABLE.render(
+            Context(
+                {
+                    "objects": ContentDetail.objects.all(),
+                    "fields": ContentDetail._meta.get_fields(),
+                    "display_fields": ContentDetail().get_display_fields(),
+                }
+            )
+        )
+
+    def test_rows_rendered_and_cached(self):
+        """Test that rows render once and are then served from the cache"""
+        html = self.render()
+        self.assertIn("First title", html)
+        self.assertIn(f"/content/{self.detail.pk}", html)
+
+        # Changing the row behind the cache's back proves the cached copy is used.
+        ContentDetail.objects.filter(pk=self.detail.pk).update(title="Hidden")
+        self.assertIn("First title", self.render())
+
+    def test_save_invalidates_rows(self):
+        """Test that saving an instance bumps its model generation"""
+        self.render()
+        generation = get_model_generation(ContentDetail)
+
+        self.detail.title = "Second title"
+        self.detail.save()
+
+        self.assertGreater(get_model_generation(ContentDetail), generation)
+        html = self.render()
+        self.assertIn("Second title", html)
+        self.assertNotIn("First title", html)
+
+    def test_save_invalidates_referencing_models(self):
+        """Test that saving a related object invalidates rows that display it"""
+        generation = get_model_generation(ContentItem)
+        self.detail.save()
+        self.assertGreater(get_model_generation(ContentItem), generation)
+
+    def test_evicted_generation_does_not_revive_rows(self):
+        """Test that a reseeded generation never reuses an earlier value"""
+        self.render()
+        # A change shown in the row that leaves its updated_at alone, such as
+        # an edit to a related object, only bumps the generation.
+        ContentDetail.objects.filter(pk=self.detail.pk).update(title="Second title")
+        bump_model_generation(ContentDetail)
+        self.assertIn("Second title", self.render())
+
+        # Lose the counter but keep the rows, as an LRU eviction can. Neither
+        # reading nor bumping it again may land on a generation already used.
+        cache.delete(_generation_key(ContentDetail))
+        self.assertIn("Second title", self.render())
+        bump_model_generation(ContentDetail)
+        self.assertIn("Second title", self.render())
+
+    def test_empty_listing(self):
+        """Test the empty-state row"""
+        ContentDetail.objects.all().delete()
+        self.assertIn("No items found", self.render())
+
+    def test_other_apps_keep_fast_deletes(self):
+        """Test that the receivers do not listen to models of other apps"""
+        collector = Collector(using="default")
+        self.assertTrue(collector.can_fast_delete(Session.objects.all()))
+        # Permission's own cascades rule out fast deletes; it must still not
+        # gain per-row signals.
+        self.assertFalse(post_delete.has_listeners(Permission))
+        self.assertFalse(post_save.has_listeners(Session))
@@ -0,0 +1,71 @@
+"""
+File: test_page_cache.py
+Description: Tests for per-view page caching with tag-based invalidation
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_page_cache
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import Client, TestCase
+
+from parodynews.models import Post
+from parodynews.page_cache import PAGE_CACHE_HEADER, _tag_key
+
+
+class PageCacheTests(TestCase):
+    """Test cached pages for ManagePostView"""
+
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="writer", password="pw-12345")
+        self.other = User.objects.create_user(username="editor", password="pw-12345")
+        self.client.force_login(self.user)
+
+    def get(self, client=None):
+        response = (client or self.client).get("/posts/")
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_second_request_served_from_cache(self):
+        """Test a miss followed by a private cached hit"""
+        self.assertEqual(self.get()[PAGE_CACHE_HEADER], "miss")
+        response = self.get()
+        self.assertEqual(response[PAGE_CACHE_HEADER], "hit")
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_pages_not_shared_between_users(self):
+        """Test that another user's session gets its own page"""
+        self.get()
+        other = Client()
+        other.force_login(self.other)
+        self.assertEqual(self.get(other)[PAGE_CACHE_HEADER], "miss")
+
+    def test_model_save_invalidates_tagged_pages(self):
+        """Test that saving a Post bumps the "post" tag"""
+        self.get()
+        post = Post.objects.create(user=self.user, filename="new-post.md")
+        response = self.get()
+        self.assertEqual(response[PAGE_CACHE_HEADER], "miss")
+        self.assertContains(response, f"/posts/{post.pk}/")
+
+    def test_evicted_tag_version_does_not_revive_pages(self):
+        """Test that a reseeded tag version never reuses an earlier value"""
+        self.get()
+        Post.objects.create(user=self.user, filename="new-post.md")
+        self.get()
+
+        # Lose the tag counter but keep the pages, as an LRU eviction can.
+        cache.delete(_tag_key("post"))
+        post = Post.objects.create(user=self.user, filename="other-post.md")
+        cache.delete(_tag_key("post"))
+        response = self.get()
+        self.assertEqual(response[PAGE_CACHE_HEADER], "miss")
+        self.assertContains(response, f"/posts/{post.pk}/")
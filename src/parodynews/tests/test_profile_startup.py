@@ -0,0 +1,63 @@
+"""
+File: test_profile_startup.py
+Description: Tests for the profile_startup management command
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_profile_startup
+"""
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from parodynews.management.commands.profile_startup import parse_importtime
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       4000 | parodynews.views
+"""
+
+
+class ProfileStartupTests(SimpleTestCase):
+    """Test the cold-start profile report, artifact and regression gate"""
+
+    def test_parse_importtime(self):
+        """Test that the header is skipped and nesting indentation stripped"""
+        self.assertEqual(
+            parse_importtime(IMPORTTIME),
+            [
+                {"module": "_io", "self_us": 120, "cumulative_us": 120},
+                {"module": "parodynews.views", "self_us": 2500, "cumulative_us": 4000},
+            ],
+        )
+
+    def test_profile_artifact_and_compare(self):
+        """Test a real profile run, its JSON artifact and the comparison"""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "startup.json")
+            stdout = StringIO()
+            call_command("profile_startup", top=3, output=output, stdout=stdout)
+
+            with open(output) as file:
+                profile = json.load(file)
+            self.assertIn("parodynews", profile["ready"])
+            self.assertGreater(profile["urls"], 0)
+            self.assertTrue(profile["imports"])
+            self.assertIn("Slowest imports", stdout.getvalue())
+
+            baseline = os.path.join(tmp, "baseline.json")
+            with open(baseline, "w") as file:
+                json.dump({"total": profile["total"] / 10}, file)
+            with self.assertRaises(CommandError):
+                call_command(
+                    "profile_startup", top=0, compare=baseline, stdout=StringIO()
+                )
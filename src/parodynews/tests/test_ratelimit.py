@@ -0,0 +1,199 @@
+"""
+File: test_ratelimit.py
+Description: Tests for the shared OpenAI token-bucket rate limiter and retries
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+- httpx
+- openai
+
+Usage: python manage.py test parodynews.tests.test_ratelimit
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from openai import OpenAI, RateLimitError
+
+from parodynews.utils.ratelimit import (
+    RateLimitTimeout,
+    TokenBucket,
+    openai_call,
+    parse_duration,
+)
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "hello"},
+        }
+    ],
+}
+
+RATE_LIMIT_HEADERS = {
+    "x-ratelimit-limit-requests": "60",
+    "x-ratelimit-remaining-requests": "10",
+    "x-ratelimit-limit-tokens": "6000",
+    "x-ratelimit-remaining-tokens": "500",
+}
+
+
+class FakeClock(SimpleNamespace):
+    """Stand-in for the time module whose sleep() only advances time()."""
+
+    def __init__(self):
+        super().__init__(now=1e9, sleeps=[])
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def mock_client(responses, sent=None):
+    """Return an OpenAI client answering with the given httpx responses in turn."""
+    responses = iter(responses)
+    sent = [] if sent is None else sent
+
+    def handler(request):
+        sent.append(request)
+        return next(responses)
+
+    return OpenAI(
+        api_key="test",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+@override_settings(
+    OPENAI_RATE_LIMITS={"default": {"requests": 60, "tokens": 6000}},
+    OPENAI_RATE_LIMIT_MAX_WAIT=5,
+)
+class TokenBucketTests(TestCase):
+    """Test TokenBucket accounting"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_duration(self):
+        """Test the reset formats OpenAI sends"""
+        self.assertEqual(parse_duration("6m0s"), 360)
+        self.assertEqual(parse_duration("1.5s"), 1.5)
+        self.assertAlmostEqual(parse_duration("20ms"), 0.02)
+        self.assertIsNone(parse_duration("soon"))
+
+    def test_waits_for_refill_when_empty(self):
+        """Test that a call waits for one request to refill, then proceeds"""
+        clock = FakeClock()
+        with mock.patch("parodynews.utils.ratelimit.time", clock):
+            bucket = TokenBucket("gpt-test")
+            for _ in range(60):
+                self.assertEqual(bucket.acquire(), 0)
+            waited = bucket.acquire()
+        # 60 requests per minute refill at one per second.
+        self.assertEqual(len(clock.sleeps), 1)
+        self.assertGreaterEqual(waited, 1)
+
+    def test_gives_up_past_max_wait(self):
+        """Test that calls needing more than the max wait fail fast"""
+        bucket = TokenBucket("gpt-test")
+        bucket.acquire(tokens=6000, max_wait=0)
+        with self.assertRaises(RateLimitTimeout):
+            bucket.acquire(tokens=6000, max_wait=0)
+
+    def test_headers_correct_the_bucket(self):
+        """Test that x-ratelimit headers set capacity and lower remaining counts"""
+        bucket = TokenBucket("gpt-test")
+        bucket.update_from_headers(httpx.Headers(RATE_LIMIT_HEADERS))
+        state = cache.get(bucket.key)
+        self.assertEqual((state["rpm"], state["tpm"]), (60, 6000))
+        self.assertLessEqual(state["requests"], 10)
+        self.assertLessEqual(state["tokens"], 500)
+
+    def test_buckets_are_shared_through_the_cache(self):
+        """Test that separate limiter instances draw from one budget"""
+        TokenBucket("gpt-test").try_acquire(tokens=5000)
+        self.assertGreater(TokenBucket("gpt-test").try_acquire(tokens=5000), 0)
+        self.assertEqual(TokenBucket("other").try_acquire(tokens=5000), 0)
+
+
+@override_settings(
+    OPENAI_RATE_LIMITS={"default": {"requests": 600, "tokens": 60000}},
+    OPENAI_MAX_RETRIES=2,
+)
+class OpenAICallTests(TestCase):
+    """Test openai_call() scheduling and retries"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_returns_parsed_response_and_reads_headers(self):
+        """Test that the result is parsed and the bucket follows the headers"""
+        client = mock_client(
+            [httpx.Response(200, json=COMPLETION, headers=RATE_LIMIT_HEADERS)]
+        )
+        response = openai_call(
+            client,
+            "chat.completions",
+            bucket="gpt-4o-mini",
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "hi"}],
+        )
+        self.assertEqual(response.choices[0].message.content, "hello")
+        self.assertEqual(cache.get("openai_bucket:gpt-4o-mini")["rpm"], 60)
+
+    def test_retries_429_and_5xx_honouring_retry_after(self):
+        """Test that 429/5xx responses are retried and Retry-After is used"""
+        client = mock_client(
+            [
+                httpx.Response(429, json={}, headers={"retry-after": "3"}),
+                httpx.Response(503, json={}),
+                httpx.Response(200, json=COMPLETION),
+            ]
+        )
+        clock = FakeClock()
+        with mock.patch("parodynews.utils.ratelimit.time", clock):
+            response = openai_call(
+                client,
+                "chat.completions",
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "hi"}],
+            )
+        self.assertEqual(response.id, "chatcmpl-1")
+        # The 429 drains the shared bucket for Retry-After; the 503 backs off.
+        self.assertEqual(len(clock.sleeps), 2)
+        self.assertGreaterEqual(clock.sleeps[0], 3)
+        self.assertLessEqual(clock.sleeps[1], 1)
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error is raised once retries are exhausted"""
+        sent = []
+        client = mock_client([httpx.Response(429, json={})] * 3, sent)
+        with (
+            mock.patch("parodynews.utils.ratelimit.time", FakeClock()),
+            self.assertRaises(RateLimitError),
+        ):
+            openai_call(
+                client,
+                "chat.completions",
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "hi"}],
+            )
+        self.assertEqual(len(sent), 3)
@@ -0,0 +1,61 @@
+"""
+File: test_rendering.py
+Description: Tests for cached Markdown rendering of posts and content items
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_rendering
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import Client, TestCase
+
+from parodynews.models import Post
+from parodynews.utils import rendering
+
+
+class RenderMarkdownTests(TestCase):
+    """Test the content-hash keyed render cache"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_rendering_is_cached_by_content(self):
+        """Test that identical sources are rendered only once"""
+        with mock.patch.object(
+            rendering, "markdownify", wraps=rendering.markdownify
+        ) as spy:
+            first = rendering.render_markdown("**Title**")
+            second = rendering.render_markdown("**Title**")
+        self.assertEqual(first, second)
+        self.assertIn("<strong>Title</strong>", first)
+        self.assertEqual(spy.call_count, 1)
+
+    def test_changed_source_renders_again(self):
+        """Test that editing the source yields a fresh rendering"""
+        self.assertIn("Old", rendering.render_markdown("Old"))
+        self.assertIn("New", rendering.render_markdown("New"))
+
+    def test_template_filter(self):
+        """Test that the template filter outputs unescaped HTML"""
+        template = Template("{% load custom_filters %}{{ text|cached_markdownify }}")
+        html = template.render(Context({"text": "**bold**"}))
+        self.assertIn("<strong>bold</strong>", html)
+
+    def test_api_render_html(self):
+        """Test that ?render=html adds the rendered post content"""
+        post = Post.objects.create(post_content="*hello*")
+        client = Client()
+
+        response = client.get(f"/api/posts/{post.pk}/")
+        self.assertNotIn("rendered_html", response.json())
+
+        response = client.get(f"/api/posts/{post.pk}/?render=html")
+        self.assertEqual(response.json()["rendered_html"], "<em>hello</em>")
@@ -0,0 +1,166 @@
+"""
+File: test_resilience.py
+Description: Tests for the OpenAI circuit breaker and request hedging
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+- httpx
+- openai
+
+Usage: python manage.py test parodynews.tests.test_resilience
+"""
+
+import threading
+from unittest import mock
+
+import httpx
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from openai import BadRequestError
+
+from parodynews.tests.test_ratelimit import COMPLETION, FakeClock, mock_client
+from parodynews.utils import resilience
+from parodynews.utils.ratelimit import openai_call
+from parodynews.utils.resilience import CircuitBreaker, CircuitOpenError, hedged
+
+
+@override_settings(OPENAI_CIRCUIT_FAILURE_THRESHOLD=3)
+class CircuitBreakerTests(TestCase):
+    """Test CircuitBreaker state transitions"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the threshold of failures opens the circuit"""
+        breaker = CircuitBreaker()
+        for _ in range(2):
+            breaker.record_failure()
+            breaker.before_call()
+        breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            CircuitBreaker().before_call()
+
+    def test_success_resets_the_count(self):
+        """Test that only consecutive failures count"""
+        breaker = CircuitBreaker()
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.before_call()
+
+    def test_half_open_admits_one_probe(self):
+        """Test recovery: one probe passes, its outcome closes or reopens"""
+        breaker = CircuitBreaker()
+        for _ in range(3):
+            breaker.record_failure()
+        cache.delete(breaker.open_key)  # reset timeout elapsed
+
+        breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+        cache.delete(breaker.open_key)
+        breaker.before_call()
+        breaker.record_success()
+        breaker.before_call()
+        breaker.before_call()
+
+
+@override_settings(OPENAI_CIRCUIT_FAILURE_THRESHOLD=2, OPENAI_MAX_RETRIES=5)
+class OpenAICallCircuitTests(TestCase):
+    """Test that openai_call() fails fast once the circuit opens"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_stops_retrying_when_the_circuit_opens(self):
+        """Test that a failing API is not retried past the threshold"""
+        sent = []
+        client = mock_client([httpx.Response(503, json={})] * 6, sent)
+        with (
+            mock.patch("parodynews.utils.ratelimit.time", FakeClock()),
+            self.assertRaises(CircuitOpenError),
+        ):
+            openai_call(client, "chat.completions", model="m", messages=[])
+        self.assertEqual(len(sent), 2)
+
+        # Other calls fail immediately without a request.
+        with self.assertRaises(CircuitOpenError):
+            openai_call(client, "chat.completions", model="m", messages=[])
+        self.assertEqual(len(sent), 2)
+
+    def test_bad_requests_do_not_trip_the_circuit(self):
+        """Test that 4xx answers count as a healthy API"""
+        client = mock_client(
+            [httpx.Response(400, json={})] * 3 + [httpx.Response(200, json=COMPLETION)]
+        )
+        for _ in range(3):
+            with self.assertRaises(BadRequestError):
+                openai_call(client, "chat.completions", model="m", messages=[])
+        response = openai_call(client, "chat.completions", model="m", messages=[])
+        self.assertEqual(response.id, "chatcmpl-1")
+
+
+class HedgedTests(TestCase):
+    """Test hedged() racing of slow calls"""
+
+    def test_second_request_wins_when_first_is_slow(self):
+        """Test that a hedge is sent after the delay and the faster one is used"""
+        release = threading.Event()
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        try:
+            self.assertEqual(hedged(send, 0.01), "fast")
+        finally:
+            release.set()
+        self.assertEqual(len(calls), 2)
+
+    def test_no_hedge_for_fast_calls_or_when_refused(self):
+        """Test that fast calls and refused hedges send one request"""
+        calls = []
+
+        def send():
+            calls.append(1)
+            return "ok"
+
+        self.assertEqual(hedged(send, 5), "ok")
+        self.assertEqual(len(calls), 1)
+
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(0.05)
+            return "slow"
+
+        self.assertEqual(hedged(slow, 0.01, may_hedge=lambda: False), "slow")
+        self.assertEqual(len(calls), 2)
+
+    @override_settings(OPENAI_HEDGE_WORKERS=1)
+    def test_primary_does_not_queue_behind_busy_pool(self):
+        """Test that a saturated hedge pool does not delay the first request"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        with mock.patch("parodynews.utils.resilience._hedge_executor", None):
+            resilience._get_hedge_executor().submit(release.wait, 5)
+            hedges = []
+            self.assertEqual(
+                hedged(lambda: "primary", 1, may_hedge=lambda: hedges.append(1)),
+                "primary",
+            )
+        self.assertEqual(hedges, [])
@@ -0,0 +1,247 @@
+"""
+File: test_schemas.py
+Description: Tests for the schema registry, cached resolution and validators
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+- jsonschema
+
+Usage: python manage.py test parodynews.tests.test_schemas
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest import mock
+
+import httpx
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from parodynews.mixins import AppConfigClientMixin
+from parodynews.models import (
+    Assistant,
+    ContentDetail,
+    ContentItem,
+    JSONSchema,
+    Message,
+    OpenAIModel,
+    Thread,
+)
+from parodynews.tests.test_ratelimit import COMPLETION, mock_client
+from parodynews.utils import schemas
+from parodynews.utils.schemas import (
+    SchemaError,
+    SchemaValidationError,
+    get_file_schema,
+    get_validator,
+    resolve_schema,
+    validate_json_response,
+)
+
+ARTICLE = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}},
+    "required": ["title"],
+}
+
+
+class SchemaRegistryTests(TestCase):
+    """Test schema resolution, validation and invalidation"""
+
+    def setUp(self):
+        schemas.clear_schema_cache()
+
+    def test_file_schema_refs_resolved(self):
+        """Test that bundled schemas are resolved into plain dicts"""
+        parody = get_file_schema("parody_news_article_schema")
+        self.assertNotIn("$ref", json.dumps(parody))
+        self.assertEqual(
+            parody["properties"]["Metadata"]["title"],
+            get_file_schema("content_detail_schema")["title"],
+        )
+
+    def test_db_schema_ref_resolved_against_schema_dir(self):
+        """Test that DB schemas may reference bundled schema files"""
+        resolved = resolve_schema({"$ref": "./content_detail_schema.json"})
+        self.assertEqual(resolved["title"], "Content Detail")
+
+    def test_resolution_and_validator_cached_by_content(self):
+        """Test that equal schemas share one resolved form and validator"""
+        self.assertIs(resolve_schema(ARTICLE), resolve_schema(dict(ARTICLE)))
+        self.assertIs(get_validator(ARTICLE), get_validator(dict(ARTICLE)))
+
+    def test_validate_json_response(self):
+        """Test accepting valid and rejecting malformed responses"""
+        self.assertEqual(
+            validate_json_response(ARTICLE, '{"title": "Hi"}'), {"title": "Hi"}
+        )
+        with self.assertRaises(SchemaValidationError):
+            validate_json_response(ARTICLE, '{"body": "no title"}')
+        with self.assertRaises(SchemaValidationError):
+            validate_json_response(ARTICLE, "not json")
+
+    def test_keyed_lookups_skip_hashing(self):
+        """Test that a registry key replaces hashing the schema's content"""
+        validator = get_validator(ARTICLE, key="article:1")
+        with mock.patch.object(schemas, "schema_hash", side_effect=AssertionError):
+            self.assertIs(get_validator(ARTICLE, key="article:1"), validator)
+            validate_json_response(ARTICLE, '{"title": "Hi"}', key="article:1")
+
+    def test_registries_keep_recent_entries_only(self):
+        """Test that edited schemas do not grow the registries without bound"""
+        with mock.patch.object(schemas, "REGISTRY_SIZE", 2):
+            first = get_validator(ARTICLE, key="article:1")
+            get_validator(ARTICLE, key="article:2")
+            self.assertIs(get_validator(ARTICLE, key="article:1"), first)
+            get_validator(ARTICLE, key="article:3")
+        self.assertEqual(list(schemas._validators), ["article:1", "article:3"])
+        self.assertEqual(len(schemas._resolved_schemas), 2)
+
+    def test_jsonschema_cache_key_changes_on_save(self):
+        """Test that every saved version of a JSONSchema gets its own key"""
+        json_schema = JSONSchema(name="article", description="", schema=ARTICLE)
+        self.assertIsNone(json_schema.cache_key)
+        json_schema.save()
+        first = json_schema.cache_key
+        json_schema.save()
+        self.assertNotEqual(json_schema.cache_key, first)
+
+    def test_jsonschema_save_clears_registry(self):
+        """Test that saving a JSONSchema drops cached validators"""
+        validator = get_validator(ARTICLE)
+        JSONSchema.objects.create(name="article", description="", schema=ARTICLE)
+        self.assertIsNot(get_validator(ARTICLE), validator)
+
+
+class InvalidAssistantSchemaTests(TestCase):
+    """Test generating content with an assistant whose schema is invalid"""
+
+    def setUp(self):
+        cache.clear()
+        schemas.clear_schema_cache()
+        user = get_user_model().objects.create_user(username="writer", password="pw")
+        self.client.force_login(user)
+        assistant = Assistant.objects.create(
+            id="asst_broken",
+            model=OpenAIModel.objects.create(model_id="gpt-4o-mini"),
+            json_schema=JSONSchema.objects.create(
+                name="broken", description="", schema={"type": 12}
+            ),
+        )
+        self.detail = ContentDetail.objects.create(title="Draft", user=user)
+        ContentItem.objects.create(
+            detail=self.detail, assistant=assistant, prompt="p", line_number=1
+        )
+
+    def test_rejected_before_the_openai_call(self):
+        """Test a message instead of a 500, with no request sent"""
+        sent = []
+        with mock.patch.object(
+            AppConfigClientMixin, "get_client", return_value=mock_client([], sent)
+        ):
+            response = self.client.post(
+                reverse("content_detail", args=[self.detail.pk]),
+                {"_method": "generate_content", "content_detail_id": self.detail.pk},
+            )
+
+        self.assertRedirects(
+            response,
+            reverse("content_detail", args=[self.detail.pk]),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(sent, [])
+        [message] = get_messages(response.wsgi_request)
+        self.assertIn("JSON schema is invalid", str(message))
+        with self.assertRaises(SchemaError):
+            get_validator({"type": 12})
+
+
+class RejectedContentDetailTests(TestCase):
+    """Test thread views when the generated metadata does not match its schema"""
+
+    def setUp(self):
+        cache.clear()
+        schemas.clear_schema_cache()
+        user = get_user_model().objects.create_user(username="writer", password="pw")
+        self.client.force_login(user)
+        item = ContentItem.objects.create(
+            detail=ContentDetail.objects.create(title="Draft", user=user),
+            prompt="p",
+            content_text="Some article",
+        )
+        self.thread = Thread.objects.create(id="thread_1", name="Thread", user=user)
+        self.message = Message.objects.create(
+            id="msg_1", thread=self.thread, contentitem=item
+        )
+
+    def post(self, method):
+        completion = {**COMPLETION, "choices": [dict(COMPLETION["choices"][0])]}
+        completion["choices"][0]["message"] = {"role": "assistant", "content": "{}"}
+        client = mock_client([httpx.Response(200, json=completion)])
+        with mock.patch.object(AppConfigClientMixin, "get_client", return_value=client):
+            return self.client.post(
+                reverse("process_content"),
+                {
+                    "_method": method,
+                    "message_id": self.message.pk,
+                    "thread_id": self.thread.pk,
+                },
+            )
+
+    def assert_rejected(self, response):
+        self.assertRedirects(
+            response,
+            reverse(
+                "thread_message_detail",
+                kwargs={"thread_id": self.thread.pk, "message_id": self.message.pk},
+            ),
+            fetch_redirect_response=False,
+        )
+        [message] = get_messages(response.wsgi_request)
+        self.assertIn("Generated content was rejected", str(message))
+
+    def test_create_content(self):
+        """Test a message instead of a 500 when creating content"""
+        self.assert_rejected(self.post("create_content"))
+
+    def test_create_post(self):
+        """Test a message instead of a 500 when creating a post"""
+        self.assert_rejected(self.post("create_post"))
+
+
+class LazyUtilsPackageTests(TestCase):
+    """Test that parodynews.utils resolves its exports on first access"""
+
+    def test_exports_resolve_lazily(self):
+        """Test that every name in __all__ maps to its submodule"""
+        import parodynews.utils as utils
+
+        self.assertEqual(set(utils.__all__), set(utils._LAZY_ATTRS))
+        self.assertIs(utils.get_file_schema, get_file_schema)
+        with self.assertRaises(AttributeError):
+            utils.not_a_helper  # noqa: B018
+
+    def test_django_setup_skips_validation_libraries(self):
+        """Test that app startup does not import jsonschema or jsonref"""
+        code = (
+            "import sys, django; django.setup(); import parodynews.utils; "
+            "print(sorted({'jsonschema', 'jsonref'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+            env=os.environ,
+            text=True,
+        )
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
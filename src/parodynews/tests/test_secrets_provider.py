@@ -0,0 +1,119 @@
+"""
+File: test_secrets_provider.py
+Description: Tests for lazily resolved secrets and their disk cache
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_secrets_provider
+"""
+
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from barodybroject.secrets_provider import (
+    AWSSecretsBackend,
+    FileSecretsBackend,
+    LazySecrets,
+    NullSecretsBackend,
+    SecretsBackend,
+    get_backend,
+    get_secrets,
+)
+
+
+class CountingBackend(SecretsBackend):
+    def __init__(self, secrets):
+        self.secrets = secrets
+        self.calls = 0
+
+    def load(self):
+        self.calls += 1
+        return dict(self.secrets)
+
+
+class LazySecretsTests(SimpleTestCase):
+    """Test lazy resolution, the disk cache and backend selection"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, "secrets.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_backend_loaded_on_first_lookup_only(self):
+        """Test that nothing is fetched until a secret is read"""
+        backend = CountingBackend({"DJANGO_SECRET_KEY": "abc"})
+        secrets = LazySecrets(backend, cache_path=self.cache_path)
+        self.assertEqual(backend.calls, 0)
+        self.assertEqual(secrets.get("DJANGO_SECRET_KEY"), "abc")
+        self.assertEqual(secrets.get("MISSING", ""), "")
+        self.assertEqual(backend.calls, 1)
+
+    def test_disk_cache_shared_until_ttl(self):
+        """Test that a fresh cache file spares other processes the fetch"""
+        LazySecrets(CountingBackend({"A": "1"}), cache_path=self.cache_path).resolve()
+        self.assertEqual(os.stat(self.cache_path).st_mode & 0o777, 0o600)
+
+        backend = CountingBackend({"A": "2"})
+        self.assertEqual(
+            LazySecrets(backend, cache_path=self.cache_path, ttl=60).get("A"), "1"
+        )
+        self.assertEqual(backend.calls, 0)
+
+        expired = time.time() - 120
+        os.utime(self.cache_path, (expired, expired))
+        self.assertEqual(
+            LazySecrets(backend, cache_path=self.cache_path, ttl=60).get("A"), "2"
+        )
+
+    def test_cache_not_trusted_unless_private(self):
+        """Test that a cache file others can write to is ignored"""
+        LazySecrets(CountingBackend({"A": "1"}), cache_path=self.cache_path).resolve()
+        os.chmod(self.cache_path, 0o664)
+        backend = CountingBackend({"A": "2"})
+        with self.assertLogs("barodybroject.secrets_provider", "WARNING"):
+            secrets = LazySecrets(backend, cache_path=self.cache_path, ttl=60)
+            self.assertEqual(secrets.get("A"), "2")
+        self.assertEqual(backend.calls, 1)
+
+        os.chmod(self.cache_path, 0o600)
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):
+            secrets = LazySecrets(backend, cache_path=self.cache_path, ttl=60)
+            self.assertEqual(secrets.get("A"), "2")
+        self.assertEqual(backend.calls, 2)
+
+    def test_disk_cache_off_by_default(self):
+        """Test that secrets are not written to disk unless a path is set"""
+        with (
+            mock.patch.dict(os.environ, {"SECRETS_BACKEND": "file"}),
+            mock.patch("barodybroject.secrets_provider._secrets", None),
+        ):
+            os.environ.pop("SECRETS_CACHE_PATH", None)
+            self.assertFalse(get_secrets().cache_path)
+
+    def test_file_backend_stand_in(self):
+        """Test the local JSON file backend"""
+        path = os.path.join(self.tmp.name, "local.json")
+        with open(path, "w") as file:
+            json.dump({"GITHUB_ISSUE_REPO": "owner/repo"}, file)
+        backend = get_backend({"SECRETS_BACKEND": "file", "SECRETS_FILE": path})
+        self.assertIsInstance(backend, FileSecretsBackend)
+        self.assertEqual(backend.load(), {"GITHUB_ISSUE_REPO": "owner/repo"})
+
+    def test_backend_defaults(self):
+        """Test that AWS is only used in production with credentials"""
+        self.assertIsInstance(get_backend({}), NullSecretsBackend)
+        self.assertIsInstance(
+            get_backend({"RUNNING_IN_PRODUCTION": "True", "AWS_ACCESS_KEY_ID": "x"}),
+            AWSSecretsBackend,
+        )
@@ -0,0 +1,317 @@
+"""
+File: test_sync.py
+Description: Tests for OpenAI assistant, model and thread message synchronisation
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+- httpx
+- openai
+
+Usage: python manage.py test parodynews.tests.test_sync
+"""
+
+import httpx
+from django.core.cache import cache
+from django.test import TestCase
+from openai import OpenAI
+from openai.types import Model as RemoteModel
+from openai.types.beta import Assistant as RemoteAssistant
+from openai.types.beta.threads import Message as RemoteMessage
+
+from parodynews.metrics import render_metrics
+from parodynews.models import (
+    Assistant,
+    ContentDetail,
+    ContentItem,
+    JSONSchema,
+    Message,
+    OpenAIModel,
+    Thread,
+)
+from parodynews.utils.assistants import get_model_choices
+from parodynews.utils.resilience import CircuitBreaker, CircuitOpenError
+from parodynews.utils.sync import sync_assistants, sync_models, sync_thread_messages
+from parodynews.utils.threads import openai_list_messages
+
+
+def remote(index, **overrides):
+    data = {
+        "id": f"asst_{index:03d}",
+        "object": "assistant",
+        "created_at": 1700000000 + index,
+        "name": f"Assistant {index}",
+        "description": None,
+        "instructions": f"Instructions {index}",
+        "model": "gpt-4o" if index % 2 else "gpt-4o-mini",
+        "tools": [{"type": "code_interpreter"}],
+        "metadata": {},
+        "temperature": 1.0,
+        "top_p": 1.0,
+        "response_format": "auto",
+    }
+    data.update(overrides)
+    return RemoteAssistant.model_validate(data)
+
+
+class FakeListAPI:
+    """Serves objects in cursor pages like the OpenAI list endpoints, over HTTP."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+        self.client = OpenAI(
+            api_key="test",
+            http_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: self.handle(request))
+            ),
+        )
+
+    def handle(self, request):
+        after = request.url.params.get("after")
+        limit = int(request.url.params.get("limit", 20))
+        self.calls.append(after)
+        ids = [item.id for item in self.items]
+        start = ids.index(after) + 1 if after else 0
+        data = self.items[start : start + limit]
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "data": [item.model_dump(mode="json", by_alias=True) for item in data],
+                "has_more": start + limit < len(self.items),
+            },
+        )
+
+
+class SyncAssistantsTests(TestCase):
+    """Test sync_assistants() against a paged fake API"""
+
+    def setUp(self):
+        cache.clear()
+        self.api = FakeListAPI([remote(i) for i in range(1, 26)])
+        self.client_ = self.api.client
+
+    def test_pages_through_every_assistant(self):
+        """Test that all pages are fetched and every assistant is created"""
+        result = sync_assistants(self.client_, page_size=10)
+        self.assertEqual((result.pages, result.fetched, result.created), (3, 25, 25))
+        self.assertEqual(self.api.calls, [None, "asst_010", "asst_020"])
+        self.assertEqual(Assistant.objects.count(), 25)
+        self.assertEqual(OpenAIModel.objects.count(), 2)
+        self.assertEqual(Assistant.objects.get(id="asst_003").model.model_id, "gpt-4o")
+
+    def test_second_run_only_writes_changes(self):
+        """Test that unchanged assistants are skipped and edits are applied"""
+        sync_assistants(self.client_, page_size=10)
+        self.api.items[4] = remote(5, instructions="Rewritten")
+
+        with self.assertNumQueries(7):
+            # One diff query per page, then a savepoint around the model
+            # lookup and a single assistant upsert.
+            result = sync_assistants(self.client_, page_size=10)
+        self.assertEqual((result.updated, result.unchanged), (1, 24))
+        self.assertEqual(Assistant.objects.get(id="asst_005").instructions, "Rewritten")
+
+    def test_json_schema_response_format(self):
+        """Test that response-format schemas are created and linked"""
+        self.api.items = [
+            remote(
+                1,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "article",
+                        "description": "Article",
+                        "schema": {"type": "object"},
+                    },
+                },
+            )
+        ]
+        sync_assistants(self.client_)
+        schema = JSONSchema.objects.get(name="article")
+        self.assertEqual(schema.schema, {"type": "object"})
+        self.assertEqual(Assistant.objects.get().json_schema, schema)
+
+        # A changed schema gets a new registry key, so other processes stop
+        # using the version they resolved before.
+        key = schema.cache_key
+        self.api.items = [
+            remote(
+                1,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "article",
+                        "description": "Article",
+                        "schema": {"type": "array"},
+                    },
+                },
+            )
+        ]
+        sync_assistants(self.client_)
+        schema.refresh_from_db()
+        self.assertEqual(schema.schema, {"type": "array"})
+        self.assertNotEqual(schema.cache_key, key)
+
+    def test_dry_run_writes_nothing(self):
+        """Test that a dry run only reports"""
+        result = sync_assistants(self.client_, dry_run=True)
+        self.assertEqual(result.created, 25)
+        self.assertFalse(Assistant.objects.exists())
+
+
+class SyncModelsTests(TestCase):
+    """Test sync_models() and the cached model choices"""
+
+    def setUp(self):
+        cache.clear()
+        self.listed = ["gpt-4o", "gpt-4o-mini"]
+        self.client_ = FakeListAPI(
+            [
+                RemoteModel(id=model_id, object="model", created=0, owned_by="openai")
+                for model_id in self.listed
+            ]
+        ).client
+
+    def test_upsert_is_one_statement(self):
+        """Test that the catalogue is written with a single upsert"""
+        OpenAIModel.objects.create(model_id="gpt-4o", description="Curated")
+        with self.assertNumQueries(3):  # Savepoint, upsert, release
+            result = sync_models(self.client_)
+        self.assertEqual(result.fetched, 2)
+        self.assertEqual(
+            OpenAIModel.objects.get(model_id="gpt-4o").description, "Curated"
+        )
+        self.assertTrue(OpenAIModel.objects.filter(model_id="gpt-4o-mini").exists())
+        self.assertIn(
+            'parodynews_openai_call_duration_seconds_count{call_site="sync_models",'
+            'endpoint="models",model="unknown",outcome="ok"}',
+            render_metrics(),
+        )
+
+    def test_prune_keeps_models_in_use(self):
+        """Test that pruning removes retired models unless an assistant uses one"""
+        unused = OpenAIModel.objects.create(model_id="gpt-3")
+        used = OpenAIModel.objects.create(model_id="gpt-3.5-turbo")
+        Assistant.objects.create(id="asst_old", name="Old", model=used)
+
+        result = sync_models(self.client_, prune=True)
+        self.assertEqual((result.pruned, result.kept), (1, 1))
+        self.assertFalse(OpenAIModel.objects.filter(pk=unused.pk).exists())
+        self.assertTrue(OpenAIModel.objects.filter(pk=used.pk).exists())
+
+    def test_model_choices_follow_sync(self):
+        """Test that cached form choices are refreshed by a sync"""
+        self.assertEqual(get_model_choices(), ())
+        with self.captureOnCommitCallbacks(execute=True):
+            sync_models(self.client_)
+        with self.assertNumQueries(1):
+            choices = [model_id for _, model_id in get_model_choices()]
+            get_model_choices()
+        self.assertEqual(choices, self.listed)
+
+
+def remote_message(index, thread_id="thread_1", **overrides):
+    data = {
+        "id": f"msg_{index:03d}",
+        "object": "thread.message",
+        "created_at": 1700000000 + index,
+        "thread_id": thread_id,
+        "role": "assistant",
+        "status": "completed",
+        "assistant_id": "asst_writer",
+        "run_id": f"run_{index}",
+        "attachments": [],
+        "metadata": {},
+        "content": [
+            {"type": "text", "text": {"value": f"Reply {index}", "annotations": []}}
+        ],
+    }
+    data.update(overrides)
+    return RemoteMessage.model_validate(data)
+
+
+class SyncThreadMessagesTests(TestCase):
+    """Test incremental sync_thread_messages()"""
+
+    def setUp(self):
+        cache.clear()
+        Assistant.objects.create(id="asst_writer", name="Writer")
+        self.detail = ContentDetail.objects.create(title="Article")
+        self.thread = Thread.objects.create(id="thread_1", name="Thread")
+        first = ContentItem.objects.create(
+            detail=self.detail, content_text="Prompt", prompt=""
+        )
+        Message.objects.create(id="msg_000", thread=self.thread, contentitem=first)
+
+        self.api = FakeListAPI([remote_message(i) for i in range(1, 13)])
+        self.client_ = self.api.client
+
+    def test_default_page_size_is_the_api_maximum(self):
+        """Test that a thread is listed 100 messages per request"""
+        self.api.items = [remote_message(i) for i in range(1, 151)]
+        sync_thread_messages(self.client_, self.thread)
+        self.assertEqual(self.api.calls, [None, "msg_100"])
+
+        self.api.calls.clear()
+        listed = openai_list_messages(self.client_, "thread_1")
+        self.assertEqual(len(listed), 150)
+        self.assertEqual(self.api.calls, [None, "msg_100"])
+
+    def test_first_sync_pages_and_creates_rows(self):
+        """Test that every page is copied with numbered content items"""
+        result = sync_thread_messages(self.client_, self.thread, page_size=5)
+        self.assertEqual((result.pages, result.created), (3, 12))
+        self.assertEqual(self.api.calls, [None, "msg_005", "msg_010"])
+
+        message = Message.objects.get(id="msg_012")
+        self.assertEqual(message.contentitem.content_text, "Reply 12")
+        self.assertEqual(message.contentitem.line_number, 13)
+        self.assertEqual(message.assistant_id, "asst_writer")
+        self.thread.refresh_from_db()
+        self.assertEqual(self.thread.last_synced_message_id, "msg_012")
+
+    def test_second_sync_fetches_only_the_delta(self):
+        """Test that later syncs resume after the stored cursor"""
+        sync_thread_messages(self.client_, self.thread)
+        self.api.items.append(remote_message(13, assistant_id="asst_unknown"))
+        self.api.calls.clear()
+
+        result = sync_thread_messages(self.client_, self.thread)
+        self.assertEqual(self.api.calls, ["msg_012"])
+        self.assertEqual((result.fetched, result.created), (1, 1))
+        self.assertIsNone(Message.objects.get(id="msg_013").assistant_id)
+
+        self.api.calls.clear()
+        self.assertEqual(sync_thread_messages(self.client_, self.thread).fetched, 0)
+        self.assertEqual(self.api.calls, ["msg_013"])
+
+    def test_concurrent_sync_copies_each_message_once(self):
+        """Test that a sync racing another one creates no duplicate items"""
+        stale = Thread.objects.get(pk=self.thread.pk)
+        handle = self.api.handle
+
+        def handle_and_race(request):
+            # Another request syncs the thread while this one is fetching.
+            self.api.handle = handle
+            sync_thread_messages(self.api.client, Thread.objects.get(pk=stale.pk))
+            return handle(request)
+
+        self.api.handle = handle_and_race
+        result = sync_thread_messages(self.api.client, stale)
+
+        self.assertEqual((result.fetched, result.created), (12, 0))
+        self.assertEqual(Message.objects.filter(thread=self.thread).count(), 13)
+        self.assertEqual(ContentItem.objects.filter(detail=self.detail).count(), 13)
+        self.assertFalse(ContentItem.objects.filter(messages__isnull=True).exists())
+
+    def test_open_circuit_fails_fast(self):
+        """Test that the page-view sync makes no request while OpenAI is down"""
+        with self.assertLogs("parodynews.utils.resilience", "WARNING"):
+            CircuitBreaker()._open()
+        with self.assertRaises(CircuitOpenError):
+            sync_thread_messages(self.client_, self.thread)
+        self.assertEqual(self.api.calls, [])
@@ -0,0 +1,107 @@
+"""
+File: test_tables.py
+Description: Tests for server-side sorting, filtering and pagination of model tables
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_tables
+"""
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+
+from parodynews.models import ContentDetail
+from parodynews.utils.tables import apply_table_query, querystring
+
+TABLE = Template(
+    "{% load custom_filters %}"
+    "{% render_model_table objects fields display_fields 'content_detail' %}"
+)
+
+
+@override_settings(MODEL_TABLE_PAGE_SIZE=2)
+class ModelTableQueryTests(TestCase):
+    """Test query parameters applied by render_model_table"""
+
+    def setUp(self):
+        cache.clear()
+        for title, author in [("Gamma", "Ann"), ("Alpha", "Bob"), ("Beta", "Cy")]:
+            ContentDetail.objects.create(title=title, author=author)
+        self.display_fields = ["title", "author"]
+
+    def listing(self, query):
+        params = RequestFactory().get("/", query).GET
+        return apply_table_query(
+            ContentDetail.objects.all(), params, self.display_fields
+        )
+
+    def titles(self, listing):
+        return [obj.title for obj in listing["page"].object_list]
+
+    def test_sort_ascending_and_descending(self):
+        """Test that ?sort= orders the queryset in the database"""
+        self.assertEqual(
+            self.titles(self.listing({"sort": "title"})), ["Alpha", "Beta"]
+        )
+        self.assertEqual(
+            self.titles(self.listing({"sort": "-title"})), ["Gamma", "Beta"]
+        )
+
+    def test_unknown_sort_is_ignored(self):
+        """Test that sorting on a field outside the table is rejected"""
+        self.assertEqual(self.listing({"sort": "description"})["sort"], "")
+
+    def test_filter_and_paginate(self):
+        """Test column filters and page selection"""
+        listing = self.listing({"filter_author": "b"})
+        self.assertEqual(self.titles(listing), ["Alpha"])
+        self.assertEqual(listing["filters"], {"author": "b"})
+
+        listing = self.listing({"sort": "title", "page": "2"})
+        self.assertEqual(self.titles(listing), ["Gamma"])
+        self.assertEqual(listing["page"].paginator.count, 3)
+
+    def test_querystring_preserves_other_params(self):
+        """Test that page links keep the active sort and filters"""
+        params = RequestFactory().get("/", {"sort": "title", "page": "2"}).GET
+        self.assertEqual(querystring(params, page=None), "?sort=title")
+
+    def test_tag_renders_requested_page(self):
+        """Test the tag end-to-end with a request in the context"""
+        request = RequestFactory().get("/", {"sort": "-title"})
+        html = TABLE.render(
+            Context(
+                {
+                    "request": request,
+                    "objects": ContentDetail.objects.all(),
+                    "fields": ContentDetail._meta.get_fields(),
+                    "display_fields": self.display_fields,
+                }
+            )
+        )
+        self.assertIn("Gamma", html)
+        self.assertNotIn("Alpha", html)
+        self.assertIn('aria-sort="descending"', html)
+        self.assertIn("Page 1 of 2", html)
+
+    def test_filter_form_submits_on_enter(self):
+        """Test that the filter form is rendered with a submit button"""
+        html = TABLE.render(
+            Context(
+                {
+                    "objects": ContentDetail.objects.all(),
+                    "fields": ContentDetail._meta.get_fields(),
+                    "display_fields": self.display_fields,
+                }
+            )
+        )
+        form = html[html.index('<form id="model-table-content-detail"') :]
+        form = form[: form.index("</form>")]
+        self.assertIn('<button type="submit"', form)
+        self.assertNotIn("d-none", form)
+        self.assertIn('form="model-table-content-detail"', html)
@@ -0,0 +1,45 @@
+"""
+File: test_warmup.py
+Description: Tests for the pre-fork warm-up used by the gunicorn profile
+Author: Barodybroject Team
+Created: 2026-10-19
+Version: 1.0.0
+
+Dependencies:
+- django
+
+Usage: python manage.py test parodynews.tests.test_warmup
+"""
+
+from django.template import engines
+from django.test import SimpleTestCase
+
+from barodybroject.warmup import iter_template_names, warm_templates, warm_up
+from parodynews.utils.schemas import get_file_schemas
+
+
+class WarmUpTests(SimpleTestCase):
+    """Test that warm-up populates the process-wide caches"""
+
+    def test_template_names_found(self):
+        """Test that project templates are discovered by relative name"""
+        names = set(iter_template_names(engines["django"]))
+        self.assertIn("includes/model_table.html", names)
+
+    def test_templates_cached_after_warm_up(self):
+        """Test that the cached loader is active and filled by warm_templates"""
+        loader = engines["django"].engine.template_loaders[0]
+        self.assertEqual(type(loader).__module__, "django.template.loaders.cached")
+
+        loader.reset()
+        self.assertGreater(warm_templates(), 0)
+        self.assertTrue(
+            any("content_processing.html" in key for key in loader.get_template_cache)
+        )
+
+    def test_warm_up(self):
+        """Test each warm-up step runs and the schemas end up cached"""
+        get_file_schemas.cache_clear()
+        timings = warm_up(freeze_gc=False)
+        self.assertEqual(set(timings), {"urls", "schemas", "templates"})
+        self.assertEqual(get_file_schemas.cache_info().currsize, 1)
@@ -28,6 +28,7 @@ from .views import (
     export_schema,
     get_assistant_details,
     list_schemas,
+    metrics_view,
 )
 
 router = routers.DefaultRouter()
@@ -46,6 +47,8 @@ router.register(r"powered-by", PoweredByViewSet)
 urlpatterns = [
     path("martor/", include("martor.urls")),
     path("footer/", FooterView.as_view(), name="footer"),
+    # Prometheus scrape endpoint
+    path("metrics", metrics_view, name="metrics"),
     # Include API endpoints under 'api/' path
     path("api/", include(router.urls)),
     # Content management
@@ -3,7 +3,7 @@ File: __init__.py
 Description: Utility helpers for OpenAI integration, schemas, and content generation
 Author: Barodybroject Team <team@example.com>
 Created: 2025-11-30
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -11,56 +11,100 @@ Dependencies:
  - openai: >=1.57.0
 
 Usage: import from parodynews.utils.<module>
-"""
-
-# Assistant management utilities
-from .assistants import (
-    create_or_update_assistant,
-    delete_assistant,
-    get_assistant,
-    openai_delete_assistant,
-    retrieve_assistants_info,
-    run_assistant,
-    save_assistant,
-)
 
-# Configuration utilities
-from .config import (
-    get_config_value,
-    get_openai_client,
-    table_exists_and_fields_populated,
-)
+The helpers below are re-exported lazily: a submodule is imported the first
+time one of its names is accessed, so importing the package does not pull in
+optional or heavy dependencies (dkim, jsonschema, markdownify, ...).
+"""
 
-# Content generation utilities
-from .content import generate_content, generate_content_detail
+import importlib
 
-# Defaults utilities
-from .defaults import (
-    extract_file_paths_from_frontmatter,
-    generate_unique_id,
-    get_model_defaults,
-    load_template_from_path,
-)
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    # Assistant management utilities
+    "create_or_update_assistant": "assistants",
+    "delete_assistant": "assistants",
+    "get_assistant": "assistants",
+    "get_assistant_choices": "assistants",
+    "get_model_choices": "assistants",
+    "get_random_assistant_id": "assistants",
+    "openai_delete_assistant": "assistants",
+    "retrieve_assistants_info": "assistants",
+    "run_assistant": "assistants",
+    "save_assistant": "assistants",
+    # Bulk remote cleanup
+    "bulk_delete_assistants": "cleanup",
+    "bulk_delete_threads": "cleanup",
+    "delete_remote_objects": "cleanup",
+    # Configuration utilities
+    "get_config_value": "config",
+    "get_openai_client": "config",
+    "table_exists_and_fields_populated": "config",
+    # Content generation utilities
+    "generate_content": "content",
+    "generate_content_detail": "content",
+    # Defaults utilities
+    "extract_file_paths_from_frontmatter": "defaults",
+    "generate_unique_id": "defaults",
+    "get_defaults_index": "defaults",
+    "get_model_defaults": "defaults",
+    "load_template_from_path": "defaults",
+    # Keep dkim_backend accessible
+    "DKIMEmailBackend": "dkim_backend",
+    # OpenAI call instrumentation
+    "collect_openai_usage": "instrumentation",
+    "record_openai_call": "instrumentation",
+    # Markdown utilities
+    "generate_markdown_file": "markdown",
+    "iter_markdown": "markdown",
+    "json_to_markdown": "markdown",
+    # OpenAI client utilities
+    "load_openai_client": "openai_client",
+    # Rate limiting
+    "RateLimitTimeout": "ratelimit",
+    "TokenBucket": "ratelimit",
+    "estimate_tokens": "ratelimit",
+    "openai_call": "ratelimit",
+    # Rendering utilities
+    "render_markdown": "rendering",
+    # Circuit breaking
+    "CircuitOpenError": "resilience",
+    "OpenAIUnavailableError": "resilience",
+    # Schema utilities
+    "SchemaError": "schemas",
+    "SchemaValidationError": "schemas",
+    "clear_schema_cache": "schemas",
+    "get_file_schema": "schemas",
+    "get_validator": "schemas",
+    "load_schemas": "schemas",
+    "resolve_refs": "schemas",
+    "resolve_schema": "schemas",
+    "validate_json_response": "schemas",
+    # Sync utilities
+    "sync_assistants": "sync",
+    "sync_models": "sync",
+    "sync_thread_messages": "sync",
+    # Thread and message utilities
+    "create_run": "threads",
+    "openai_create_message": "threads",
+    "openai_delete_message": "threads",
+    "openai_list_messages": "threads",
+}
 
-# Keep dkim_backend accessible
-from .dkim_backend import DKIMEmailBackend
 
-# Markdown utilities
-from .markdown import generate_markdown_file, json_to_markdown
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
 
-# OpenAI client utilities
-from .openai_client import load_openai_client
 
-# Schema utilities
-from .schemas import load_schemas, resolve_refs
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Thread and message utilities
-from .threads import (
-    create_run,
-    openai_create_message,
-    openai_delete_message,
-    openai_list_messages,
-)
 
 __all__ = [
     # Config
@@ -72,11 +116,20 @@ __all__ = [
     # Assistants
     "save_assistant",
     "get_assistant",
+    "get_assistant_choices",
+    "get_model_choices",
+    "get_random_assistant_id",
     "retrieve_assistants_info",
     "openai_delete_assistant",
     "create_or_update_assistant",
     "delete_assistant",
     "run_assistant",
+    "sync_assistants",
+    "bulk_delete_assistants",
+    "bulk_delete_threads",
+    "delete_remote_objects",
+    "sync_models",
+    "sync_thread_messages",
     # Content
     "generate_content",
     "generate_content_detail",
@@ -85,13 +138,34 @@ __all__ = [
     "openai_delete_message",
     "create_run",
     "openai_list_messages",
+    # Instrumentation
+    "collect_openai_usage",
+    "record_openai_call",
+    # Rate limiting
+    "openai_call",
+    "estimate_tokens",
+    "TokenBucket",
+    "RateLimitTimeout",
+    "CircuitOpenError",
+    "OpenAIUnavailableError",
     # Schemas
     "load_schemas",
     "resolve_refs",
+    "resolve_schema",
+    "get_file_schema",
+    "get_validator",
+    "validate_json_response",
+    "clear_schema_cache",
+    "SchemaError",
+    "SchemaValidationError",
     # Markdown
     "json_to_markdown",
+    "iter_markdown",
     "generate_markdown_file",
+    # Rendering
+    "render_markdown",
     # Defaults
+    "get_defaults_index",
     "get_model_defaults",
     "load_template_from_path",
     "extract_file_paths_from_frontmatter",
@@ -3,7 +3,7 @@ File: assistants.py
 Description: Assistant management helpers for OpenAI API integration
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -12,7 +12,19 @@ Dependencies:
 Usage: from parodynews.utils.assistants import save_assistant
 """
 
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+
 from .config import get_openai_client
+from .fragments import get_model_generation
+from .ratelimit import estimate_tokens, openai_call
+
+# Process-local (generation, ((id, name), ...)) for assistant select boxes,
+# replaced whole. Assistant saves/deletes bump the generation (see
+# parodynews.signals), so every worker reloads after a change.
+_assistant_choices_cache = (None, ())
 
 
 def save_assistant(
@@ -47,7 +59,11 @@ def save_assistant(
         response_format = None
 
     if assistant_id:
-        assistant = client.beta.assistants.update(
+        assistant = openai_call(
+            client,
+            "beta.assistants",
+            method="update",
+            call_site="save_assistant",
             assistant_id=assistant_id,
             name=name,
             instructions=instructions,
@@ -55,7 +71,10 @@ def save_assistant(
             response_format=response_format,
         )
     else:
-        assistant = client.beta.assistants.create(
+        assistant = openai_call(
+            client,
+            "beta.assistants",
+            call_site="save_assistant",
             name=name,
             description=description,
             instructions=instructions,
@@ -66,6 +85,60 @@ def save_assistant(
     return assistant
 
 
+def get_assistant_choices():
+    """
+    Return (id, name) pairs for every assistant, ordered by name.
+
+    Only the two columns are loaded, and only after an assistant has changed.
+
+    Returns:
+        tuple: (id, name) pairs
+    """
+    global _assistant_choices_cache
+    from ..models import Assistant
+
+    generation = get_model_generation(Assistant)
+    cached_generation, choices = _assistant_choices_cache
+    if cached_generation != generation:
+        choices = tuple(Assistant.objects.order_by("name").values_list("id", "name"))
+        _assistant_choices_cache = (generation, choices)
+    return choices
+
+
+def get_random_assistant_id():
+    """
+    Pick a random assistant id from the cached choices.
+
+    Returns:
+        str: Assistant id, or None when there are no assistants
+    """
+    choices = get_assistant_choices()
+    return random.choice(choices)[0] if choices else None
+
+
+def get_model_choices():
+    """
+    Return (pk, model_id) pairs of the OpenAI models assistants can use.
+
+    Read from the shared cache, keyed by the OpenAIModel generation so that
+    fetch_models and admin edits take effect at once, and expired after
+    OPENAI_MODEL_CHOICES_TIMEOUT seconds. Never calls the OpenAI API.
+
+    Returns:
+        tuple: (pk, model_id) pairs ordered by model id
+    """
+    from ..models import OpenAIModel
+
+    key = f"openai_model_choices:g{get_model_generation(OpenAIModel)}"
+    choices = cache.get(key)
+    if choices is None:
+        choices = tuple(
+            OpenAIModel.objects.order_by("model_id").values_list("id", "model_id")
+        )
+        cache.set(key, choices, getattr(settings, "OPENAI_MODEL_CHOICES_TIMEOUT", 3600))
+    return choices
+
+
 def get_assistant(client, assistant_id):
     """
     Retrieve an OpenAI assistant by ID.
@@ -77,7 +150,13 @@ def get_assistant(client, assistant_id):
     Returns:
         OpenAI assistant object with full configuration
     """
-    assistant = client.beta.assistants.retrieve(assistant_id)
+    assistant = openai_call(
+        client,
+        "beta.assistants",
+        method="retrieve",
+        call_site="get_assistant",
+        assistant_id=assistant_id,
+    )
     return assistant
 
 
@@ -91,9 +170,13 @@ def retrieve_assistants_info(client):
     Returns:
         List of dictionaries containing assistant id, name, and instructions
     """
-    my_assistants = client.beta.assistants.list(
+    my_assistants = openai_call(
+        client,
+        "beta.assistants",
+        method="list",
+        call_site="retrieve_assistants_info",
         order="desc",
-        limit="100",
+        limit=100,
     )
 
     assistants_info = [
@@ -119,7 +202,13 @@ def openai_delete_assistant(client, assistant_id):
     Returns:
         str: Deletion confirmation message
     """
-    client.beta.assistants.delete(assistant_id)
+    openai_call(
+        client,
+        "beta.assistants",
+        method="delete",
+        call_site="openai_delete_assistant",
+        assistant_id=assistant_id,
+    )
     return f"Assistant with ID {assistant_id} deleted successfully."
 
 
@@ -173,14 +262,20 @@ def delete_assistant(client, assistant_id):
     """
     from ..models import Assistant
 
-    client.beta.assistants.delete(assistant_id)
+    openai_call(
+        client,
+        "beta.assistants",
+        method="delete",
+        call_site="delete_assistant",
+        assistant_id=assistant_id,
+    )
     Assistant.objects.filter(id=assistant_id).delete()
     return f"Assistant with ID {assistant_id} deleted successfully."
 
 
 def run_assistant(assistant, input_content):
     """
-    Execute an assistant with legacy chat completion interface.
+    Execute an assistant through the chat completions API.
 
     Args:
         assistant: Assistant model instance
@@ -190,12 +285,20 @@ def run_assistant(assistant, input_content):
         str: Generated response content from the assistant
     """
     client = get_openai_client()
-    response = client.chat_completion.create(
-        model=assistant.model.model_id,
-        messages=[
-            {"role": "system", "content": assistant.instructions},
-            {"role": "user", "content": input_content},
-        ],
+    model = assistant.model.model_id
+    messages = [
+        {"role": "system", "content": assistant.instructions},
+        {"role": "user", "content": input_content},
+    ]
+    response = openai_call(
+        client,
+        "chat.completions",
+        call_site="run_assistant",
+        bucket=model,
+        estimated_tokens=estimate_tokens(messages),
+        hedge=True,
+        model=model,
+        messages=messages,
         temperature=assistant.temperature or 0.7,
     )
     output_content = response.choices[0].message.content
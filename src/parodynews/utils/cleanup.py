@@ -0,0 +1,169 @@
+"""
+File: cleanup.py
+Description: Parallel deletion of OpenAI objects with retries and bulk local cleanup
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+- openai: >=1.57.0
+
+Usage: from parodynews.utils.cleanup import bulk_delete_assistants
+
+Remote deletions run on a bounded thread pool (OPENAI_DELETE_WORKERS, default
+8) so that deleting hundreds of objects takes a few round trips of wall time
+instead of one per object. Transient failures (rate limits, timeouts, 5xx)
+are retried with exponential backoff; objects that are already gone count as
+deleted. Each try is a single openai_call() attempt (SDK retries off), so the
+pool's retries are the only ones. Only rows whose remote object is gone are deleted locally, in one
+query, so failed ones stay listed and can be retried.
+"""
+
+import logging
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from openai import (
+    APIConnectionError,
+    InternalServerError,
+    NotFoundError,
+    RateLimitError,
+)
+
+from .instrumentation import BACKGROUND_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+# APITimeoutError is a subclass of APIConnectionError.
+RETRYABLE_ERRORS = (APIConnectionError, InternalServerError, RateLimitError)
+
+DeletionOutcome = namedtuple("DeletionOutcome", ["object_id", "deleted", "error"])
+
+
+def _delete_with_retry(delete_one, object_id, retries, backoff):
+    """Delete one remote object, retrying transient errors."""
+    for attempt in range(retries + 1):
+        try:
+            delete_one(object_id)
+            return DeletionOutcome(object_id, True, None)
+        except NotFoundError:
+            return DeletionOutcome(object_id, True, None)
+        except RETRYABLE_ERRORS as e:
+            if attempt == retries:
+                return DeletionOutcome(object_id, False, str(e))
+            time.sleep(backoff * 2**attempt)
+        except Exception as e:
+            return DeletionOutcome(object_id, False, str(e))
+
+
+def delete_remote_objects(
+    delete_one, object_ids, max_workers=None, retries=2, backoff=0.5
+):
+    """
+    Delete remote objects concurrently.
+
+    Args:
+        delete_one: Callable deleting one object by id (raises on failure)
+        object_ids: Ids to delete
+        max_workers: Concurrent requests (default: settings.OPENAI_DELETE_WORKERS)
+        retries: Extra attempts after a transient error
+        backoff: Seconds before the first retry, doubled on each further one
+
+    Returns:
+        list: DeletionOutcome per id, in the order given
+    """
+    object_ids = list(object_ids)
+    if not object_ids:
+        return []
+    if max_workers is None:
+        max_workers = getattr(settings, "OPENAI_DELETE_WORKERS", 8)
+
+    def delete(object_id):
+        try:
+            return _delete_with_retry(delete_one, object_id, retries, backoff)
+        finally:
+            BACKGROUND_QUEUE_DEPTH.dec(queue="openai_delete")
+
+    BACKGROUND_QUEUE_DEPTH.inc(len(object_ids), queue="openai_delete")
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(object_ids)),
+        thread_name_prefix="openai-delete",
+    ) as pool:
+        outcomes = list(pool.map(delete, object_ids))
+
+    for outcome in outcomes:
+        if not outcome.deleted:
+            logger.warning(f"Could not delete {outcome.object_id}: {outcome.error}")
+    return outcomes
+
+
+def _delete_local(model, outcomes):
+    """Delete the local rows whose remote object is gone, in one query."""
+    deleted_ids = [outcome.object_id for outcome in outcomes if outcome.deleted]
+    if deleted_ids:
+        model.objects.filter(pk__in=deleted_ids).delete()
+    return outcomes
+
+
+def bulk_delete_assistants(client, assistant_ids, **kwargs):
+    """
+    Delete assistants from OpenAI in parallel, then locally.
+
+    Args:
+        client: OpenAI client instance
+        assistant_ids: Assistant ids to delete
+        **kwargs: Passed on to delete_remote_objects()
+
+    Returns:
+        list: DeletionOutcome per assistant
+    """
+    from ..models import Assistant
+    from .ratelimit import openai_call
+
+    outcomes = delete_remote_objects(
+        lambda assistant_id: openai_call(
+            client,
+            "beta.assistants",
+            method="delete",
+            call_site="bulk_delete_assistants",
+            max_retries=0,
+            assistant_id=assistant_id,
+        ),
+        assistant_ids,
+        **kwargs,
+    )
+    return _delete_local(Assistant, outcomes)
+
+
+def bulk_delete_threads(client, thread_ids, **kwargs):
+    """
+    Delete threads (and with them their messages) from OpenAI, then locally.
+
+    Args:
+        client: OpenAI client instance
+        thread_ids: Thread ids to delete
+        **kwargs: Passed on to delete_remote_objects()
+
+    Returns:
+        list: DeletionOutcome per thread
+    """
+    from ..models import Thread
+    from .ratelimit import openai_call
+
+    outcomes = delete_remote_objects(
+        lambda thread_id: openai_call(
+            client,
+            "beta.threads",
+            method="delete",
+            call_site="bulk_delete_threads",
+            max_retries=0,
+            thread_id=thread_id,
+        ),
+        thread_ids,
+        **kwargs,
+    )
+    return _delete_local(Thread, outcomes)
@@ -3,29 +3,30 @@ File: content.py
 Description: Content-generation helpers built on OpenAI and JSON schemas
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
 - openai: >=1.57.0
+- jsonschema: >=4.20.0
 
 Usage: from parodynews.utils.content import generate_content
 """
 
 import logging
 
-from .schemas import load_schemas, resolve_refs
-
-logging.basicConfig(
-    filename="assistant_responses.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+from .instrumentation import collect_openai_usage
+from .ratelimit import estimate_tokens, openai_call
+from .schemas import (
+    file_schema_key,
+    get_file_schema,
+    get_validator,
+    resolve_schema,
+    validate_json_response,
 )
 
-# Load all schemas and store them in module-level variables
-all_schemas = load_schemas()
-parody_schema = resolve_refs(all_schemas.get("parody_news_article_schema"))
-content_detail_schema = resolve_refs(all_schemas.get("content_detail_schema"))
+# Responses go through the "parodynews" logger configured in settings.LOGGING.
+logger = logging.getLogger(__name__)
 
 
 def generate_content(client, content_form):
@@ -38,46 +39,69 @@ def generate_content(client, content_form):
 
     Returns:
         tuple: (content, details) - generated content and metadata
+
+    Raises:
+        SchemaError: If the assistant's JSON schema is invalid; raised before
+            any OpenAI call is made
+        SchemaValidationError: If a structured response does not match its schema
+
+    The OpenAI usage of both calls is added to content_form's usage fields;
+    the caller saves it along with the generated text.
     """
     model = content_form.assistant.model.model_id
+    json_schema = content_form.assistant.json_schema
 
-    if content_form.assistant.json_schema is not None:
+    if json_schema is not None:
+        # Compile the validator first: a broken schema must fail before the
+        # paid call rather than when its response is checked.
+        get_validator(json_schema.schema, key=json_schema.cache_key)
         response_format = {
             "type": "json_schema",
             "json_schema": {
                 "name": "News_Article",
                 "description": "A JSON object representing a news article.",
-                "schema": content_form.assistant.json_schema.schema,
+                "schema": resolve_schema(json_schema.schema, key=json_schema.cache_key),
                 "strict": True,
             },
         }
     else:
         response_format = None
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": content_form.assistant.instructions,
-                    },
-                ],
-            },
-            {
-                "role": "user",
-                "content": content_form.prompt,
-            },
-        ],
-        response_format=response_format,
-    )
-
-    data = response.choices[0].message.content
-    content_detail = generate_content_detail(client, data)
-
-    logging.info("Response: %s", data, content_detail)
+    messages = [
+        {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": content_form.assistant.instructions,
+                },
+            ],
+        },
+        {
+            "role": "user",
+            "content": content_form.prompt,
+        },
+    ]
+    with collect_openai_usage() as usage:
+        response = openai_call(
+            client,
+            "chat.completions",
+            call_site="generate_content",
+            bucket=model,
+            estimated_tokens=estimate_tokens(messages),
+            hedge=True,
+            model=model,
+            messages=messages,
+            response_format=response_format,
+        )
+
+        data = response.choices[0].message.content
+        if json_schema is not None:
+            validate_json_response(json_schema.schema, data, key=json_schema.cache_key)
+        content_detail = generate_content_detail(client, data)
+    usage.apply_to(content_form)
+
+    logger.info("Response: %s Detail: %s", data, content_detail)
 
     return data, content_detail
 
@@ -92,24 +116,35 @@ def generate_content_detail(client, content):
 
     Returns:
         str: JSON string containing detailed content metadata
+
+    Raises:
+        SchemaValidationError: If the metadata does not match content_detail_schema
     """
-    response = client.chat.completions.create(
+    content_detail_schema = get_file_schema("content_detail_schema")
+    messages = [
+        {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": "generate content detail",
+                },
+            ],
+        },
+        {
+            "role": "user",
+            "content": content,
+        },
+    ]
+    response = openai_call(
+        client,
+        "chat.completions",
+        call_site="generate_content_detail",
+        bucket="gpt-4o-mini",
+        estimated_tokens=estimate_tokens(messages),
+        hedge=True,
         model="gpt-4o-mini",
-        messages=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": "generate content detail",
-                    },
-                ],
-            },
-            {
-                "role": "user",
-                "content": content,
-            },
-        ],
+        messages=messages,
         response_format={
             "type": "json_schema",
             "json_schema": {
@@ -122,6 +157,9 @@ def generate_content_detail(client, content):
     )
 
     data = response.choices[0].message.content
-    logging.info("Response: %s", data)
+    logger.info("Response: %s", data)
+    validate_json_response(
+        content_detail_schema, data, key=file_schema_key("content_detail_schema")
+    )
 
     return data
@@ -3,7 +3,7 @@ File: defaults.py
 Description: Default generation helpers for model fields and front matter
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -17,46 +17,93 @@ import re
 import uuid
 
 import yaml
+from django.conf import settings
 from django.core.cache import cache
 from django.db.utils import ProgrammingError
 
+from .fragments import get_model_generation
 
-def get_model_defaults(model_name, default_type="default_type"):
+# Process-local copies of the defaults index, by default_type, as
+# (generation, index) tuples replaced whole. The generation is the FieldDefaults
+# model generation, bumped on every save/delete (see parodynews.signals).
+_defaults_indexes = {}
+
+
+def build_defaults_index(defaults_list):
     """
-    Retrieve cached model field defaults from database configuration.
+    Index a FieldDefaults.defaults list by model name.
+
+    Args:
+        defaults_list: List of {"model_name": ..., "fields": {...}} entries,
+            possibly JSON-encoded as strings
+
+    Returns:
+        dict: Field defaults by model name; the first entry for a model wins
+    """
+    index = {}
+    for item in defaults_list or []:
+        if isinstance(item, str):
+            try:
+                item = json.loads(item)
+            except json.JSONDecodeError:
+                continue
+        if isinstance(item, dict) and "model_name" in item:
+            index.setdefault(item["model_name"], item.get("fields", {}))
+    return index
+
+
+def get_defaults_index(default_type="default_type"):
+    """
+    Return the field defaults index for a default type.
+
+    The index is built once per FieldDefaults generation, shared through the
+    cache and then held in process memory until the generation changes.
 
     Args:
-        model_name: Name of the model to get defaults for
         default_type: Type of defaults to retrieve
 
     Returns:
-        dict: Model field defaults configuration
+        dict: Field defaults by model name
     """
     from ..models import FieldDefaults
 
-    cache_key = f"field_defaults:{default_type}"
-    defaults_list = cache.get(cache_key)
-    if defaults_list is None:
+    try:
+        generation = get_model_generation(FieldDefaults)
+    except ProgrammingError:
+        return {}
+
+    cached = _defaults_indexes.get(default_type)
+    if cached and cached[0] == generation:
+        return cached[1]
+
+    cache_key = f"field_defaults:{default_type}:g{generation}"
+    index = cache.get(cache_key)
+    if index is None:
         try:
             fd = FieldDefaults.objects.filter(type=default_type).first()
-            if not fd:
-                return {}
-            defaults_list = fd.defaults
         except ProgrammingError:
             return {}
-        cache.set(cache_key, defaults_list)
+        index = build_defaults_index(fd.defaults if fd else [])
+        cache.set(
+            cache_key, index, getattr(settings, "FIELD_DEFAULTS_CACHE_TIMEOUT", 3600)
+        )
+
+    _defaults_indexes[default_type] = (generation, index)
+    return index
 
-    for item in defaults_list:
-        if isinstance(item, str):
-            try:
-                item = json.loads(item)
-            except json.JSONDecodeError:
-                continue
 
-        if isinstance(item, dict) and item.get("model_name") == model_name:
-            return item.get("fields", {})
+def get_model_defaults(model_name, default_type="default_type"):
+    """
+    Retrieve model field defaults from database configuration.
 
-    return {}
+    Args:
+        model_name: Name of the model to get defaults for
+        default_type: Type of defaults to retrieve
+
+    Returns:
+        dict: Model field defaults configuration
+    """
+    return get_defaults_index(default_type).get(model_name, {})
 
 
 def load_template_from_path(template_path: str):
@@ -69,7 +116,7 @@ def load_template_from_path(template_path: str):
     Returns:
         tuple: (yaml_config, template_body)
     """
-    with open(template_path, "r") as file:
+    with open(template_path) as file:
         content = file.read()
     front_matter_match = re.search(r"^---(.*?)---", content, re.DOTALL)
     if not front_matter_match:
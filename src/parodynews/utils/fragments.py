@@ -0,0 +1,76 @@
+"""
+File: fragments.py
+Description: Versioned fragment cache for model listing table rows
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: from parodynews.utils.fragments import get_model_generation
+"""
+
+import hashlib
+
+from django.conf import settings
+
+from .generations import bump_generation, get_generation
+
+
+def _generation_key(model):
+    return f"model_table_generation:{model._meta.label_lower}"
+
+
+def get_model_generation(model):
+    """
+    Return the current cache generation for a model class.
+
+    Args:
+        model: Django model class
+
+    Returns:
+        int: Generation counter
+    """
+    return get_generation(_generation_key(model))
+
+
+def bump_model_generation(model):
+    """
+    Invalidate every cached row of a model by advancing its generation.
+
+    Args:
+        model: Django model class
+    """
+    bump_generation(_generation_key(model))
+
+
+def row_cache_key(obj, generation, display_fields, detail_url):
+    """
+    Build the cache key for one rendered table row.
+
+    Args:
+        obj: Model instance rendered in the row
+        generation: Current generation of the instance's model
+        display_fields: Field names shown in the table
+        detail_url: URL name the first cell links to
+
+    Returns:
+        str: Cache key unique to the row's content and layout
+    """
+    updated = getattr(obj, "updated_at", None)
+    marker = updated.isoformat() if updated else ""
+    layout = hashlib.md5(
+        f"{detail_url}|{','.join(display_fields)}".encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return (
+        f"model_table_row:{obj._meta.label_lower}:g{generation}:"
+        f"{obj.pk}:{marker}:{layout}"
+    )
+
+
+def row_cache_timeout():
+    """Return how long rendered rows are kept, in seconds."""
+    return getattr(settings, "MODEL_TABLE_ROW_CACHE_TIMEOUT", 60 * 60)
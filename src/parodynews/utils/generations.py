@@ -0,0 +1,75 @@
+"""
+File: generations.py
+Description: Cache-stored generation counters for key-based invalidation
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: from parodynews.utils.generations import get_generation, bump_generation
+
+A generation is a counter embedded in other cache keys; bumping it orphans
+every entry built with the old value. Counters live in the cache themselves
+and can be evicted, so a missing counter is seeded with the current time in
+nanoseconds rather than a constant. Restarting at 1 would reissue a value
+that was already used, and entries built under it would become valid again.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+def _seed():
+    return time.time_ns()
+
+
+def get_generation(key):
+    """
+    Return the generation stored under ``key``, seeding it if missing.
+
+    Args:
+        key: Cache key of the counter
+
+    Returns:
+        int: Current generation
+    """
+    seed = _seed()
+    if cache.add(key, seed, timeout=None):
+        return seed
+    # Another process seeded or bumped it in between.
+    return cache.get(key, seed)
+
+
+def get_generations(keys):
+    """
+    Return the generation of each key with a single cache read.
+
+    Args:
+        keys: Iterable of counter cache keys
+
+    Returns:
+        dict: Generation by key
+    """
+    keys = list(keys)
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            found[key] = get_generation(key)
+    return found
+
+
+def bump_generation(key):
+    """
+    Advance the generation stored under ``key``.
+
+    Args:
+        key: Cache key of the counter
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _seed(), timeout=None)
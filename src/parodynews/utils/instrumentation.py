@@ -0,0 +1,190 @@
+"""
+File: instrumentation.py
+Description: Latency, token, retry and cost accounting for OpenAI calls
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage:
+    from parodynews.utils.instrumentation import collect_openai_usage
+
+    with collect_openai_usage() as usage:
+        generate_content(client, content_item)
+    usage.apply_to(content_item)
+
+openai_call() reports every call here with its call site. Every OpenAI
+request in the app goes through openai_call(), including the syncs, list and
+delete helpers and bulk cleanup. Each call updates the process-wide metrics
+exported at /metrics. It also adds to the totals of
+any collect_openai_usage() block around it, so callers can persist what
+producing a ContentItem cost. Responses without usage data (e.g. from a
+local OpenAI-compatible stand-in) are still timed and counted.
+
+Settings:
+    OPENAI_MODEL_PRICES: {"<model prefix>": {"prompt": usd, "completion": usd}},
+        prices per million tokens; the longest matching prefix applies
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models import F
+
+from ..metrics import Counter, Gauge, Histogram
+
+OPENAI_CALL_DURATION = Histogram(
+    "parodynews_openai_call_duration_seconds",
+    "Duration of OpenAI calls including retries and rate-limit waits",
+    ["call_site", "endpoint", "model", "outcome"],
+)
+OPENAI_TOKENS = Counter(
+    "parodynews_openai_tokens_total",
+    "Tokens used by OpenAI calls",
+    ["call_site", "model", "kind"],
+)
+OPENAI_RETRIES = Counter(
+    "parodynews_openai_retries_total",
+    "Retried OpenAI call attempts",
+    ["call_site", "endpoint"],
+)
+OPENAI_COST = Counter(
+    "parodynews_openai_cost_usd_total",
+    "Estimated OpenAI spend in US dollars",
+    ["call_site", "model"],
+)
+BACKGROUND_QUEUE_DEPTH = Gauge(
+    "parodynews_background_queue_depth",
+    "OpenAI work waiting in this server: calls held by the rate limiter "
+    "(openai_rate_limit), hedges not yet started (openai_hedge) and remote "
+    "deletions not yet done (openai_delete)",
+    ["queue"],
+)
+
+_active_usage = ContextVar("openai_usage", default=())
+
+
+class UsageTotals:
+    """Running totals of the OpenAI calls made inside collect_openai_usage()."""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.duration = 0.0
+        self.cost = Decimal(0)
+
+    def add(self, duration, prompt_tokens, completion_tokens, cost):
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.duration += duration
+        self.cost += cost
+
+    def as_fields(self):
+        """Return the totals as ContentItem field values."""
+        return {
+            "openai_calls": self.calls,
+            "openai_prompt_tokens": self.prompt_tokens,
+            "openai_completion_tokens": self.completion_tokens,
+            "openai_duration_ms": round(self.duration * 1000),
+            "openai_cost_usd": self.cost,
+        }
+
+    def apply_to(self, content_item, save=False):
+        """
+        Add the totals to a ContentItem's OpenAI usage fields.
+
+        Args:
+            content_item: ContentItem the calls were made for
+            save: Also add them in the database with a single UPDATE, for
+                items the caller does not save itself
+        """
+        fields = self.as_fields()
+        for name, value in fields.items():
+            setattr(content_item, name, getattr(content_item, name) + value)
+        if save:
+            type(content_item).objects.filter(pk=content_item.pk).update(
+                **{name: F(name) + value for name, value in fields.items()}
+            )
+
+
+@contextmanager
+def collect_openai_usage():
+    """Collect the usage of OpenAI calls made in this block (nesting allowed)."""
+    usage = UsageTotals()
+    token = _active_usage.set(_active_usage.get() + (usage,))
+    try:
+        yield usage
+    finally:
+        _active_usage.reset(token)
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    """
+    Estimate the price of a call from OPENAI_MODEL_PRICES.
+
+    Args:
+        model: Model name, possibly dated (e.g. "gpt-4o-mini-2024-07-18")
+        prompt_tokens: Input tokens
+        completion_tokens: Output tokens
+
+    Returns:
+        Decimal: US dollars, 0 for models without a configured price
+    """
+    prices = getattr(settings, "OPENAI_MODEL_PRICES", {})
+    matches = [prefix for prefix in prices if model.startswith(prefix)]
+    if not matches:
+        return Decimal(0)
+    price = prices[max(matches, key=len)]
+    return (
+        Decimal(str(price["prompt"])) * prompt_tokens
+        + Decimal(str(price["completion"])) * completion_tokens
+    ) / 1000000
+
+
+def record_openai_call(
+    call_site, endpoint, model, duration, retries=0, outcome="ok", response=None
+):
+    """
+    Record one OpenAI call in the metrics and any active usage totals.
+
+    Args:
+        call_site: Function that made the call, e.g. "generate_content"
+        endpoint: Dotted resource path of the call
+        model: Model used (the response's model when it reports one)
+        duration: Seconds spent, including retries and waits
+        retries: Attempts beyond the first
+        outcome: "ok" or the error class name
+        response: Parsed response, read for ``usage`` when present
+    """
+    model = getattr(response, "model", None) or model or "unknown"
+    usage = getattr(response, "usage", None)
+    # Chat completions and runs both report prompt/completion tokens.
+    prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+    completion_tokens = getattr(usage, "completion_tokens", None) or 0
+
+    OPENAI_CALL_DURATION.observe(
+        duration, call_site=call_site, endpoint=endpoint, model=model, outcome=outcome
+    )
+    if retries:
+        OPENAI_RETRIES.inc(retries, call_site=call_site, endpoint=endpoint)
+    cost = Decimal(0)
+    if prompt_tokens or completion_tokens:
+        OPENAI_TOKENS.inc(
+            prompt_tokens, call_site=call_site, model=model, kind="prompt"
+        )
+        OPENAI_TOKENS.inc(
+            completion_tokens, call_site=call_site, model=model, kind="completion"
+        )
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        if cost:
+            OPENAI_COST.inc(float(cost), call_site=call_site, model=model)
+
+    for totals in _active_usage.get():
+        totals.add(duration, prompt_tokens, completion_tokens, cost)
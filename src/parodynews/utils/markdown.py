@@ -9,7 +9,7 @@ Version: 0.4.0
 Dependencies:
 - django: >=5.1
 
-Usage: from parodynews.utils.markdown import save_markdown_file
+Usage: from parodynews.utils.markdown import json_to_markdown, iter_markdown
 """
 
 import os
@@ -17,9 +17,47 @@ import os
 from django.conf import settings
 
 
+def iter_markdown(data):
+    """
+    Render a JSON data structure to Markdown, yielding output chunks.
+
+    Walks the structure with an explicit stack instead of recursion, so deeply
+    nested responses neither hit the recursion limit nor rebuild intermediate
+    strings. The chunks can be streamed straight into a ``StreamingHttpResponse``
+    or a file.
+
+    Args:
+        data: JSON-compatible data structure to convert
+
+    Yields:
+        str: Consecutive fragments of the Markdown document
+    """
+    # Each frame is (is_text, payload, level); text frames are emitted as-is.
+    stack = [(False, data, 1)]
+    while stack:
+        is_text, value, level = stack.pop()
+        if is_text:
+            yield value
+        elif isinstance(value, dict):
+            frames = []
+            for key, child in value.items():
+                frames.append((True, f"{'#' * level} {key}\n\n", level))
+                frames.append((False, child, level + 1))
+            stack.extend(reversed(frames))
+        elif isinstance(value, list):
+            frames = []
+            for item in value:
+                frames.append((True, "* ", level))
+                frames.append((False, item, level + 1))
+                frames.append((True, "\n", level))
+            stack.extend(reversed(frames))
+        else:
+            yield f"{value}\n\n"
+
+
 def json_to_markdown(data):
     """
-    Convert JSON data structure to Markdown format recursively.
+    Convert JSON data structure to Markdown format.
 
     Args:
         data: JSON-compatible data structure to convert
@@ -27,21 +65,7 @@ def json_to_markdown(data):
     Returns:
         str: Formatted Markdown text
     """
-
-    def convert_to_md(data, level=1):
-        markdown = ""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                markdown += f"{'#' * level} {key}\n\n"
-                markdown += convert_to_md(value, level + 1)
-        elif isinstance(data, list):
-            for item in data:
-                markdown += f"* {convert_to_md(item, level + 1)}\n"
-        else:
-            markdown += f"{data}\n\n"
-        return markdown
-
-    return convert_to_md(data)
+    return "".join(iter_markdown(data))
 
 
 def generate_markdown_file(data, filename):
@@ -0,0 +1,403 @@
+"""
+File: ratelimit.py
+Description: Rate-limit-aware scheduling of OpenAI calls with shared token buckets
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+- openai: >=1.57.0
+
+Usage:
+    from parodynews.utils.ratelimit import openai_call
+
+    response = openai_call(
+        client,
+        "chat.completions",
+        call_site="generate_content",
+        bucket=model,
+        model=model,
+        messages=messages,
+    )
+
+Each bucket (normally the model name) has two token buckets, one for requests
+and one for tokens per minute, stored in the Django cache so every gunicorn
+worker draws from the same budget. Calls wait until both buckets hold enough,
+then the bucket is corrected from the x-ratelimit-* headers of the response.
+429 and transient 5xx/connection errors are retried with jittered
+exponential backoff, honouring Retry-After. Every attempt also passes
+through the shared circuit breaker and, when enabled, request hedging (see
+parodynews.utils.resilience), and is recorded in the call metrics (see
+parodynews.utils.instrumentation).
+
+Settings:
+    OPENAI_RATE_LIMITS: {"<bucket>": {"requests": rpm, "tokens": tpm}, ...};
+        the "default" entry applies until a response reports the real limits
+    OPENAI_RATE_LIMIT_MAX_WAIT: Longest a call may wait for capacity (seconds)
+    OPENAI_MAX_RETRIES: Retries after 429/5xx/connection errors
+    OPENAI_TIMEOUT: Per-attempt request timeout (seconds)
+    OPENAI_CIRCUIT_FAILURE_THRESHOLD: Consecutive failures that open the circuit
+    OPENAI_CIRCUIT_RESET_TIMEOUT: Seconds the circuit stays open before a probe
+    OPENAI_HEDGE_REQUESTS: Hedge calls made with hedge=True
+    OPENAI_HEDGE_PERCENTILE: Latency percentile after which a call is hedged
+"""
+
+import json
+import logging
+import random
+import re
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from openai import APIStatusError, RateLimitError
+
+from .cleanup import RETRYABLE_ERRORS
+from .instrumentation import BACKGROUND_QUEUE_DEPTH, record_openai_call
+from .resilience import (
+    CircuitBreaker,
+    OpenAIUnavailableError,
+    hedge_delay,
+    hedged,
+    record_latency,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMITS = {"requests": 500, "tokens": 200000}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+class RateLimitTimeout(OpenAIUnavailableError):
+    """Raised when a call would wait longer than OPENAI_RATE_LIMIT_MAX_WAIT."""
+
+
+def parse_duration(value):
+    """
+    Parse an x-ratelimit-reset-* duration such as "6m0s", "1.5s" or "20ms".
+
+    Args:
+        value: Header value
+
+    Returns:
+        float: Seconds, or None when the value cannot be parsed
+    """
+    parts = _DURATION_PART.findall(value or "")
+    if not parts:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def estimate_tokens(messages, max_tokens=0):
+    """
+    Roughly estimate the tokens a chat request will consume.
+
+    Args:
+        messages: Chat messages sent with the request
+        max_tokens: Completion budget requested, if any
+
+    Returns:
+        int: About four characters per prompt token, plus the completion budget
+    """
+    return len(json.dumps(messages, default=str)) // 4 + (max_tokens or 0)
+
+
+class TokenBucket:
+    """
+    Request and token buckets for one OpenAI rate-limit scope.
+
+    State lives in the cache as {"requests", "tokens", "rpm", "tpm", "ts"};
+    read-modify-write cycles are serialised with a short cache.add() lock.
+    """
+
+    LOCK_TIMEOUT = 2
+
+    def __init__(self, name):
+        self.name = name
+        self.key = f"openai_bucket:{name}"
+        self.lock_key = f"{self.key}:lock"
+
+    def _configured_limits(self):
+        limits = getattr(settings, "OPENAI_RATE_LIMITS", {})
+        configured = limits.get(self.name) or limits.get("default") or DEFAULT_LIMITS
+        return configured["requests"], configured["tokens"]
+
+    @contextmanager
+    def _locked(self):
+        deadline = time.monotonic() + self.LOCK_TIMEOUT
+        locked = cache.add(self.lock_key, 1, self.LOCK_TIMEOUT)
+        while not locked and time.monotonic() < deadline:
+            time.sleep(0.005)
+            locked = cache.add(self.lock_key, 1, self.LOCK_TIMEOUT)
+        # Fail open: a lost update only admits a little early, and the
+        # response headers correct the bucket afterwards.
+        try:
+            yield
+        finally:
+            if locked:
+                cache.delete(self.lock_key)
+
+    def _load(self, now):
+        state = cache.get(self.key)
+        if state is None:
+            rpm, tpm = self._configured_limits()
+            return {"requests": rpm, "tokens": tpm, "rpm": rpm, "tpm": tpm, "ts": now}
+        # Both buckets refill continuously to their per-minute capacity.
+        elapsed = max(0.0, now - state["ts"])
+        state["requests"] = min(
+            state["rpm"], state["requests"] + elapsed * state["rpm"] / 60
+        )
+        state["tokens"] = min(
+            state["tpm"], state["tokens"] + elapsed * state["tpm"] / 60
+        )
+        state["ts"] = now
+        return state
+
+    def _save(self, state):
+        cache.set(self.key, state, 3600)
+
+    def try_acquire(self, tokens=0):
+        """
+        Take one request and ``tokens`` tokens if both are available.
+
+        Args:
+            tokens: Estimated tokens of the call
+
+        Returns:
+            float: 0 when acquired, otherwise seconds until there will be enough
+        """
+        with self._locked():
+            state = self._load(time.time())
+            tokens = min(tokens, state["tpm"])
+            if state["requests"] >= 1 and state["tokens"] >= tokens:
+                state["requests"] -= 1
+                state["tokens"] -= tokens
+                self._save(state)
+                return 0.0
+            self._save(state)
+            return max(
+                (1 - state["requests"]) * 60 / state["rpm"],
+                (tokens - state["tokens"]) * 60 / state["tpm"],
+            )
+
+    def acquire(self, tokens=0, max_wait=None):
+        """
+        Wait until the call fits in the bucket, then take its share.
+
+        Args:
+            tokens: Estimated tokens of the call
+            max_wait: Longest wait in seconds (default: OPENAI_RATE_LIMIT_MAX_WAIT)
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: If capacity would not be available in time
+        """
+        if max_wait is None:
+            max_wait = getattr(settings, "OPENAI_RATE_LIMIT_MAX_WAIT", 60)
+        waited = 0.0
+        delay = self.try_acquire(tokens)
+        if not delay:
+            return waited
+        BACKGROUND_QUEUE_DEPTH.inc(queue="openai_rate_limit")
+        try:
+            while delay:
+                if waited + delay > max_wait:
+                    raise RateLimitTimeout(
+                        f"OpenAI rate limit for {self.name} needs {delay:.1f}s "
+                        f"more after {waited:.1f}s of waiting"
+                    )
+                # Jitter spreads out workers that were all told the same delay.
+                delay *= random.uniform(1.0, 1.2)
+                time.sleep(delay)
+                waited += delay
+                delay = self.try_acquire(tokens)
+        finally:
+            BACKGROUND_QUEUE_DEPTH.dec(queue="openai_rate_limit")
+        return waited
+
+    def update_from_headers(self, headers):
+        """
+        Align the buckets with the x-ratelimit-* headers of a response.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        values = {}
+        for kind in ("requests", "tokens"):
+            try:
+                values[kind] = (
+                    int(headers[f"x-ratelimit-limit-{kind}"]),
+                    int(headers[f"x-ratelimit-remaining-{kind}"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        if not values:
+            return
+
+        with self._locked():
+            state = self._load(time.time())
+            if "requests" in values:
+                state["rpm"], remaining = values["requests"]
+                state["requests"] = min(state["requests"], remaining)
+            if "tokens" in values:
+                state["tpm"], remaining = values["tokens"]
+                state["tokens"] = min(state["tokens"], remaining)
+            self._save(state)
+
+    def drain(self, seconds):
+        """
+        Empty the request bucket so that it only has capacity after ``seconds``.
+
+        Args:
+            seconds: Time until the server accepts requests again
+        """
+        with self._locked():
+            state = self._load(time.time())
+            state["requests"] = min(0.0, 1 - seconds * state["rpm"] / 60)
+            self._save(state)
+
+
+def _retry_delay(error, attempt):
+    """Return the backoff before retry ``attempt`` (0-based) of a failed call."""
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            return float(response.headers["retry-after"])
+        except (KeyError, ValueError):
+            pass
+        reset = parse_duration(response.headers.get("x-ratelimit-reset-requests"))
+        if isinstance(error, RateLimitError) and reset:
+            return reset
+    # Full jitter: uniform between 0 and the exponential cap.
+    return random.uniform(0, min(30.0, 0.5 * 2**attempt))
+
+
+def openai_call(
+    client,
+    endpoint,
+    *,
+    method="create",
+    call_site=None,
+    bucket="default",
+    estimated_tokens=0,
+    max_retries=None,
+    hedge=False,
+    **kwargs,
+):
+    """
+    Call ``client.<endpoint>.<method>(**kwargs)`` under the shared rate limits.
+
+    Args:
+        client: OpenAI client instance
+        endpoint: Dotted resource path, e.g. "chat.completions" or "beta.threads.runs"
+        method: Resource method to call ("create", "retrieve", "update", ...)
+        call_site: Name reported in the call metrics (default: the endpoint)
+        bucket: Rate-limit scope, normally the model name
+        estimated_tokens: Tokens the call is expected to use (see estimate_tokens)
+        max_retries: Retries after 429/5xx/connection errors
+            (default: OPENAI_MAX_RETRIES)
+        hedge: Allow a second, racing request when the first is slow; only
+            for idempotent calls, and only if OPENAI_HEDGE_REQUESTS is set
+        **kwargs: Arguments for the method
+
+    Returns:
+        Parsed API response, as the method would return it
+
+    Raises:
+        RateLimitTimeout: If the call could not be scheduled in time
+        CircuitOpenError: If OpenAI has been failing and the circuit is open
+        openai.APIError: If the call still fails after retries
+    """
+    if max_retries is None:
+        max_retries = getattr(settings, "OPENAI_MAX_RETRIES", 4)
+    call_site = call_site or endpoint
+    model = kwargs.get("model") or (bucket if bucket != "default" else None)
+    limiter = TokenBucket(bucket)
+    breaker = CircuitBreaker()
+    # Retries are handled here, with the bucket in the loop, instead of by the SDK.
+    resource = client.with_options(
+        max_retries=0, timeout=getattr(settings, "OPENAI_TIMEOUT", 60)
+    )
+    for part in endpoint.split("."):
+        resource = getattr(resource, part)
+    call = getattr(resource.with_raw_response, method)
+
+    def send():
+        return call(**kwargs)
+
+    def may_hedge():
+        # A hedge costs a second request; never wait for room to send one.
+        try:
+            limiter.acquire(estimated_tokens, max_wait=0)
+        except RateLimitTimeout:
+            return False
+        logger.info(f"Hedging slow OpenAI {endpoint} call")
+        return True
+
+    hedge = hedge and getattr(settings, "OPENAI_HEDGE_REQUESTS", False)
+    started = time.monotonic()
+    attempt = 0
+    try:
+        while True:
+            breaker.before_call()
+            limiter.acquire(estimated_tokens)
+            delay = hedge_delay(endpoint) if hedge else None
+            attempt_started = time.monotonic()
+            try:
+                raw = send() if delay is None else hedged(send, delay, may_hedge)
+            except RETRYABLE_ERRORS as e:
+                if isinstance(e, RateLimitError):
+                    # Throttling is handled by the bucket, not the breaker.
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+                if attempt >= max_retries:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    f"OpenAI {endpoint} failed ({e.__class__.__name__}); "
+                    f"retry {attempt + 1}/{max_retries} in {delay:.1f}s"
+                )
+                if isinstance(e, RateLimitError):
+                    # Hold back every worker, not just this one; the next
+                    # acquire() does the waiting.
+                    limiter.drain(delay)
+                else:
+                    time.sleep(delay)
+                attempt += 1
+                continue
+            except APIStatusError:
+                # The API answered; a bad request says nothing about its health.
+                breaker.record_success()
+                raise
+            breaker.record_success()
+            record_latency(endpoint, time.monotonic() - attempt_started)
+            limiter.update_from_headers(raw.headers)
+            response = raw.parse()
+            break
+    except Exception as e:
+        record_openai_call(
+            call_site,
+            endpoint,
+            model,
+            time.monotonic() - started,
+            retries=attempt,
+            outcome=e.__class__.__name__,
+        )
+        raise
+    record_openai_call(
+        call_site,
+        endpoint,
+        model,
+        time.monotonic() - started,
+        retries=attempt,
+        response=response,
+    )
+    return response
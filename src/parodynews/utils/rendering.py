@@ -0,0 +1,68 @@
+"""
+File: rendering.py
+Description: Cached Markdown to HTML rendering for posts and content items
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+- django-markdownify: >=0.9.0
+
+Usage: from parodynews.utils.rendering import render_markdown
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.safestring import mark_safe
+from markdownify.templatetags.markdownify import markdownify
+
+# Bump to discard every cached rendering after changing markdown settings.
+RENDER_CACHE_VERSION = 1
+
+
+def markdown_cache_key(text, custom_settings="default"):
+    """
+    Build the cache key for a rendered Markdown source.
+
+    Args:
+        text: Markdown source text
+        custom_settings: Name of the MARKDOWNIFY settings profile
+
+    Returns:
+        str: Cache key derived from a SHA-256 hash of the source
+    """
+    digest = hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+    return f"rendered_markdown:v{RENDER_CACHE_VERSION}:{custom_settings}:{digest}"
+
+
+def render_markdown(text, custom_settings="default"):
+    """
+    Render Markdown to sanitised HTML, reusing a cached rendering when possible.
+
+    The key is derived from the content itself, so editing a post or content
+    item produces a new key and the stale rendering simply ages out.
+
+    Args:
+        text: Markdown source text
+        custom_settings: Name of the MARKDOWNIFY settings profile
+
+    Returns:
+        SafeString: Rendered HTML
+    """
+    if not text:
+        return markdownify(text, custom_settings)
+
+    cache_key = markdown_cache_key(text, custom_settings)
+    html = cache.get(cache_key)
+    if html is None:
+        html = str(markdownify(text, custom_settings))
+        cache.set(
+            cache_key,
+            html,
+            getattr(settings, "MARKDOWN_RENDER_CACHE_TIMEOUT", 60 * 60 * 24),
+        )
+    return mark_safe(html)
@@ -0,0 +1,215 @@
+"""
+File: resilience.py
+Description: Circuit breaker and request hedging for OpenAI calls
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: Used by parodynews.utils.ratelimit.openai_call()
+
+The circuit breaker keeps its state in the Django cache, so once the API is
+failing every gunicorn worker fails fast instead of each one waiting out its
+own timeouts. After OPENAI_CIRCUIT_FAILURE_THRESHOLD consecutive failures the
+circuit opens for OPENAI_CIRCUIT_RESET_TIMEOUT seconds. It then lets a
+single probe call through: success closes the circuit, failure reopens it.
+
+Hedging sends a second identical request when the first has not answered
+within the OPENAI_HEDGE_PERCENTILE latency of recent calls, and returns
+whichever answers first. Use it only for idempotent calls such as chat
+completions. Only hedges use the bounded pool (OPENAI_HEDGE_WORKERS); the
+first request starts at once on its own thread, so a busy pool can never
+delay it or make it look slow enough to hedge.
+"""
+
+import logging
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .instrumentation import BACKGROUND_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+# Latency samples needed before hedging starts
+MIN_HEDGE_SAMPLES = 20
+
+_latencies = defaultdict(lambda: deque(maxlen=200))
+_latencies_lock = threading.Lock()
+_hedge_executor = None
+_hedge_executor_lock = threading.Lock()
+
+
+class OpenAIUnavailableError(Exception):
+    """Raised instead of calling OpenAI when the call cannot succeed in time."""
+
+
+class CircuitOpenError(OpenAIUnavailableError):
+    """Raised while the circuit is open after repeated OpenAI failures."""
+
+
+class CircuitBreaker:
+    """
+    Cache-backed circuit breaker shared by all workers.
+
+    Keys: ``:failures`` counts consecutive failures, ``:open`` exists while
+    calls are refused, ``:tripped`` marks that the circuit has opened and not
+    yet recovered (half-open once ``:open`` expires), and ``:probe`` admits a
+    single trial call.
+    """
+
+    def __init__(self, name="openai"):
+        self.name = name
+        prefix = f"openai_circuit:{name}"
+        self.failures_key = f"{prefix}:failures"
+        self.open_key = f"{prefix}:open"
+        self.tripped_key = f"{prefix}:tripped"
+        self.probe_key = f"{prefix}:probe"
+
+    @property
+    def reset_timeout(self):
+        return getattr(settings, "OPENAI_CIRCUIT_RESET_TIMEOUT", 30)
+
+    def before_call(self):
+        """
+        Check that a call may be made.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight
+        """
+        if cache.get(self.open_key):
+            raise CircuitOpenError(
+                f"OpenAI circuit {self.name} is open after repeated failures"
+            )
+        if cache.get(self.tripped_key) and not cache.add(
+            self.probe_key, 1, getattr(settings, "OPENAI_TIMEOUT", 60)
+        ):
+            raise CircuitOpenError(
+                f"OpenAI circuit {self.name} is waiting for a recovery probe"
+            )
+
+    def record_success(self):
+        """Close the circuit and reset the failure count."""
+        cache.delete_many([self.failures_key, self.tripped_key, self.probe_key])
+
+    def record_failure(self):
+        """Count a failure and open the circuit at the threshold or on a failed probe."""
+        if cache.get(self.tripped_key):
+            self._open()
+            return
+        cache.add(self.failures_key, 0, self.reset_timeout * 10)
+        try:
+            failures = cache.incr(self.failures_key)
+        except ValueError:
+            failures = 1
+        if failures >= getattr(settings, "OPENAI_CIRCUIT_FAILURE_THRESHOLD", 5):
+            self._open()
+
+    def _open(self):
+        logger.warning(f"Opening OpenAI circuit {self.name} for {self.reset_timeout}s")
+        cache.set(self.open_key, 1, self.reset_timeout)
+        cache.set(self.tripped_key, 1, None)
+        cache.delete_many([self.failures_key, self.probe_key])
+
+
+def record_latency(endpoint, seconds):
+    """Remember the latency of a successful call for hedging thresholds."""
+    with _latencies_lock:
+        _latencies[endpoint].append(seconds)
+
+
+def hedge_delay(endpoint):
+    """
+    Return how long to wait before hedging a call to ``endpoint``.
+
+    Args:
+        endpoint: Dotted resource path, as passed to openai_call()
+
+    Returns:
+        float: The OPENAI_HEDGE_PERCENTILE latency of recent calls in this
+        process, or None until there are enough samples
+    """
+    with _latencies_lock:
+        samples = sorted(_latencies[endpoint])
+    if len(samples) < MIN_HEDGE_SAMPLES:
+        return None
+    percentile = getattr(settings, "OPENAI_HEDGE_PERCENTILE", 95)
+    index = min(len(samples) - 1, int(len(samples) * percentile / 100))
+    return samples[index]
+
+
+def _get_hedge_executor():
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "OPENAI_HEDGE_WORKERS", 8),
+                thread_name_prefix="openai-hedge",
+            )
+        return _hedge_executor
+
+
+def _hedge_queue_depth():
+    # Submitted hedges waiting for a free thread (no public accessor).
+    executor = _hedge_executor
+    return executor._work_queue.qsize() if executor is not None else 0
+
+
+BACKGROUND_QUEUE_DEPTH.set_function(_hedge_queue_depth, queue="openai_hedge")
+
+
+def _start_primary(send):
+    """Run ``send()`` on a new thread right away and return its Future."""
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run():
+        try:
+            future.set_result(send())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="openai-primary", daemon=True).start()
+    return future
+
+
+def hedged(send, delay, may_hedge=lambda: True):
+    """
+    Run ``send()`` and, if it is slower than ``delay``, race a second copy.
+
+    Args:
+        send: Callable making the request
+        delay: Seconds to wait for the first attempt before hedging
+        may_hedge: Called before hedging; returning False skips the second
+            request (e.g. when the rate limit has no room for it)
+
+    Returns:
+        The result of the first attempt to succeed
+
+    Raises:
+        Exception: The error of the last attempt if none succeeded
+    """
+    # Not on the caller's thread: the caller must stay free to return the
+    # hedge's result while the first request is still outstanding.
+    pending = {_start_primary(send)}
+    done, _ = wait(pending, timeout=delay)
+    if not done and may_hedge():
+        pending.add(_get_hedge_executor().submit(send))
+
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                # The slower attempt finishes in the background; its result
+                # is discarded.
+                return future.result()
+            error = future.exception()
+    raise error
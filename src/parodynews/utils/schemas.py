@@ -3,19 +3,59 @@ File: schemas.py
 Description: JSON schema loading, validation, and $ref resolution helpers
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
 - jsonref: >=1.1.0
+- jsonschema: >=4.20.0
 
-Usage: from parodynews.utils.schemas import load_schemas
+Usage: from parodynews.utils.schemas import get_file_schema, validate_json_response
 """
 
+import hashlib
 import json
+import logging
 import os
+import threading
+from collections import OrderedDict
+from functools import cache
 
 import jsonref
+from jsonschema import SchemaError  # noqa: F401  (re-exported)
+from jsonschema import ValidationError as SchemaValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "schema")
+
+# Process-local registries keyed by JSONSchema.cache_key, file_schema_key() or,
+# for other schemas, schema_hash(). Resolved schemas are shared between callers
+# and must be treated as read-only. Every schema edit adds a key, so each
+# registry keeps only the REGISTRY_SIZE most recently used entries.
+REGISTRY_SIZE = 128
+
+_resolved_schemas = OrderedDict()
+_validators = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def _registry_get(registry, key):
+    with _registry_lock:
+        value = registry.get(key)
+        if value is not None:
+            registry.move_to_end(key)
+        return value
+
+
+def _registry_put(registry, key, value):
+    with _registry_lock:
+        registry[key] = value
+        registry.move_to_end(key)
+        while len(registry) > REGISTRY_SIZE:
+            registry.popitem(last=False)
 
 
 def resolve_refs(obj):
@@ -53,7 +93,7 @@ def load_schemas():
             if filename.endswith(".json"):
                 file_path = os.path.join(schema_dir, filename)
 
-                with open(file_path, "r") as file:
+                with open(file_path) as file:
                     content = json.load(file)
 
                 base_uri = f"file://{schema_dir}/"
@@ -69,3 +109,151 @@ def load_schemas():
         pass
 
     return schemas
+
+
+def schema_hash(schema):
+    """
+    Return a stable hash of a schema's content.
+
+    Args:
+        schema: JSON schema as a dict
+
+    Returns:
+        str: SHA-256 hex digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def file_schema_key(name):
+    """Return the registry key of a bundled schema."""
+    return f"file:{name}"
+
+
+def resolve_schema(schema, key=None):
+    """
+    Return a schema with every $ref expanded, resolving each distinct schema once.
+
+    Relative references are resolved against the bundled schema directory, so
+    DB-stored schemas may reference the files shipped with the app.
+
+    Args:
+        schema: JSON schema as a dict (file or JSONSchema.schema)
+        key: Registry key identifying this version of the schema, such as
+            JSONSchema.cache_key; defaults to a hash of its content
+
+    Returns:
+        dict: Resolved schema made of plain dicts and lists
+    """
+    key = key or schema_hash(schema)
+    resolved = _registry_get(_resolved_schemas, key)
+    if resolved is None:
+        resolved = jsonref.replace_refs(
+            schema,
+            base_uri=f"file://{SCHEMA_DIR}/",
+            proxies=False,
+            lazy_load=False,
+        )
+        _registry_put(_resolved_schemas, key, resolved)
+    return resolved
+
+
+@cache
+def get_file_schemas():
+    """
+    Load and resolve the bundled JSON schemas on first use.
+
+    Returns:
+        dict: Resolved schemas keyed by file name without the .json suffix
+    """
+    schemas = {}
+    try:
+        filenames = sorted(os.listdir(SCHEMA_DIR))
+    except FileNotFoundError:
+        return schemas
+
+    for filename in filenames:
+        if not filename.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(SCHEMA_DIR, filename)) as file:
+                schemas[filename[:-5]] = resolve_schema(
+                    json.load(file), key=file_schema_key(filename[:-5])
+                )
+        except (json.JSONDecodeError, jsonref.JsonRefError) as e:
+            logger.warning("Skipping invalid schema %s: %s", filename, e)
+    return schemas
+
+
+def get_file_schema(name):
+    """
+    Return a bundled schema by name, resolved.
+
+    Args:
+        name: Schema file name without the .json suffix
+
+    Returns:
+        dict or None: Resolved schema, or None if it does not exist
+    """
+    return get_file_schemas().get(name)
+
+
+def get_validator(schema, key=None):
+    """
+    Return a compiled validator for a schema, built once per distinct schema.
+
+    The validator class follows the schema's "$schema" keyword.
+
+    Args:
+        schema: JSON schema as a dict
+        key: Registry key, as for resolve_schema()
+
+    Returns:
+        jsonschema validator instance
+
+    Raises:
+        SchemaError: If the schema itself is invalid
+    """
+    key = key or schema_hash(schema)
+    validator = _registry_get(_validators, key)
+    if validator is None:
+        resolved = resolve_schema(schema, key=key)
+        validator_class = validator_for(resolved)
+        validator_class.check_schema(resolved)
+        validator = validator_class(resolved)
+        _registry_put(_validators, key, validator)
+    return validator
+
+
+def validate_json_response(schema, text, key=None):
+    """
+    Parse a structured-output response and validate it against a schema.
+
+    Args:
+        schema: JSON schema the response was requested with
+        text: Raw response text
+        key: Registry key, as for resolve_schema()
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        SchemaValidationError: If the text is not JSON or does not match
+    """
+    try:
+        data = json.loads(text)
+    except (TypeError, json.JSONDecodeError) as e:
+        raise SchemaValidationError(f"Response is not valid JSON: {e}") from e
+
+    error = best_match(get_validator(schema, key=key).iter_errors(data))
+    if error is not None:
+        raise error
+    return data
+
+
+def clear_schema_cache():
+    """Drop every resolved schema and compiled validator in this process."""
+    with _registry_lock:
+        _resolved_schemas.clear()
+        _validators.clear()
+    get_file_schemas.cache_clear()
@@ -0,0 +1,570 @@
+"""
+File: sync.py
+Description: Bulk-upsert synchronisation of assistants, models and thread messages from the OpenAI API
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+- openai: >=1.57.0
+
+Usage: from parodynews.utils.sync import sync_assistants, sync_models, sync_thread_messages
+
+Pages through every assistant with the list cursor, diffs each page against
+the local rows and writes only what changed, with bulk statements inside one
+transaction. The OpenAI list endpoint has no "modified since" filter, so each
+run reads all pages, but unchanged assistants cost neither a write nor a
+transfer of their instructions (compared by MD5 computed in the database).
+"""
+
+import hashlib
+import logging
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from django.db import transaction
+from django.db.models import Max
+from django.db.models.functions import MD5
+from openai import BadRequestError, NotFoundError
+
+from .ratelimit import openai_call
+
+logger = logging.getLogger(__name__)
+
+# The maximum page size of the OpenAI list endpoints
+DEFAULT_PAGE_SIZE = 100
+
+# Assistant columns written by the sync, besides the primary key.
+SYNC_FIELDS = (
+    "name",
+    "description",
+    "instructions",
+    "model",
+    "json_schema",
+    "metadata",
+    "tools",
+    "temperature",
+    "top_p",
+)
+
+SyncResult = namedtuple(
+    "SyncResult", ["pages", "fetched", "created", "updated", "unchanged"]
+)
+ModelSyncResult = namedtuple("ModelSyncResult", ["fetched", "pruned", "kept"])
+ThreadSyncResult = namedtuple("ThreadSyncResult", ["pages", "fetched", "created"])
+
+
+def iter_remote_assistant_pages(client, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Yield every page of assistants from the OpenAI API.
+
+    Args:
+        client: OpenAI client instance
+        page_size: Assistants per request (the API allows 1-100)
+
+    Yields:
+        list: OpenAI assistant objects, oldest first
+    """
+    after = None
+    while True:
+        params = {"limit": page_size, "order": "asc"}
+        if after:
+            params["after"] = after
+        page = openai_call(
+            client,
+            "beta.assistants",
+            method="list",
+            call_site="sync_assistants",
+            **params,
+        )
+        if not page.data:
+            return
+        yield page.data
+        if not page.has_more:
+            return
+        after = page.data[-1].id
+
+
+def _remote_schema(assistant_data):
+    """Return the response-format JSON schema of a remote assistant, if any."""
+    json_schema = getattr(assistant_data.response_format, "json_schema", None)
+    if json_schema is None:
+        return None
+    return {
+        "name": json_schema.name or "",
+        "description": json_schema.description or "",
+        "schema": json_schema.schema_ or {},
+    }
+
+
+def remote_assistant_values(assistant_data):
+    """
+    Map an OpenAI assistant onto Assistant field values.
+
+    Foreign keys are returned by natural key: "model" as the model id and
+    "json_schema" as the schema dict (or None).
+
+    Args:
+        assistant_data: OpenAI assistant object
+
+    Returns:
+        dict: Values for SYNC_FIELDS
+    """
+    return {
+        "name": assistant_data.name or "",
+        "description": assistant_data.description or "",
+        "instructions": assistant_data.instructions or "",
+        "model": assistant_data.model or "",
+        "json_schema": _remote_schema(assistant_data),
+        "metadata": assistant_data.metadata or {},
+        "tools": [tool.model_dump(exclude_none=True) for tool in assistant_data.tools],
+        "temperature": assistant_data.temperature,
+        "top_p": assistant_data.top_p,
+    }
+
+
+def _md5(text):
+    return hashlib.md5(text.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _local_state(ids):
+    """Return comparable values of the local assistants with ``ids``, by id."""
+    from ..models import Assistant
+
+    rows = (
+        Assistant.objects.filter(id__in=ids)
+        .order_by()
+        .values(
+            "id",
+            "name",
+            "description",
+            "metadata",
+            "tools",
+            "temperature",
+            "top_p",
+            "model__model_id",
+            "json_schema__name",
+            "json_schema__description",
+            "json_schema__schema",
+            instructions_md5=MD5("instructions"),
+        )
+    )
+    return {row["id"]: row for row in rows}
+
+
+def _is_unchanged(local, remote):
+    """Compare a local row from _local_state() with remote_assistant_values()."""
+    schema = remote["json_schema"]
+    return (
+        local["name"] == remote["name"]
+        and local["description"] == remote["description"]
+        and local["instructions_md5"] == _md5(remote["instructions"])
+        and local["model__model_id"] == remote["model"]
+        and (
+            local["json_schema__name"],
+            local["json_schema__description"],
+            local["json_schema__schema"],
+        )
+        == (
+            (schema["name"], schema["description"], schema["schema"])
+            if schema
+            else (None, None, None)
+        )
+        and local["metadata"] == remote["metadata"]
+        and local["tools"] == remote["tools"]
+        and local["temperature"] == remote["temperature"]
+        and local["top_p"] == remote["top_p"]
+    )
+
+
+def diff_remote_assistants(pages):
+    """
+    Split remote assistants into new, changed and unchanged ones.
+
+    Args:
+        pages: Iterable of pages of OpenAI assistant objects
+
+    Returns:
+        tuple: (changes, stats) where changes maps id to (values, created) for
+            assistants that need writing, and stats counts pages, fetched and
+            unchanged assistants
+    """
+    changes = {}
+    stats = {"pages": 0, "fetched": 0, "unchanged": 0}
+    for page in pages:
+        stats["pages"] += 1
+        stats["fetched"] += len(page)
+        local = _local_state([assistant.id for assistant in page])
+        for assistant_data in page:
+            values = remote_assistant_values(assistant_data)
+            row = local.get(assistant_data.id)
+            if row is not None and _is_unchanged(row, values):
+                stats["unchanged"] += 1
+            else:
+                changes[assistant_data.id] = (values, row is None)
+    return changes, stats
+
+
+def _resolve_models(model_ids):
+    """Return OpenAIModel primary keys by model id and the pks of new models."""
+    from ..models import OpenAIModel
+
+    model_ids = {model_id for model_id in model_ids if model_id}
+    existing = dict(
+        OpenAIModel.objects.filter(model_id__in=model_ids)
+        .order_by()
+        .values_list("model_id", "id")
+    )
+    missing = model_ids - existing.keys()
+    if not missing:
+        return existing, []
+
+    OpenAIModel.objects.bulk_create(
+        [OpenAIModel(model_id=model_id) for model_id in missing],
+        ignore_conflicts=True,
+    )
+    created = dict(
+        OpenAIModel.objects.filter(model_id__in=missing)
+        .order_by()
+        .values_list("model_id", "id")
+    )
+    return existing | created, list(created.values())
+
+
+def _resolve_schemas(schemas):
+    """Create or update JSONSchema rows by name.
+
+    Returns:
+        tuple: (primary keys by schema name, pks of created or updated rows)
+    """
+    from ..models import JSONSchema
+
+    by_name = {schema["name"]: schema for schema in schemas}
+    existing = {}
+    # Names are not unique; like update_or_create, use the first match.
+    for schema in JSONSchema.objects.filter(name__in=by_name).order_by("-pk"):
+        existing[schema.name] = schema
+
+    to_create, to_update = [], []
+    updated_at = datetime.now(timezone.utc)
+    for name, values in by_name.items():
+        schema = existing.get(name)
+        if schema is None:
+            to_create.append(JSONSchema(**values))
+        elif (schema.description, schema.schema) != (
+            values["description"],
+            values["schema"],
+        ):
+            schema.description = values["description"]
+            schema.schema = values["schema"]
+            # bulk_update() skips auto_now; updated_at is part of cache_key.
+            schema.updated_at = updated_at
+            to_update.append(schema)
+
+    created = JSONSchema.objects.bulk_create(to_create)
+    JSONSchema.objects.bulk_update(to_update, ["description", "schema", "updated_at"])
+    pks = {schema.name: schema.pk for schema in [*existing.values(), *created]}
+    return pks, [schema.pk for schema in created + to_update]
+
+
+def apply_assistant_changes(changes):
+    """
+    Write new and changed assistants in one transaction.
+
+    Args:
+        changes: Mapping of id to (values, created) from diff_remote_assistants()
+    """
+    from ..models import Assistant, JSONSchema, OpenAIModel
+    from ..signals import invalidate_bulk_changes
+
+    if not changes:
+        return
+
+    with transaction.atomic():
+        model_pks, created_models = _resolve_models(
+            values["model"] for values, _ in changes.values()
+        )
+        schema_pks, written_schemas = _resolve_schemas(
+            values["json_schema"]
+            for values, _ in changes.values()
+            if values["json_schema"]
+        )
+
+        assistants = []
+        for assistant_id, (values, _) in changes.items():
+            fields = {
+                name: value
+                for name, value in values.items()
+                if name not in ("model", "json_schema")
+            }
+            schema = values["json_schema"]
+            assistants.append(
+                Assistant(
+                    id=assistant_id,
+                    model_id=model_pks.get(values["model"]),
+                    json_schema_id=schema_pks[schema["name"]] if schema else None,
+                    **fields,
+                )
+            )
+        Assistant.objects.bulk_create(
+            assistants,
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=list(SYNC_FIELDS),
+        )
+
+        # Bulk writes send no post_save, so invalidate caches explicitly.
+        def invalidate():
+            if created_models:
+                invalidate_bulk_changes(OpenAIModel, created_models)
+            if written_schemas:
+                invalidate_bulk_changes(JSONSchema, written_schemas)
+            invalidate_bulk_changes(Assistant, changes)
+
+        transaction.on_commit(invalidate)
+
+
+def sync_assistants(client, page_size=DEFAULT_PAGE_SIZE, dry_run=False):
+    """
+    Synchronise local Assistant rows with every assistant in the OpenAI account.
+
+    Args:
+        client: OpenAI client instance
+        page_size: Assistants fetched per API request
+        dry_run: Diff only, without writing anything
+
+    Returns:
+        SyncResult: Counts of pages, fetched, created, updated and unchanged
+    """
+    changes, stats = diff_remote_assistants(
+        iter_remote_assistant_pages(client, page_size)
+    )
+    created = sum(1 for _, is_new in changes.values() if is_new)
+    if not dry_run:
+        apply_assistant_changes(changes)
+
+    result = SyncResult(
+        pages=stats["pages"],
+        fetched=stats["fetched"],
+        created=created,
+        updated=len(changes) - created,
+        unchanged=stats["unchanged"],
+    )
+    logger.info(f"Assistant sync{' (dry run)' if dry_run else ''}: {result}")
+    return result
+
+
+def sync_models(client, prune=False):
+    """
+    Upsert every model the OpenAI account can use, in one statement.
+
+    Args:
+        client: OpenAI client instance
+        prune: Delete local models that are no longer listed. Models still
+            referenced by an assistant are kept so that no assistant loses
+            its model.
+
+    Returns:
+        ModelSyncResult: Models fetched, pruned, and retired models kept
+    """
+    from ..models import OpenAIModel
+    from ..signals import invalidate_bulk_changes
+
+    # The models endpoint returns the whole catalogue in a single page.
+    page = openai_call(client, "models", method="list", call_site="sync_models")
+    model_ids = sorted({model.id for model in page.data})
+
+    pruned = kept = 0
+    with transaction.atomic():
+        # Only updated_at changes on conflict, so curated descriptions survive.
+        upserted = OpenAIModel.objects.bulk_create(
+            [OpenAIModel(model_id=model_id) for model_id in model_ids],
+            update_conflicts=True,
+            unique_fields=["model_id"],
+            update_fields=["updated_at"],
+        )
+        written = [model.pk for model in upserted]
+
+        if prune:
+            retired = OpenAIModel.objects.exclude(model_id__in=model_ids)
+            kept = retired.filter(assistant__isnull=False).distinct().count()
+            removed = list(
+                retired.filter(assistant__isnull=True).values_list("pk", flat=True)
+            )
+            pruned = OpenAIModel.objects.filter(pk__in=removed).delete()[0]
+            written += removed
+
+        transaction.on_commit(lambda: invalidate_bulk_changes(OpenAIModel, written))
+
+    result = ModelSyncResult(fetched=len(model_ids), pruned=pruned, kept=kept)
+    logger.info(f"Model sync: {result}")
+    return result
+
+
+def iter_remote_message_pages(
+    client, thread_id, after=None, page_size=DEFAULT_PAGE_SIZE
+):
+    """
+    Yield pages of a thread's messages, oldest first, after a cursor.
+
+    Args:
+        client: OpenAI client instance
+        thread_id: OpenAI thread id
+        after: Id of the last message already seen, or None for all
+        page_size: Messages per request (the API allows 1-100)
+
+    Yields:
+        list: OpenAI message objects
+    """
+    while True:
+        params = {"thread_id": thread_id, "limit": page_size, "order": "asc"}
+        if after:
+            params["after"] = after
+        # Runs on every thread page view: bounded by OPENAI_TIMEOUT and the
+        # circuit breaker, without retries.
+        page = openai_call(
+            client,
+            "beta.threads.messages",
+            method="list",
+            call_site="sync_thread_messages",
+            max_retries=0,
+            **params,
+        )
+        if page.data:
+            yield page.data
+        if not page.has_more or not page.data:
+            return
+        after = page.data[-1].id
+
+
+def _message_text(message_data):
+    """Return the text of the first text block of an OpenAI message."""
+    for block in message_data.content or []:
+        if block.type == "text":
+            return block.text.value
+    return ""
+
+
+def sync_thread_messages(client, thread, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Copy messages added to an OpenAI thread since the last sync.
+
+    Only messages after Thread.last_synced_message_id are requested, so a
+    thread that has not changed costs one empty list call. New messages get a
+    Message row and, when the thread belongs to a content detail, a
+    ContentItem, both written in bulk. Concurrent syncs of one thread are
+    serialised on its row, so they never copy a message twice.
+
+    Args:
+        client: OpenAI client instance
+        thread: Thread model instance
+        page_size: Messages per API request
+
+    Returns:
+        ThreadSyncResult: Pages fetched, messages fetched and messages created
+    """
+    from ..models import Assistant, ContentItem, Message, Thread
+    from ..signals import invalidate_bulk_changes
+
+    cursor = thread.last_synced_message_id or None
+    try:
+        pages = list(iter_remote_message_pages(client, thread.id, cursor, page_size))
+    except (BadRequestError, NotFoundError):
+        if cursor is None:
+            raise
+        # The cursor message was deleted remotely; start over from the top.
+        logger.warning(f"Sync cursor {cursor} of thread {thread.id} is gone")
+        cursor = None
+        pages = list(iter_remote_message_pages(client, thread.id, None, page_size))
+
+    remote = [message for page in pages for message in page]
+    if not remote:
+        return ThreadSyncResult(pages=len(pages), fetched=0, created=0)
+
+    with transaction.atomic():
+        # Serialise syncs of this thread. A concurrent sync may have copied
+        # the same messages while we were fetching, so everything below is
+        # read only once the lock is held.
+        Thread.objects.select_for_update().filter(pk=thread.pk).first()
+        ids = [message.id for message in remote]
+        known = set(Message.objects.filter(id__in=ids).values_list("id", flat=True))
+        new = [message for message in remote if message.id not in known]
+        assistant_ids = set(
+            Assistant.objects.filter(
+                id__in={m.assistant_id for m in new if m.assistant_id}
+            ).values_list("id", flat=True)
+        )
+        # Content items hang off the thread's content detail, as in create_run().
+        detail_id = (
+            Message.objects.filter(thread=thread, contentitem__isnull=False)
+            .values_list("contentitem__detail_id", flat=True)
+            .first()
+        )
+
+        items = {}
+        if new and detail_id:
+            # bulk_create skips ContentItem.save(), which numbers lines.
+            last_line = (
+                ContentItem.objects.filter(detail_id=detail_id).aggregate(
+                    Max("line_number")
+                )["line_number__max"]
+                or 0
+            )
+            for line, message in enumerate(new, start=last_line + 1):
+                assistant_id = (
+                    message.assistant_id
+                    if message.assistant_id in assistant_ids
+                    else None
+                )
+                items[message.id] = ContentItem(
+                    detail_id=detail_id,
+                    line_number=line,
+                    content_type="message",
+                    content_text=_message_text(message),
+                    assistant_id=assistant_id,
+                    prompt="",
+                )
+            ContentItem.objects.bulk_create(items.values())
+
+        # No ignore_conflicts: if create_run() inserted one of these messages
+        # meanwhile, the whole sync rolls back (and runs again on the next
+        # visit) instead of leaving content items without a message.
+        Message.objects.bulk_create(
+            [
+                Message(
+                    id=message.id,
+                    thread=thread,
+                    created_at=datetime.fromtimestamp(
+                        message.created_at, tz=timezone.utc
+                    ),
+                    assistant_id=(
+                        message.assistant_id
+                        if message.assistant_id in assistant_ids
+                        else None
+                    ),
+                    contentitem=items.get(message.id),
+                    status=message.status or "completed",
+                    run_id=message.run_id,
+                )
+                for message in new
+            ],
+        )
+
+        thread.last_synced_message_id = remote[-1].id
+        Thread.objects.filter(pk=thread.pk).update(
+            last_synced_message_id=thread.last_synced_message_id
+        )
+
+        def invalidate():
+            if items:
+                invalidate_bulk_changes(
+                    ContentItem, [item.pk for item in items.values()]
+                )
+            if new:
+                invalidate_bulk_changes(Message, [message.id for message in new])
+
+        transaction.on_commit(invalidate)
+
+    return ThreadSyncResult(pages=len(pages), fetched=len(remote), created=len(new))
@@ -0,0 +1,192 @@
+"""
+File: tables.py
+Description: Server-side sorting, filtering and pagination for model listing tables
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: from parodynews.utils.tables import apply_table_query
+"""
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import models
+from django.db.models.query import QuerySet
+from django.http import QueryDict
+
+SORT_PARAM = "sort"
+PAGE_PARAM = "page"
+PER_PAGE_PARAM = "per_page"
+FILTER_PREFIX = "filter_"
+MAX_PER_PAGE = 100
+
+# Fields that are matched with a case-insensitive substring search.
+TEXT_FIELDS = (models.CharField, models.TextField)
+# Fields whose ordering would need a full sort of large values.
+UNSORTABLE_FIELDS = (models.TextField, models.JSONField)
+# Preferred human-readable columns when filtering on a foreign key.
+RELATED_LABEL_FIELDS = ("name", "title", "model_id")
+
+
+def _concrete_fields(model, display_fields):
+    fields = {field.name: field for field in model._meta.concrete_fields}
+    return [fields[name] for name in display_fields if name in fields]
+
+
+def sortable_fields(model, display_fields):
+    """
+    Return the display fields that may be used for ordering.
+
+    Args:
+        model: Django model class of the listing
+        display_fields: Field names shown in the table
+
+    Returns:
+        list: Names of concrete, non-text fields
+    """
+    return [
+        field.name
+        for field in _concrete_fields(model, display_fields)
+        if not isinstance(field, UNSORTABLE_FIELDS)
+    ]
+
+
+def _filter_lookup(field, value):
+    """Return a ``(lookup, value)`` pair for a column filter, or ``None``."""
+    if field.is_relation:
+        related = field.related_model._meta
+        names = {f.name for f in related.concrete_fields}
+        for label in RELATED_LABEL_FIELDS:
+            if label in names:
+                return f"{field.name}__{label}__icontains", value
+        return f"{field.name}__pk", value
+
+    if isinstance(field, TEXT_FIELDS):
+        return f"{field.name}__icontains", value
+
+    try:
+        if isinstance(field, models.DateTimeField):
+            return f"{field.name}__date", models.DateField().to_python(value)
+        return field.name, field.to_python(value)
+    except ValidationError:
+        return None
+
+
+def filter_queryset(queryset, params, display_fields):
+    """
+    Apply ``filter_<field>`` query parameters to a queryset.
+
+    Args:
+        queryset: QuerySet being listed
+        params: QueryDict of request parameters
+        display_fields: Field names shown in the table
+
+    Returns:
+        tuple: (filtered queryset, dict of active filter values by field name)
+    """
+    active = {}
+    for field in _concrete_fields(queryset.model, display_fields):
+        value = params.get(f"{FILTER_PREFIX}{field.name}", "").strip()
+        if not value:
+            continue
+        lookup = _filter_lookup(field, value)
+        if lookup is None:
+            continue
+        queryset = queryset.filter(**{lookup[0]: lookup[1]})
+        active[field.name] = value
+    return queryset, active
+
+
+def sort_queryset(queryset, params, display_fields):
+    """
+    Apply the ``sort`` query parameter (``field`` or ``-field``) to a queryset.
+
+    Args:
+        queryset: QuerySet being listed
+        params: QueryDict of request parameters
+        display_fields: Field names shown in the table
+
+    Returns:
+        tuple: (ordered queryset, applied sort string or empty string)
+    """
+    sort = params.get(SORT_PARAM, "")
+    name = sort.lstrip("-")
+    if not name or name not in sortable_fields(queryset.model, display_fields):
+        return queryset, ""
+    # The primary key tiebreaker keeps pagination stable across equal values.
+    tiebreaker = "-pk" if sort.startswith("-") else "pk"
+    return queryset.order_by(sort, tiebreaker), sort
+
+
+def paginate(objects, params):
+    """
+    Return the requested page of a listing.
+
+    Args:
+        objects: QuerySet or sequence being listed
+        params: QueryDict of request parameters
+
+    Returns:
+        Page: Django paginator page
+    """
+    default = getattr(settings, "MODEL_TABLE_PAGE_SIZE", 25)
+    try:
+        per_page = int(params.get(PER_PAGE_PARAM, default))
+    except (TypeError, ValueError):
+        per_page = default
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    return Paginator(objects, per_page).get_page(params.get(PAGE_PARAM))
+
+
+def apply_table_query(objects, params, display_fields):
+    """
+    Filter, sort and paginate a listing from request query parameters.
+
+    Plain sequences are only paginated; filtering and sorting require a
+    QuerySet so they run in the database.
+
+    Args:
+        objects: QuerySet or sequence being listed
+        params: QueryDict of request parameters
+        display_fields: Field names shown in the table
+
+    Returns:
+        dict: ``page``, ``filters``, ``sort`` and ``sortable`` entries
+    """
+    filters, sort, sortable = {}, "", []
+    if isinstance(objects, QuerySet):
+        objects, filters = filter_queryset(objects, params, display_fields)
+        objects, sort = sort_queryset(objects, params, display_fields)
+        sortable = sortable_fields(objects.model, display_fields)
+    return {
+        "page": paginate(objects, params),
+        "filters": filters,
+        "sort": sort,
+        "sortable": sortable,
+    }
+
+
+def querystring(params, **updates):
+    """
+    Return ``params`` re-encoded as a query string with some keys replaced.
+
+    Args:
+        params: QueryDict of request parameters
+        **updates: Keys to set; a value of ``None`` removes the key
+
+    Returns:
+        str: Query string starting with ``?``
+    """
+    query = params.copy() if isinstance(params, QueryDict) else QueryDict(mutable=True)
+    query._mutable = True
+    for key, value in updates.items():
+        if value is None:
+            query.pop(key, None)
+        else:
+            query[key] = value
+    return f"?{query.urlencode()}"
@@ -3,7 +3,7 @@ File: threads.py
 Description: Thread and message helper functions for OpenAI assistant workflows
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -15,6 +15,9 @@ Usage: from parodynews.utils.threads import create_thread
 import json
 import time
 
+from .instrumentation import collect_openai_usage
+from .ratelimit import openai_call
+
 
 def openai_create_message(client, contentitem):
     """
@@ -27,15 +30,23 @@ def openai_create_message(client, contentitem):
     Returns:
         tuple: (message, thread_id) - OpenAI message object and thread ID
     """
-    thread = client.beta.threads.create(
+    thread = openai_call(
+        client,
+        "beta.threads",
+        call_site="openai_create_message",
         metadata={
             "type": "news_article_thread",
             "title": contentitem.detail.title,
             "description": contentitem.detail.description,
         },
     )
-    message = client.beta.threads.messages.create(
-        thread_id=thread.id, role="user", content=contentitem.content_text
+    message = openai_call(
+        client,
+        "beta.threads.messages",
+        call_site="openai_create_message",
+        thread_id=thread.id,
+        role="user",
+        content=contentitem.content_text,
     )
     return message, thread.id
 
@@ -52,7 +63,11 @@ def openai_delete_message(client, message_id, thread_id):
     Returns:
         dict: Deletion confirmation from OpenAI API
     """
-    deleted_message = client.beta.threads.messages.delete(
+    deleted_message = openai_call(
+        client,
+        "beta.threads.messages",
+        method="delete",
+        call_site="openai_delete_message",
         message_id=message_id,
         thread_id=thread_id,
     )
@@ -73,38 +88,63 @@ def create_run(client, thread_id, assistant_id):
     """
     from ..models import Assistant, ContentItem, Message
 
-    run = client.beta.threads.runs.create(
-        thread_id=thread_id,
-        assistant_id=assistant_id,
+    # Runs count against the limits of the assistant's model.
+    model_id = (
+        Assistant.objects.filter(pk=assistant_id)
+        .values_list("model__model_id", flat=True)
+        .first()
     )
+    with collect_openai_usage() as usage:
+        run = openai_call(
+            client,
+            "beta.threads.runs",
+            call_site="create_run",
+            bucket=model_id or "default",
+            thread_id=thread_id,
+            assistant_id=assistant_id,
+        )
 
-    start_time = time.time()
-    time_limit = 60
-
-    while True:
-        run_status = client.beta.threads.runs.retrieve(
+        start_time = time.time()
+        time_limit = 60
+
+        while True:
+            # The completed run reports the tokens used by the whole run.
+            run_status = openai_call(
+                client,
+                "beta.threads.runs",
+                method="retrieve",
+                call_site="create_run",
+                thread_id=thread_id,
+                run_id=run.id,
+            )
+
+            if run_status.status == "completed":
+                break
+
+            if time.time() - start_time > time_limit:
+                raise TimeoutError("The operation timed out.")
+
+            time.sleep(2)
+
+        message_response = openai_call(
+            client,
+            "beta.threads.messages",
+            method="list",
+            call_site="create_run",
             thread_id=thread_id,
             run_id=run.id,
         )
 
-        if run_status.status == "completed":
-            break
-
-        if time.time() - start_time > time_limit:
-            raise TimeoutError("The operation timed out.")
-
-        time.sleep(2)
-
-    message_response = client.beta.threads.messages.list(
-        thread_id=thread_id, run_id=run.id
-    )
-
-    message_response_id = message_response.data[0].id
+        message_response_id = message_response.data[0].id
 
-    response = client.beta.threads.messages.retrieve(
-        message_id=message_response_id,
-        thread_id=thread_id,
-    )
+        response = openai_call(
+            client,
+            "beta.threads.messages",
+            method="retrieve",
+            call_site="create_run",
+            message_id=message_response_id,
+            thread_id=thread_id,
+        )
 
     data = response.content[0].text.value
     assistant_id = response.assistant_id
@@ -133,6 +173,7 @@ def create_run(client, thread_id, assistant_id):
         content_text=content_text,
         detail_id=content_detail_id,
         content_type="message",
+        **usage.as_fields(),
     )
 
     new_message = Message.objects.create(
@@ -160,28 +201,38 @@ def create_run(client, thread_id, assistant_id):
     return run, run_status, run_response
 
 
-def openai_list_messages(client, thread_id):
+def openai_list_messages(client, thread_id, page_size=100):
     """
     Retrieve and format messages from an OpenAI thread.
 
     Args:
         client: OpenAI client instance
         thread_id: Thread identifier to retrieve messages from
+        page_size: Messages per API request; 100 is the API maximum
 
     Returns:
         list: Formatted message list with id, text, and assistant_id
     """
-    thread_messages = client.beta.threads.messages.list(
-        thread_id=thread_id,
-        limit=10,
-    )
-
-    formatted_messages = [
-        {
-            "id": message.id,
-            "text": message.content[0].text.value,
-            "assistant_id": message.assistant_id,
-        }
-        for message in thread_messages
-    ]
-    return formatted_messages
+    formatted_messages = []
+    params = {"thread_id": thread_id, "limit": page_size}
+    while True:
+        # Paged by hand: the SDK's auto-pagination would fetch later pages
+        # outside openai_call().
+        page = openai_call(
+            client,
+            "beta.threads.messages",
+            method="list",
+            call_site="openai_list_messages",
+            **params,
+        )
+        formatted_messages.extend(
+            {
+                "id": message.id,
+                "text": message.content[0].text.value,
+                "assistant_id": message.assistant_id,
+            }
+            for message in page.data
+        )
+        if not page.has_more or not page.data:
+            return formatted_messages
+        params["after"] = page.data[-1].id
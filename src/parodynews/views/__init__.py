@@ -39,6 +39,9 @@ from .base import FooterView, UserLoginView, index
 # Content management views
 from .content import ManageContentView
 
+# Metrics endpoint
+from .metrics import metrics_view
+
 # Post management views
 from .posts import ManagePostView, push_to_github_and_create_pr
 
@@ -71,6 +74,8 @@ __all__ = [
     "ManageAssistantsView",
     "ManageAssistantGroupsView",
     "get_assistant_details",
+    # Metrics
+    "metrics_view",
     # Posts
     "ManagePostView",
     "push_to_github_and_create_pr",
@@ -3,7 +3,7 @@ File: api.py
 Description: Django REST Framework viewsets for parodynews API endpoints
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -30,6 +30,7 @@ from ..models import (
 )
 from ..serializers import (
     AssistantGroupSerializer,
+    AssistantListSerializer,
     AssistantSerializer,
     ContentDetailSerializer,
     ContentItemSerializer,
@@ -49,6 +50,18 @@ class AssistantViewSet(viewsets.ModelViewSet):
     queryset = Assistant.objects.all()
     serializer_class = AssistantSerializer
 
+    def get_queryset(self):
+        # Lists leave the large instructions/prompt/JSON columns in the database;
+        # retrieve and update still load the full row.
+        if self.action == "list":
+            return Assistant.objects.listing()
+        return super().get_queryset()
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AssistantListSerializer
+        return super().get_serializer_class()
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
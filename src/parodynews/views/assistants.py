@@ -3,7 +3,7 @@ File: assistants.py
 Description: Views for creating and managing OpenAI assistants
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -48,7 +48,7 @@ class ManageAssistantsView(
             is_edit = False
 
         assistant_form = AssistantForm(instance=assistant)
-        assistants_info = Assistant.objects.all()
+        assistants_info = Assistant.objects.listing()
         fields, display_fields = self.get_model_fields()
 
         return render(
@@ -122,7 +122,7 @@ class ManageAssistantsView(
 
     def render_form(self, request, assistant_form, assistant_id=None):
         """Render assistant form state with the list view context."""
-        assistants_info = Assistant.objects.all()
+        assistants_info = Assistant.objects.listing()
         fields, display_fields = self.get_model_fields()
         return render(
             request,
@@ -151,7 +151,7 @@ class ManageAssistantsView(
 def get_assistant_details(request, assistant_id):
     """AJAX endpoint for retrieving assistant details."""
     try:
-        assistant = Assistant.objects.get(id=assistant_id)
+        assistant = Assistant.objects.only("id", "instructions").get(id=assistant_id)
         instructions = assistant.instructions
 
         data = {
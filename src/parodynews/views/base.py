@@ -3,7 +3,7 @@ File: base.py
 Description: Base template views (index, login, footer) for parodynews
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -16,7 +16,7 @@ from django.contrib.auth.views import LoginView
 from django.shortcuts import render
 from django.views.generic import TemplateView
 
-from ..models import PoweredBy
+from ..context_processors import get_powered_by
 
 
 class FooterView(TemplateView):
@@ -27,7 +27,7 @@ class FooterView(TemplateView):
     def get_context_data(self, **kwargs):
         """Get context data including PoweredBy objects for footer display."""
         context = super().get_context_data(**kwargs)
-        context["powered_by"] = PoweredBy.objects.all()
+        context["powered_by"] = get_powered_by()
         return context
 
 
@@ -24,7 +24,13 @@ from django.views import View
 from ..forms import ContentDetailForm, ContentItemForm
 from ..mixins import AppConfigClientMixin, ModelFieldsMixin
 from ..models import ContentDetail, ContentItem, Message, Thread
-from ..utils import generate_content, openai_create_message
+from ..utils import (
+    OpenAIUnavailableError,
+    SchemaError,
+    SchemaValidationError,
+    generate_content,
+    openai_create_message,
+)
 
 
 class ManageContentView(
@@ -151,7 +157,19 @@ class ManageContentView(
         content_detail_id = request.POST.get("content_detail_id")
         content_form = ContentItem.objects.get(detail_id=content_detail_id)
         content_detail = ContentDetail.objects.get(pk=content_detail_id)
-        data, content_detail_schema = generate_content(client, content_form)
+        try:
+            data, content_detail_schema = generate_content(client, content_form)
+        except SchemaError as e:
+            messages.error(
+                request, f"The assistant's JSON schema is invalid: {e.message}"
+            )
+            return redirect("content_detail", content_detail_id=content_detail_id)
+        except SchemaValidationError as e:
+            messages.error(request, f"Generated content was rejected: {e.message}")
+            return redirect("content_detail", content_detail_id=content_detail_id)
+        except OpenAIUnavailableError as e:
+            messages.error(request, f"OpenAI is unavailable, try again shortly: {e}")
+            return redirect("content_detail", content_detail_id=content_detail_id)
         json_data = json.loads(content_detail_schema)
 
         try:
@@ -0,0 +1,57 @@
+"""
+File: metrics.py
+Description: Prometheus scrape endpoint for parodynews metrics
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: Included via parodynews URL routing at /metrics.
+"""
+
+import ipaddress
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+
+# Imported for their metric definitions, so they are exported before the
+# first OpenAI call in this process.
+from ..metrics import render_metrics
+from ..utils import instrumentation, resilience  # noqa: F401
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@require_GET
+def metrics_view(request):
+    """Return all metrics in the Prometheus text format.
+
+    When METRICS_TOKEN is set, scrapers must send it as a bearer token.
+    Without a token only clients in METRICS_ALLOWED_NETWORKS are served.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token:
+        allowed = constant_time_compare(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        )
+    else:
+        allowed = _is_allowed_address(request.META.get("REMOTE_ADDR", ""))
+    if not allowed:
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
+
+
+def _is_allowed_address(address):
+    try:
+        address = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    networks = getattr(settings, "METRICS_ALLOWED_NETWORKS", ["127.0.0.0/8", "::1/128"])
+    return any(
+        address in ipaddress.ip_network(network, strict=False) for network in networks
+    )
@@ -3,7 +3,7 @@ File: posts.py
 Description: Views for creating, editing, and publishing posts
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -17,14 +17,31 @@ import yaml
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect, render
+from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView
 from github import Github
 
 from ..forms import PostForm, PostFrontMatterForm
 from ..mixins import ModelFieldsMixin
 from ..models import AppConfig, Post, PostFrontMatter, PostVersion
-
-
+from ..page_cache import cache_page_policy
+
+
+# The page lists the user's posts and offers the related objects as form choices.
+@method_decorator(
+    cache_page_policy(
+        tags=(
+            "post",
+            "post:{post_id}",
+            "postfrontmatter",
+            "contentdetail",
+            "thread",
+            "message",
+            "assistant",
+        )
+    ),
+    name="get",
+)
 class ManagePostView(LoginRequiredMixin, ModelFieldsMixin, TemplateView):
     """
     Comprehensive post management interface for content creators.
@@ -3,7 +3,7 @@ File: threads.py
 Description: Views for thread and message management in AI conversations
 Author: Barodybroject Team <team@example.com>
 Created: 2025-12-19
-Last Modified: 2025-12-20
+Last Modified: 2026-10-19
 Version: 0.4.0
 
 Dependencies:
@@ -13,13 +13,13 @@ Usage: Included via parodynews URL routing.
 """
 
 import json
+import logging
 from datetime import datetime
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect, render
 from django.views import View
-from openai import OpenAI
 
 from ..forms import ThreadForm
 from ..mixins import AppConfigClientMixin, ModelFieldsMixin
@@ -33,7 +33,19 @@ from ..models import (
     PostFrontMatter,
     Thread,
 )
-from ..utils import create_run, generate_content_detail, openai_delete_message
+from ..utils import (
+    OpenAIUnavailableError,
+    SchemaValidationError,
+    bulk_delete_threads,
+    collect_openai_usage,
+    create_run,
+    generate_content_detail,
+    get_openai_client,
+    openai_delete_message,
+    sync_thread_messages,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
@@ -54,6 +66,12 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
 
         if thread_id:
             current_thread = Thread.objects.get(pk=thread_id)
+            # Copy only messages added since the last visit; the page still
+            # renders from local rows if OpenAI is unreachable.
+            try:
+                sync_thread_messages(get_openai_client(), current_thread)
+            except Exception as e:
+                logger.warning(f"Could not sync messages of thread {thread_id}: {e}")
             thread_messages = Message.objects.filter(thread_id=thread_id)
             thread_form = ThreadForm(instance=current_thread)
             current_message = None
@@ -72,7 +90,7 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
         fields, display_fields = self.get_model_fields()
 
         message_list = Message.objects.all()
-        assistants = Assistant.objects.all()
+        assistants = Assistant.objects.listing()
 
         context = {
             "message_list": message_list,
@@ -114,10 +132,17 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
 
     def delete_thread(self, request, thread_id=None):
         """Delete a conversation thread and clean up OpenAI resources."""
-        thread = Thread.objects.get(pk=thread_id)
-        thread.delete()
-        client = OpenAI()
-        client.beta.threads.delete(thread_id)
+        try:
+            client = get_openai_client()
+        except Exception as e:
+            messages.error(request, f"Error deleting thread: {e}")
+            return redirect("thread_detail", thread_id=thread_id)
+
+        # The local row is only removed once OpenAI confirms the deletion.
+        (outcome,) = bulk_delete_threads(client, [thread_id])
+        if not outcome.deleted:
+            messages.error(request, f"Error deleting thread: {outcome.error}")
+            return redirect("thread_detail", thread_id=thread_id)
         messages.success(request, "Thread deleted successfully.")
         return redirect("process_content")
 
@@ -139,9 +164,25 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
         message_content = message.contentitem.content_text
         assistant_id = message.assistant_id
 
-        generated_content_detail = json.loads(
-            generate_content_detail(client, message_content)
-        )
+        try:
+            with collect_openai_usage() as usage:
+                generated_content_detail = json.loads(
+                    generate_content_detail(client, message_content)
+                )
+        except SchemaValidationError as e:
+            messages.error(request, f"Generated content was rejected: {e.message}")
+            return redirect(
+                "thread_message_detail",
+                message_id=message_id,
+                thread_id=message.thread_id,
+            )
+        except OpenAIUnavailableError as e:
+            messages.error(request, f"OpenAI is unavailable, try again shortly: {e}")
+            return redirect(
+                "thread_message_detail",
+                message_id=message_id,
+                thread_id=message.thread_id,
+            )
 
         title = (generated_content_detail["Header"]["title"],)
         description = (generated_content_detail["Metadata"]["description"],)
@@ -164,6 +205,7 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
                 Assistant.objects.get(id=assistant_id) if assistant_id else None
             ),
             detail=content_detail_instance,
+            defaults=usage.as_fields(),
         )
 
         content_detail.contentitem.set([contentitem])
@@ -187,8 +229,15 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
             .order_by("position")
         )
 
-        for assistant_id in assistant_ids:
-            run, run_status, run_response = create_run(client, thread_id, assistant_id)
+        try:
+            for assistant_id in assistant_ids:
+                run, run_status, run_response = create_run(
+                    client, thread_id, assistant_id
+                )
+        except OpenAIUnavailableError as e:
+            # Stop the chain instead of waiting on every remaining assistant.
+            messages.error(request, f"OpenAI is unavailable, try again shortly: {e}")
+            return redirect("thread_detail", thread_id=thread.id)
 
         messages.success(request, "Assistant group run successfully.")
         return redirect("thread_detail", thread_id=thread.id)
@@ -203,9 +252,12 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
         message_id = request.POST.get("message_id")
         assistant_id = request.POST.get("assistant_id")
 
-        run, run_status, run_response = create_run(client, thread_id, assistant_id)
-
-        messages.success(request, "Message run successfully.")
+        try:
+            run, run_status, run_response = create_run(client, thread_id, assistant_id)
+        except OpenAIUnavailableError as e:
+            messages.error(request, f"OpenAI is unavailable, try again shortly: {e}")
+        else:
+            messages.success(request, "Message run successfully.")
         return redirect(
             "thread_message_detail", message_id=message_id, thread_id=thread_id
         )
@@ -221,9 +273,21 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
         assistant_id = message.assistant_id
         assistant = Assistant.objects.get(id=assistant_id) if assistant_id else None
 
-        generated_content_detail = json.loads(
-            generate_content_detail(client, message_content)
-        )
+        try:
+            with collect_openai_usage() as usage:
+                generated_content_detail = json.loads(
+                    generate_content_detail(client, message_content)
+                )
+        except SchemaValidationError as e:
+            messages.error(request, f"Generated content was rejected: {e.message}")
+            return redirect(
+                "thread_message_detail", message_id=message_id, thread_id=thread_id
+            )
+        except OpenAIUnavailableError as e:
+            messages.error(request, f"OpenAI is unavailable, try again shortly: {e}")
+            return redirect(
+                "thread_message_detail", message_id=message_id, thread_id=thread_id
+            )
 
         title = (generated_content_detail["Header"]["title"],)
         description = (generated_content_detail["Metadata"]["description"],)
@@ -246,6 +310,7 @@ class ProcessContentView(LoginRequiredMixin, ModelFieldsMixin, View):
                 Assistant.objects.get(id=assistant_id) if assistant_id else None
             ),
             detail=content_detail_instance,
+            defaults=usage.as_fields(),
         )
 
         content_detail.contentitem.set([contentitem])
@@ -299,7 +364,7 @@ class ManageMessageView(LoginRequiredMixin, View):
     def get(self, request, message_id=None):
         """Handle GET requests for message management interface."""
         message_list = Message.objects.all()
-        assistants = Assistant.objects.all()
+        assistants = Assistant.objects.listing()
         current_message = None
 
         if message_id:
@@ -0,0 +1,106 @@
+"""
+File: benchmark_auth_queries.py
+Description: Count session and user queries per authenticated request, before and after caching
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: python scripts/benchmark_auth_queries.py [--requests 20] [--path /posts/]
+
+Runs against a throwaway test database (created and destroyed like the test
+runner does) and compares the previous configuration (db sessions and the
+stock AuthenticationMiddleware) with cached_db sessions plus
+CachedAuthenticationMiddleware.
+"""
+
+import argparse
+import os
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STOCK_MIDDLEWARE = "django.contrib.auth.middleware.AuthenticationMiddleware"
+CACHED_MIDDLEWARE = "parodynews.middleware.CachedAuthenticationMiddleware"
+
+
+def count_queries(client, path, requests):
+    """Return (total queries, auth/session queries) over ``requests`` GETs."""
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    user_table = get_user_model()._meta.db_table
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(requests):
+            client.get(path)
+    auth = [
+        query
+        for query in queries.captured_queries
+        if "django_session" in query["sql"] or f'"{user_table}"' in query["sql"]
+    ]
+    return len(queries), len(auth)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auth query benchmark")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--path", default="/posts/")
+    args = parser.parse_args()
+
+    sys.path.insert(0, SRC_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "barodybroject.settings.testing")
+    import django
+
+    django.setup()
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test import Client, override_settings
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    # A dedicated database, so the test suite's reused one is left alone.
+    connection.settings_dict["TEST"]["NAME"] = "test_auth_query_benchmark"
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        user, _ = get_user_model().objects.get_or_create(username="auth-benchmark")
+        configurations = [
+            (
+                "before (db + AuthenticationMiddleware)",
+                "django.contrib.sessions.backends.db",
+                [
+                    m.replace(CACHED_MIDDLEWARE, STOCK_MIDDLEWARE)
+                    for m in settings.MIDDLEWARE
+                ],
+            ),
+            (
+                "after  (cached_db + CachedAuthenticationMiddleware)",
+                "django.contrib.sessions.backends.cached_db",
+                [
+                    m.replace(STOCK_MIDDLEWARE, CACHED_MIDDLEWARE)
+                    for m in settings.MIDDLEWARE
+                ],
+            ),
+        ]
+        for label, engine, middleware in configurations:
+            with override_settings(SESSION_ENGINE=engine, MIDDLEWARE=middleware):
+                cache.clear()
+                client = Client()
+                client.force_login(user)
+                client.get(args.path)  # Fill the caches once
+                total, auth = count_queries(client, args.path, args.requests)
+            print(
+                f"{label}: {auth / args.requests:.1f} session/user queries and "
+                f"{total / args.requests:.1f} total queries per request"
+            )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+File: benchmark_startup.py
+Description: Measure the import cost of parodynews.utils in fresh interpreters
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: python scripts/benchmark_startup.py [--runs 10] [--settings barodybroject.settings.testing]
+
+Each run starts a new Python process and times django.setup() plus the
+utils import, either as the lazy package ("lazy") or followed by importing
+every utils submodule and loading the schemas, which is what the package
+did eagerly before ("eager"). It also reports whether jsonschema ended up
+imported, which a lazy startup must avoid.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SUBMODULES = [
+    "assistants",
+    "config",
+    "content",
+    "defaults",
+    "dkim_backend",
+    "markdown",
+    "openai_client",
+    "rendering",
+    "schemas",
+    "threads",
+]
+
+SNIPPET = """
+import importlib, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+import parodynews.utils
+if {eager}:
+    for name in {submodules!r}:
+        importlib.import_module("parodynews.utils." + name)
+    # The schemas used to be loaded and resolved at import time as well.
+    importlib.import_module("parodynews.utils.schemas").get_file_schemas()
+print(time.perf_counter() - start, "jsonschema" in sys.modules)
+"""
+
+
+def measure(eager, settings_module):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    code = SNIPPET.format(eager=eager, submodules=SUBMODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    seconds, jsonschema_loaded = result.stdout.strip().splitlines()[-1].split()
+    return float(seconds), jsonschema_loaded == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[3])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--settings", default="barodybroject.settings.testing")
+    args = parser.parse_args()
+
+    for label, eager in (("eager", True), ("lazy", False)):
+        runs = [measure(eager, args.settings) for _ in range(args.runs)]
+        timings = [seconds for seconds, _ in runs]
+        # A "lazy" run that still loads jsonschema is not measuring laziness.
+        loaded = (
+            "yes" if any(jsonschema_loaded for _, jsonschema_loaded in runs) else "no"
+        )
+        print(
+            f"{label:>5}: median {statistics.median(timings) * 1000:.1f} ms, "
+            f"min {min(timings) * 1000:.1f} ms over {args.runs} runs, "
+            f"jsonschema loaded: {loaded}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+File: benchmark_templates.py
+Description: Compare template render time with and without the cached loader
+Author: Barodybroject Team <team@example.com>
+Created: 2026-10-19
+Last Modified: 2026-10-19
+Version: 0.4.0
+
+Dependencies:
+- django: >=5.1
+
+Usage: python scripts/benchmark_templates.py [--runs 200] [template ...]
+
+"uncached" builds a Django template Engine with the project's directories and
+libraries but without the cached loader, so every render re-reads and
+re-parses the template and everything it extends or includes; "cached" uses
+the configured engine after one warm-up render.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TEMPLATES = [
+    "parodynews/content_processing.html",
+    "parodynews/pages_post_detail.html",
+]
+
+
+def uncached_engine(engine):
+    from django.template import Engine
+
+    return Engine(
+        dirs=engine.dirs,
+        loaders=[
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+        libraries=engine.libraries,
+        builtins=engine.builtins[len(Engine.default_builtins) :],
+        debug=engine.debug,
+    )
+
+
+def time_renders(engine, name, runs):
+    from django.template import Context
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        engine.get_template(name).render(Context({}))
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Template render benchmark")
+    parser.add_argument("templates", nargs="*", default=DEFAULT_TEMPLATES)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    sys.path.insert(0, SRC_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "barodybroject.settings.testing")
+    import django
+
+    django.setup()
+    from django.template import engines
+
+    cached = engines["django"].engine
+    uncached = uncached_engine(cached)
+
+    for name in args.templates:
+        cached.get_template(name)  # Warm the cache as gunicorn's warm-up does
+        for label, engine in (("uncached", uncached), ("cached", cached)):
+            timings = time_renders(engine, name, args.runs)
+            print(
+                f"{name} [{label:>8}]: median "
+                f"{statistics.median(timings) * 1000:.2f} ms over {args.runs} runs"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -64,6 +64,7 @@ class InstallationMiddleware(MiddlewareMixin):
         "/health/",
         "/readiness/",
         "/liveness/",
+        "/metrics",
         # Django development server specific
         "/__debug__/",  # Django Debug Toolbar
         "/favicon.ico",